@@ -0,0 +1,246 @@
+"""
+Containers and Access Patterns - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+array_access is O(1): the address of element i is base + i × size. But
+"constant" hides what happens at that address. A CPU keeps recently used
+memory in small, fast caches (L1, then L2, then the last-level cache,
+LLC) and only goes out to main memory (RAM) when it has to. Once the data
+no longer fits in a cache, and the indices jump around so the CPU cannot
+guess what comes next, each access gets slower - same O(1), bigger
+constant.
+
+This module sets up that experiment:
+
+- containers: list (pointers to int objects), array.array and NumPy arrays
+  (raw 8-byte numbers side by side), collections.deque (blocks of 64
+  items, so indexing walks blocks from the nearer end) and a linked list,
+  which has to follow i pointers to reach element i.
+- index streams: sequential (0, 1, 2, ...), strided (every
+  ACCESS_STRIDE-th element) and random.
+- sizes just below each cache level of THIS machine, plus one well past
+  the last level (read from /sys on Linux, typical values otherwise).
+  These assume 8-byte elements; list, deque and the linked list also keep
+  a separate int object per element, so memory_level() says where each
+  container's data really fits.
+"""
+
+import random
+import sys
+from array import array
+from collections import deque
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+ELEMENT_BYTES = 8         # One pointer (list, deque) or one 64-bit number (array, NumPy)
+ACCESS_STRIDE = 16        # 16 × 8 bytes = 128 bytes, a new cache line on every access
+DEFAULT_MAX_ELEMENTS = 4000000  # Largest size we build (a list of ints is ~36 bytes each)
+LINKED_LIST_SIZE_CAP = 200000   # Building millions of nodes takes too long
+CACHE_DIR = "/sys/devices/system/cpu/cpu0/cache"
+DEFAULT_CACHE_SIZES = {'L1': 32 * 1024, 'L2': 1024 * 1024, 'LLC': 32 * 1024 * 1024}
+ACCESS_PATTERNS = ['sequential', 'strided', 'random']
+
+
+class _Node:
+    __slots__ = ('value', 'next')
+
+    def __init__(self, value):
+        self.value = value
+        self.next = None
+
+
+class LinkedList:
+    """
+    Singly linked list that can be indexed like a list.
+
+    Reaching element i means following pointers from the head - O(i). It
+    remembers where the last access ended, so walking forward (sequential
+    or strided indices) only follows the pointers in between.
+    """
+
+    def __init__(self, values=()):
+        self.head = None
+        self.length = 0
+        tail = None
+        for value in values:
+            node = _Node(value)
+            if tail is None:
+                self.head = node
+            else:
+                tail.next = node
+            tail = node
+            self.length += 1
+        self._cursor = self.head
+        self._cursor_index = 0
+
+    def __len__(self):
+        return self.length
+
+    def __getitem__(self, index):
+        if not 0 <= index < self.length:
+            raise IndexError("linked list index out of range")
+        if index < self._cursor_index:
+            self._cursor, self._cursor_index = self.head, 0  # Only forward links
+        node = self._cursor
+        for _ in range(index - self._cursor_index):
+            node = node.next
+        self._cursor, self._cursor_index = node, index
+        return node.value
+
+
+# Container name -> function building it from a list of values
+CONTAINERS = {
+    'list': list,
+    'array': lambda values: array('q', values),
+    'deque': deque,
+    'linked_list': LinkedList,
+}
+
+if NUMPY_AVAILABLE:
+    CONTAINERS['numpy'] = lambda values: np.array(values, dtype=np.int64)
+
+# Containers too slow to build beyond a size -> that size
+CONTAINER_SIZE_CAPS = {'linked_list': LINKED_LIST_SIZE_CAP}
+
+# Container name -> bytes of memory per element. Pointer containers also pay
+# for the int object each pointer leads to.
+_INT_BYTES = sys.getsizeof(1 << 20)
+CONTAINER_ELEMENT_BYTES = {
+    'list': ELEMENT_BYTES + _INT_BYTES,
+    'array': ELEMENT_BYTES,
+    'deque': ELEMENT_BYTES + _INT_BYTES,
+    'linked_list': sys.getsizeof(_Node(0)) + _INT_BYTES,
+    'numpy': ELEMENT_BYTES,
+}
+
+
+def generate_index_stream(pattern, size, count):
+    """
+    Build a list of indices that follows an access pattern.
+
+    Args:
+        pattern (str): 'sequential', 'strided' or 'random'
+        size (int): Number of elements in the container
+        count (int): Number of indices
+
+    Returns:
+        list: Indices, all in range(size)
+    """
+    if pattern == 'sequential':
+        return [i % size for i in range(count)]
+    if pattern == 'strided':
+        # Jump ACCESS_STRIDE elements; each time we wrap around, start one further on
+        indices = []
+        for i in range(count):
+            step = i * ACCESS_STRIDE
+            indices.append((step + step // size) % size)
+        return indices
+    if pattern == 'random':
+        return [random.randrange(size) for _ in range(count)]
+    raise ValueError(f"Unknown access pattern '{pattern}'. "
+                     f"Choose from: {', '.join(ACCESS_PATTERNS)}")
+
+
+def _parse_cache_size(text):
+    """'48K' -> 49152, '2048K' -> 2097152, '32M' -> 33554432."""
+    units = {'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3}
+    text = text.strip().upper()
+    if text and text[-1] in units:
+        return int(text[:-1]) * units[text[-1]]
+    return int(text)
+
+
+def cache_sizes(cache_dir=CACHE_DIR):
+    """
+    Sizes of this machine's data caches in bytes.
+
+    Returns:
+        dict: 'L1', 'L2' and 'LLC' (last level) -> bytes; any level that
+        cannot be read (e.g. not on Linux) uses DEFAULT_CACHE_SIZES
+    """
+    found = {}
+    index = 0
+    try:
+        while True:
+            folder = f"{cache_dir}/index{index}"
+            with open(f"{folder}/type") as f:
+                cache_type = f.read().strip()
+            with open(f"{folder}/level") as f:
+                level = int(f.read())
+            with open(f"{folder}/size") as f:
+                size = _parse_cache_size(f.read())
+            if cache_type != 'Instruction':
+                found[level] = size
+            index += 1
+    except (OSError, ValueError):
+        pass
+
+    sizes = dict(DEFAULT_CACHE_SIZES)
+    if 1 in found:
+        sizes['L1'] = found[1]
+    if 2 in found:
+        sizes['L2'] = found[2]
+    if found and max(found) > 2:
+        sizes['LLC'] = found[max(found)]
+    return sizes
+
+
+def memory_level(container_name, size, caches=None):
+    """
+    Smallest memory level that holds a container of 'size' elements.
+
+    Args:
+        container_name (str): Name from CONTAINERS
+        size (int): Number of elements
+        caches (dict): From cache_sizes() (defaults to this machine's)
+
+    Returns:
+        str: 'L1', 'L2', 'LLC' or 'RAM'
+    """
+    if caches is None:
+        caches = cache_sizes()
+    byte_count = size * CONTAINER_ELEMENT_BYTES.get(container_name, ELEMENT_BYTES)
+    for level in ('L1', 'L2', 'LLC'):
+        if byte_count <= caches[level]:
+            return level
+    return 'RAM'
+
+
+def boundary_sizes(caches=None, max_elements=DEFAULT_MAX_ELEMENTS):
+    """
+    Element counts that fill half of each cache level, plus one for RAM.
+
+    Element counts assume ELEMENT_BYTES per element (true for array.array
+    and NumPy; see memory_level() for the others). The RAM size is 4× the
+    last-level cache, so it cannot fit. Sizes larger than max_elements are
+    capped (a machine with a huge LLC cannot reach RAM that way - the
+    label then says "capped").
+
+    Args:
+        caches (dict): From cache_sizes() (defaults to this machine's)
+        max_elements (int): Largest size returned
+
+    Returns:
+        list: (label, element count) pairs, smallest first
+    """
+    if caches is None:
+        caches = cache_sizes()
+    wanted = [
+        ('L1', caches['L1'] // 2),
+        ('L2', caches['L2'] // 2),
+        ('LLC', caches['LLC'] // 2),
+        ('RAM', caches['LLC'] * 4),
+    ]
+    sizes = []
+    for label, byte_count in wanted:
+        count = byte_count // ELEMENT_BYTES
+        if count > max_elements:
+            label, count = f"{label} (capped)", max_elements
+        if sizes and count <= sizes[-1][1]:
+            continue  # Capping can make two levels the same size
+        sizes.append((label, count))
+    return sizes
@@ -13,8 +13,13 @@ The four problems and their solutions:
 4. Find All Pairs (O(n²)) - Quadratic time
 """
 
+import bisect
 import random
 import time
+from collections import Counter
+from math import comb
+
+from verification import ResultVerifier
 
 
 def array_access(data_list, index):
@@ -91,6 +96,38 @@ def binary_search_iterative(sorted_list, target):
     return -1  # Not found after eliminating all possibilities
 
 
+def binary_search_with_counter(sorted_list, target):
+    """
+    Binary search that also reports how many elements it looked at.
+    
+    Same steps as binary_search_iterative; the count shows that each step
+    halves the search space (at most about log₂(n) + 1 checks).
+    
+    Args:
+        sorted_list (list): A list sorted in ascending order
+        target: The value to search for
+        
+    Returns:
+        tuple: (index if found or -1, number of elements checked)
+    """
+    left = 0
+    right = len(sorted_list) - 1
+    comparisons = 0
+    
+    while left <= right:
+        middle = (left + right) // 2
+        comparisons += 1
+        
+        if sorted_list[middle] == target:
+            return (middle, comparisons)
+        elif sorted_list[middle] > target:
+            right = middle - 1
+        else:
+            left = middle + 1
+    
+    return (-1, comparisons)
+
+
 def linear_search_with_counter(data_list, target):
     """
     PROBLEM: Find if a number exists in an unsorted list.
@@ -162,6 +199,120 @@ def find_all_pairs_with_sum(numbers, target_sum):
     return (pairs, comparisons)
 
 
+def count_pairs_with_sum(numbers, target_sum):
+    """
+    PROBLEM: Count how many pairs of positions hold numbers that add up to a target.
+    
+    ALGORITHM: Count how often each value appears, then combine the counts
+    TIME COMPLEXITY: O(n + k) - Linear time (k = number of distinct values)
+    
+    Why so much faster than find_all_pairs_with_sum?
+    - We never build the pairs themselves - only their number
+    - If value a appears 3 times and value b appears 4 times, there are
+      3 × 4 = 12 pairs (a, b) - one multiplication instead of 12 checks
+    - A value paired with itself (a + a = target) gives c × (c - 1) / 2 pairs
+    - Memory is O(k): one counter per distinct value, not per pair
+    
+    Args:
+        numbers (list): List of numbers to check
+        target_sum: The sum we're looking for
+        
+    Returns:
+        tuple: (number of pairs i < j with numbers[i] + numbers[j] == target_sum,
+                number of operations: n values counted + k distinct values checked)
+        
+    Real-world example: Counting how many pairs of people have ages adding up to 50
+    """
+    counts = Counter(numbers)  # One pass over the n numbers
+    operations = len(numbers)
+    total = 0
+    
+    for value, count in counts.items():
+        operations += 1
+        partner = target_sum - value
+        if partner == value:
+            total += count * (count - 1) // 2
+        elif value < partner:  # Count each pair of different values only once
+            total += count * counts.get(partner, 0)
+    
+    return (total, operations)
+
+
+def count_pairs_by_value(numbers, target_sum):
+    """
+    Count qualifying pairs grouped by the two values involved.
+    
+    Same idea and O(n + k) cost as count_pairs_with_sum, but the result keeps
+    one count per distinct value pair instead of a single total.
+    
+    Args:
+        numbers (list): List of numbers to check
+        target_sum: The sum we're looking for
+        
+    Returns:
+        tuple: (dict mapping (smaller value, larger value) to its number of
+                position pairs, number of operations)
+    """
+    counts = Counter(numbers)
+    operations = len(numbers)
+    groups = {}
+    
+    for value, count in counts.items():
+        operations += 1
+        partner = target_sum - value
+        if partner == value and count > 1:
+            groups[(value, value)] = count * (count - 1) // 2
+        elif value < partner and partner in counts:
+            groups[(value, partner)] = count * counts[partner]
+    
+    return (groups, operations)
+
+
+def count_k_groups_by_value(numbers, k, target_sum):
+    """
+    Count groups of k positions summing to target_sum, grouped by the values involved.
+    
+    Works on the distinct values (sorted) instead of the positions: every
+    non-decreasing choice of k values that hits the target stands for
+    C(count, times used) position groups per value. With d distinct
+    values that is about d^(k-1) steps instead of n^k.
+    
+    Returns:
+        tuple: (dict mapping the sorted value tuple to its number of
+                position groups, number of operations)
+    """
+    counts = Counter(numbers)
+    values = sorted(counts)
+    groups = {}
+    operations = len(numbers)
+    
+    def choose(start, remaining, remaining_sum, chosen):
+        nonlocal operations
+        operations += 1
+        if remaining == 1:
+            # The last value is fixed by the sum - one lookup, no loop
+            if remaining_sum in counts and remaining_sum >= values[start]:
+                group = chosen + (remaining_sum,)
+                ways = 1
+                for value, used in Counter(group).items():
+                    ways *= comb(counts[value], used)  # 0 if a value is used too often
+                if ways:
+                    groups[group] = ways
+            return
+        for index in range(start, len(values)):
+            value = values[index]
+            operations += 1
+            if value * remaining > remaining_sum:
+                break  # Values only get bigger from here
+            if value + values[-1] * (remaining - 1) < remaining_sum:
+                continue  # Even the largest values cannot reach the sum
+            choose(index, remaining - 1, remaining_sum - value, chosen + (value,))
+    
+    if k > 0:
+        choose(0, k, target_sum, ())
+    return (groups, operations)
+
+
 # Helper functions for testing and demonstration
 
 def generate_test_data(size, min_val=1, max_val=1000):
@@ -246,30 +397,55 @@ def demonstrate_complexity_differences():
 # Algorithm validation helpers
 
 def verify_binary_search(sorted_list, target, result):
-    """Verify that binary search returned the correct result."""
+    """Verify that binary search returned the correct result (O(log n))."""
     if result == -1:
-        return target not in sorted_list
+        # The list is sorted, so bisect finds where target would be
+        position = bisect.bisect_left(sorted_list, target)
+        return position == len(sorted_list) or sorted_list[position] != target
     elif 0 <= result < len(sorted_list):
         return sorted_list[result] == target
     else:
         return False
 
 
-def verify_linear_search(data_list, target, result_tuple):
-    """Verify that linear search returned the correct result."""
-    index, comparisons = result_tuple
-    if index == -1:
-        return target not in data_list and comparisons == len(data_list)
-    elif 0 <= index < len(data_list):
-        return data_list[index] == target and comparisons == index + 1
-    else:
-        return False
+def verify_linear_search(data_list, target, result_tuple, verifier=None):
+    """
+    Verify that linear search returned the FIRST position of target.
+    
+    The check is a lookup in a ResultVerifier's first-index table, O(1).
+    Building that table costs O(n), so when checking many answers on the
+    same data, build one ResultVerifier(data_list) and pass it in.
+    """
+    if verifier is None:
+        verifier = ResultVerifier(data_list)
+    return verifier.check_linear_search(target, result_tuple)
 
 
 def verify_pairs(numbers, target_sum, result_tuple):
-    """Verify that all returned pairs actually sum to the target."""
+    """
+    Verify that the returned pairs sum to the target AND that none are
+    missing or extra, by comparing against count_pairs_by_value (O(n + k)).
+    """
     pairs, comparisons = result_tuple
     for pair in pairs:
         if len(pair) != 2 or pair[0] + pair[1] != target_sum:
             return False
-    return True
\ No newline at end of file
+    
+    expected, _ = count_pairs_by_value(numbers, target_sum)
+    found = Counter((min(pair), max(pair)) for pair in pairs)
+    return found == Counter(expected)
+
+
+def verify_k_sums(numbers, k, target_sum, result_tuple):
+    """
+    Verify that every returned group has k numbers summing to the target AND
+    that none are missing or extra, by comparing against count_k_groups_by_value.
+    """
+    groups, comparisons = result_tuple
+    for group in groups:
+        if len(group) != k or sum(group) != target_sum:
+            return False
+    
+    expected, _ = count_k_groups_by_value(numbers, k, target_sum)
+    found = Counter(tuple(sorted(group)) for group in groups)
+    return found == Counter(expected)
@@ -0,0 +1,171 @@
+"""
+Implementation Backends - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+Each problem in algorithms.py can be solved three ways:
+- python: our own loops (the functions in algorithms.py)
+- stdlib: Python's built-in tools, written in C (bisect, list.index,
+          dictionaries of positions)
+- numpy:  whole-array operations (needs NumPy)
+
+Every backend returns exactly the same kind of answer as the pure-Python
+version, so the differential report in reports.py can check that they agree
+before comparing their speed. Small inputs usually favour plain Python
+(no setup cost); large inputs favour the C and NumPy versions.
+
+Each problem entry is:
+    prepare(data) -> the input in the form that backend wants (not timed)
+    run(prepared, target) -> the answer
+"""
+
+import bisect
+import operator
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from algorithms import (
+    array_access, binary_search_iterative, linear_search_with_counter,
+    find_all_pairs_with_sum
+)
+
+
+def _same_data(data):
+    return data
+
+
+def _as_array(data):
+    return np.asarray(data)
+
+
+# --- Binary Search (sorted data) ---
+
+def bisect_search(sorted_list, target):
+    """Binary search with the bisect module; returns the first matching index or -1."""
+    index = bisect.bisect_left(sorted_list, target)
+    if index < len(sorted_list) and sorted_list[index] == target:
+        return index
+    return -1
+
+
+def numpy_binary_search(sorted_array, target):
+    """Binary search with np.searchsorted; returns the first matching index or -1."""
+    index = int(np.searchsorted(sorted_array, target))
+    if index < len(sorted_array) and sorted_array[index] == target:
+        return index
+    return -1
+
+
+# --- Linear Search ---
+
+def index_search(data_list, target):
+    """Linear search with list.index, reporting comparisons like linear_search_with_counter."""
+    try:
+        index = data_list.index(target)
+    except ValueError:
+        return (-1, len(data_list))
+    return (index, index + 1)
+
+
+def numpy_linear_search(data_array, target):
+    """Linear search with one vectorized comparison over the whole array."""
+    matches = np.flatnonzero(data_array == target)
+    if len(matches) == 0:
+        return (-1, len(data_array))
+    index = int(matches[0])
+    return (index, index + 1)
+
+
+# --- Find All Pairs ---
+
+def _positions_by_value(numbers):
+    positions = {}
+    for index, value in enumerate(numbers):
+        positions.setdefault(value, []).append(index)  # Increasing order
+    return (numbers, positions)
+
+
+def indexed_pairs(prepared, target_sum):
+    """
+    Find all pairs with a value -> positions dictionary.
+
+    For each i the partner value is known, so we jump straight to its
+    positions after i instead of checking every j. Pairs come out in the
+    same order as the nested loops; the comparison count reported is the
+    nested loops' n(n-1)/2 so results can be compared directly.
+    """
+    numbers, positions = prepared
+    pairs = []
+    for i, first in enumerate(numbers):
+        partner_positions = positions.get(target_sum - first)
+        if partner_positions:
+            for j in partner_positions[bisect.bisect_right(partner_positions, i):]:
+                pairs.append((first, numbers[j]))
+    n = len(numbers)
+    return (pairs, n * (n - 1) // 2)
+
+
+def numpy_pairs(numbers_array, target_sum):
+    """Find all pairs with one vectorized comparison per row i."""
+    pairs = []
+    n = len(numbers_array)
+    for i in range(n - 1):
+        first = numbers_array[i]
+        for j in np.flatnonzero(numbers_array[i + 1:] == target_sum - first):
+            pairs.append((int(first), int(numbers_array[i + 1 + j])))
+    return (pairs, n * (n - 1) // 2)
+
+
+# --- Array Access ---
+
+def itemgetter_access(data, index):
+    """Array access through operator.itemgetter (C-level indexing)."""
+    return operator.itemgetter(index)(data)
+
+
+def numpy_access(data_array, index):
+    """Array access on a NumPy array, converted back to a Python int."""
+    return data_array[index].item()
+
+
+# Problem -> backend -> (prepare, run)
+BACKENDS = {
+    "Array Access": {
+        'python': (_same_data, array_access),
+        'stdlib': (_same_data, itemgetter_access),
+    },
+    "Binary Search": {
+        'python': (_same_data, binary_search_iterative),
+        'stdlib': (_same_data, bisect_search),
+    },
+    "Linear Search": {
+        'python': (_same_data, linear_search_with_counter),
+        'stdlib': (_same_data, index_search),
+    },
+    "Find All Pairs": {
+        'python': (_same_data, find_all_pairs_with_sum),
+        'stdlib': (_positions_by_value, indexed_pairs),
+    },
+}
+
+if NUMPY_AVAILABLE:
+    BACKENDS["Array Access"]['numpy'] = (_as_array, numpy_access)
+    BACKENDS["Binary Search"]['numpy'] = (_as_array, numpy_binary_search)
+    BACKENDS["Linear Search"]['numpy'] = (_as_array, numpy_linear_search)
+    BACKENDS["Find All Pairs"]['numpy'] = (_as_array, numpy_pairs)
+
+
+def comparable_answer(problem, data, answer):
+    """
+    Turn an answer into something all correct backends agree on.
+
+    binary_search_iterative may return ANY copy of a repeated value while
+    bisect and searchsorted return the first, so binary-search answers are
+    compared by the value found (or -1), not by index.
+    """
+    if problem == "Binary Search":
+        return -1 if answer == -1 else data[answer]
+    return answer
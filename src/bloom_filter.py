@@ -0,0 +1,185 @@
+"""
+Bloom Filter Prefilter - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+When the target is missing, linear search has to look at all n elements
+before it can say so - and in many workloads most queries miss. A Bloom
+filter answers "is this value possibly in the data?" in O(k) time, k being
+a small number of hash functions, using only a few bits per value:
+
+- Adding a value sets k bits, chosen by k hash functions.
+- Checking a value looks at the same k bits. If any of them is 0 the
+  value was DEFINITELY never added, so the scan can be skipped.
+- If all k bits are 1 the value is PROBABLY there. Sometimes the bits were
+  set by other values: a false positive. Then we just do the normal scan,
+  so answers are always correct - false positives only cost time.
+
+For n values and a wanted false-positive rate p, the best sizes are
+    m = -n·ln(p) / ln(2)²  bits      and      k = (m / n)·ln(2)  hashes
+which is about 9.6 bits per value for p = 1%, whatever the values are.
+"""
+
+import math
+
+DEFAULT_FALSE_POSITIVE_RATE = 0.01
+_MASK_64 = (1 << 64) - 1
+
+
+def _mix64(x):
+    """Scramble a 64-bit number (SplitMix64), so nearby values get unrelated bits."""
+    x = (x + 0x9E3779B97F4A7C15) & _MASK_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return x ^ (x >> 31)
+
+
+class BloomFilter:
+    """A compact set that can say "definitely not here" or "probably here"."""
+
+    def __init__(self, expected_items, false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE):
+        """
+        Args:
+            expected_items (int): How many different values will be added
+            false_positive_rate (float): Wanted chance that a missing value
+                is reported as "probably here" (between 0 and 1)
+        """
+        if not 0 < false_positive_rate < 1:
+            raise ValueError("false_positive_rate must be between 0 and 1")
+        expected_items = max(1, expected_items)
+        self.false_positive_rate = false_positive_rate
+        self.bit_count = max(8, math.ceil(-expected_items * math.log(false_positive_rate)
+                                          / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.bit_count / expected_items * math.log(2)))
+        self.bits = bytearray((self.bit_count + 7) // 8)  # 8 bits per byte
+        self.items_added = 0
+
+    @classmethod
+    def from_values(cls, values, false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE):
+        """Build a filter sized for the distinct values in 'values' and add them all."""
+        distinct = set(values)
+        bloom = cls(len(distinct), false_positive_rate)
+        for value in distinct:
+            bloom.add(value)
+        return bloom
+
+    def _hashes(self, value):
+        """Two independent 32-bit hashes of value; bit i is (h1 + i·h2) mod m."""
+        mixed = _mix64(hash(value) & _MASK_64)
+        return (mixed & 0xFFFFFFFF, (mixed >> 32) | 1)  # h2 odd, so positions differ
+
+    def add(self, value):
+        """Set the value's k bits."""
+        h1, h2 = self._hashes(value)
+        bits = self.bits
+        bit_count = self.bit_count
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % bit_count
+            bits[position >> 3] |= 1 << (position & 7)
+        self.items_added += 1
+
+    def __contains__(self, value):
+        """False = definitely never added; True = probably added."""
+        h1, h2 = self._hashes(value)
+        bits = self.bits
+        bit_count = self.bit_count
+        for i in range(self.hash_count):
+            position = (h1 + i * h2) % bit_count
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False  # One clear bit is enough to rule it out
+        return True
+
+    def nbytes(self):
+        """Bytes used by the bit array."""
+        return len(self.bits)
+
+    def expected_false_positive_rate(self):
+        """False-positive rate predicted from how full the filter actually is."""
+        filled = sum(bin(byte).count("1") for byte in self.bits) / self.bit_count
+        return filled ** self.hash_count
+
+
+class PrefilteredSearch:
+    """
+    Opt-in Bloom filter in front of a search function.
+
+    Example:
+        data = generate_test_data(100000)
+        search = PrefilteredSearch(linear_search_with_counter, data)
+        search(5000)   # filter says "definitely not here" -> (-1, 0), no scan
+        search(data[10])  # filter says "probably" -> normal linear search
+
+    The false-positive count assumes search_func is an exact membership
+    search: it returns -1 only when the target really is not in the data.
+    Every "probably" that the search then reports as not found is counted as
+    a false positive, so a search that can miss present values (or answers
+    "not found" some other way) would make the filter look worse than it is.
+    """
+
+    def __init__(self, search_func, data, false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE,
+                 miss_result=(-1, 0)):
+        """
+        Args:
+            search_func: Function called as search_func(data, target)
+            data: The list to search. The filter is rebuilt when a
+                VersionedList changes; a plain list is assumed never to
+                change (call rebuild() yourself if it does)
+            false_positive_rate (float): Passed on to BloomFilter
+            miss_result: Returned for definite misses. The default
+                (-1, 0) means "not found, 0 comparisons" for
+                linear_search_with_counter; use -1 for binary_search_iterative
+        """
+        self.search_func = search_func
+        self.data = data
+        self.false_positive_rate = false_positive_rate
+        self.miss_result = miss_result
+        self.filtered = 0         # Answered by the filter alone
+        self.passed = 0           # Handed on to the search
+        self.false_positives = 0  # Handed on, but the (exact) search found nothing
+        self.rebuild()
+
+    def _data_version(self):
+        return getattr(self.data, 'version', None)
+
+    def rebuild(self):
+        """Build the filter again from the current data (O(n))."""
+        self.bloom = BloomFilter.from_values(self.data, self.false_positive_rate)
+        self.version = self._data_version()
+
+    def __call__(self, target):
+        """Search for target, skipping the search when the filter rules it out."""
+        if self._data_version() != self.version:
+            self.rebuild()
+
+        if target not in self.bloom:
+            self.filtered += 1
+            return self.miss_result
+
+        self.passed += 1
+        result = self.search_func(self.data, target)
+        index = result[0] if isinstance(result, tuple) else result
+        if index == -1:
+            self.false_positives += 1
+        return result
+
+    def stats(self):
+        """
+        Summarize how well the filter worked.
+
+        Returns:
+            dict: filtered, passed, false_positives, observed false-positive
+            rate (false positives / all misses, taking search_func's "not
+            found" as the truth), expected rate, bytes and bits per value of
+            the filter
+        """
+        misses = self.filtered + self.false_positives
+        distinct = max(1, self.bloom.items_added)
+        return {
+            'filtered': self.filtered,
+            'passed': self.passed,
+            'false_positives': self.false_positives,
+            'false_positive_rate': self.false_positives / misses if misses else 0.0,
+            'expected_false_positive_rate': self.bloom.expected_false_positive_rate(),
+            'nbytes': self.bloom.nbytes(),
+            'bits_per_value': self.bloom.bit_count / distinct,
+            'hash_count': self.bloom.hash_count
+        }
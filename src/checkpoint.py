@@ -0,0 +1,132 @@
+"""
+Checkpoint Module for Long Benchmark Sweeps - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+Large sweeps can run for hours, and pressing Ctrl+C used to throw all of the
+work away. This module saves every finished (algorithm, size, trial) cell and
+the state of the random number generator to a small JSON file, so that an
+interrupted sweep can pick up exactly where it stopped.
+
+Because the random state is saved after every cell, a resumed run generates
+exactly the same test data as an uninterrupted run would have.
+"""
+
+import json
+import os
+import random
+
+from reproducibility import get_run_seed, set_run_seed
+
+CHECKPOINT_VERSION = 1
+DEFAULT_CHECKPOINT_FILE = "benchmark_checkpoint.json"
+
+
+def cell_key(algorithm_name, size, trial):
+    """Build the dictionary key used to store one (algorithm, size, trial) cell."""
+    return f"{algorithm_name}|{size}|{trial}"
+
+
+def new_checkpoint():
+    """Create an empty checkpoint with no finished cells."""
+    return {
+        'version': CHECKPOINT_VERSION,
+        'cells': {},
+        'rng_state': None,
+        'run_seed': None
+    }
+
+
+def load_checkpoint(filename=DEFAULT_CHECKPOINT_FILE):
+    """
+    Load a checkpoint from disk.
+
+    Args:
+        filename (str): Path of the checkpoint file
+
+    Returns:
+        dict: The saved checkpoint, or a new empty one if the file is missing
+    """
+    if not os.path.exists(filename):
+        return new_checkpoint()
+
+    with open(filename, 'r') as f:
+        checkpoint = json.load(f)
+
+    if checkpoint.get('version') != CHECKPOINT_VERSION:
+        raise ValueError(f"Unsupported checkpoint version in '{filename}'")
+    return checkpoint
+
+
+def resume_checkpoint(filename=DEFAULT_CHECKPOINT_FILE):
+    """
+    Load a checkpoint and rewind the random generator to where the sweep stopped.
+
+    Skipped cells never touch the random generator, so restoring the state
+    saved after the last finished cell means the next unfinished cell sees
+    exactly the same random numbers it would have seen without the interrupt.
+
+    Args:
+        filename (str): Path of the checkpoint file
+
+    Returns:
+        dict: The loaded checkpoint
+    """
+    checkpoint = load_checkpoint(filename)
+    if checkpoint.get('run_seed') is not None:
+        set_run_seed(checkpoint['run_seed'])  # Seeded runs re-seed every trial
+    if checkpoint['rng_state'] is not None:
+        restore_rng_state(checkpoint['rng_state'])
+    return checkpoint
+
+
+def save_checkpoint(checkpoint, filename=DEFAULT_CHECKPOINT_FILE):
+    """
+    Save a checkpoint to disk.
+
+    The file is written to a temporary name first and then renamed, so an
+    interrupt in the middle of writing never leaves a half-written checkpoint.
+
+    Args:
+        checkpoint (dict): Checkpoint to save
+        filename (str): Path of the checkpoint file
+    """
+    temp_filename = filename + ".tmp"
+    with open(temp_filename, 'w') as f:
+        json.dump(checkpoint, f)
+    os.replace(temp_filename, filename)
+
+
+def record_cell(checkpoint, algorithm_name, size, trial, execution_time, operation_count):
+    """Store a finished cell together with the random state right after it."""
+    checkpoint['cells'][cell_key(algorithm_name, size, trial)] = [execution_time, operation_count]
+    checkpoint['rng_state'] = capture_rng_state()
+    checkpoint['run_seed'] = get_run_seed()
+
+
+def get_cell(checkpoint, algorithm_name, size, trial):
+    """
+    Look up a finished cell.
+
+    Returns:
+        tuple: (execution_time, operation_count), or None if the cell has not run yet
+    """
+    cell = checkpoint['cells'].get(cell_key(algorithm_name, size, trial))
+    return tuple(cell) if cell is not None else None
+
+
+def capture_rng_state():
+    """Convert the state of the global random generator into JSON-friendly lists."""
+    version, internal_state, gauss_next = random.getstate()
+    return [version, list(internal_state), gauss_next]
+
+
+def restore_rng_state(saved_state):
+    """Put the global random generator back into a state saved by capture_rng_state."""
+    version, internal_state, gauss_next = saved_state
+    random.setstate((version, tuple(internal_state), gauss_next))
+
+
+def remove_checkpoint(filename=DEFAULT_CHECKPOINT_FILE):
+    """Delete a checkpoint file once a sweep has finished."""
+    if os.path.exists(filename):
+        os.remove(filename)
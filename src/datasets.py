@@ -0,0 +1,210 @@
+"""
+Memory-Mapped Datasets - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+A Python list of ints costs about 36 bytes per element (an 8-byte pointer plus
+a 28-byte int object), so 10^8 numbers need several gigabytes of RAM. This
+module stores test data on disk as plain 4- or 8-byte integers instead and
+opens it with mmap: the operating system loads pages only when they are
+touched, so inputs far larger than memory can still be searched.
+
+File formats:
+- ".npy" files: NumPy's own format (needs NumPy)
+- any other name: a raw format - a 32-byte header followed by the integers
+
+Raw header layout (little-endian):
+    bytes 0-7    magic b"ACT06DS\\0"
+    bytes 8-11   format version (uint32)
+    bytes 12-15  element type code: b"i4\\0\\0" or b"i8\\0\\0"
+    bytes 16-23  number of elements (uint64)
+    bytes 24-31  reserved (zero)
+
+Opened datasets support len() and indexing like a list, so the functions in
+algorithms.py accept them directly without copying.
+"""
+
+import mmap
+import random
+import struct
+import sys
+from array import array
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+MAGIC = b"ACT06DS\0"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<8sI4sQ8x")
+HEADER_SIZE = HEADER.size  # 32 bytes, so the data stays 8-byte aligned
+
+# Element type -> (header code, array/memoryview typecode, NumPy dtype name)
+ELEMENT_TYPES = {
+    'int32': (b"i4\0\0", 'i', '<i4'),
+    'int64': (b"i8\0\0", 'q', '<i8'),
+}
+
+DEFAULT_CHUNK_SIZE = 1 << 20  # Elements generated and written at a time
+
+
+def write_dataset(filename, size, min_val=1, max_val=1000, sorted_order=False,
+                  dtype='int32', chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Generate random test data straight to a file, one chunk at a time.
+
+    Only one chunk is ever held in memory, so the file can be much larger
+    than RAM. Sorted data is produced without sorting: we first count how
+    many times each value should appear, then write the values in order.
+
+    Args:
+        filename (str): Output path (".npy" for NumPy format, anything else for raw)
+        size (int): Number of elements
+        min_val (int): Smallest possible value
+        max_val (int): Largest possible value
+        sorted_order (bool): Write the values in ascending order
+        dtype (str): 'int32' or 'int64'
+        chunk_size (int): Number of elements generated per chunk
+
+    Returns:
+        str: The filename that was written
+    """
+    if dtype not in ELEMENT_TYPES:
+        raise ValueError(f"dtype must be one of {sorted(ELEMENT_TYPES)}")
+    code, typecode, numpy_dtype = ELEMENT_TYPES[dtype]
+
+    if filename.endswith('.npy'):
+        if not NUMPY_AVAILABLE:
+            raise ImportError(".npy datasets need NumPy. Install with: uv add numpy")
+        output = np.lib.format.open_memmap(filename, mode='w+', dtype=numpy_dtype, shape=(size,))
+        position = 0
+        for chunk in _generate_chunks(size, min_val, max_val, sorted_order, chunk_size):
+            output[position:position + len(chunk)] = chunk
+            position += len(chunk)
+        output.flush()
+        del output
+        return filename
+
+    with open(filename, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, code, size))
+        for chunk in _generate_chunks(size, min_val, max_val, sorted_order, chunk_size):
+            if NUMPY_AVAILABLE:
+                f.write(np.asarray(chunk, dtype=numpy_dtype).tobytes())
+            else:
+                values = array(typecode, chunk)
+                if sys.byteorder != 'little':
+                    values.byteswap()
+                f.write(values.tobytes())
+    return filename
+
+
+def _generate_chunks(size, min_val, max_val, sorted_order, chunk_size):
+    """Yield the dataset's values in chunks of at most chunk_size elements."""
+    if sorted_order:
+        yield from _generate_sorted_chunks(size, min_val, max_val, chunk_size)
+        return
+
+    if NUMPY_AVAILABLE:
+        rng = np.random.default_rng(random.getrandbits(32))
+    for start in range(0, size, chunk_size):
+        count = min(chunk_size, size - start)
+        if NUMPY_AVAILABLE:
+            yield rng.integers(min_val, max_val + 1, size=count)
+        else:
+            yield [random.randint(min_val, max_val) for _ in range(count)]
+
+
+def _generate_sorted_chunks(size, min_val, max_val, chunk_size):
+    """Yield sorted values in chunks by drawing how often each value appears."""
+    value_count = max_val - min_val + 1
+    if NUMPY_AVAILABLE:
+        rng = np.random.default_rng(random.getrandbits(32))
+        occurrences = rng.multinomial(size, [1 / value_count] * value_count)
+        # Position p holds the first value whose running total passes p
+        running_total = np.cumsum(occurrences)
+        for start in range(0, size, chunk_size):
+            positions = np.arange(start, min(start + chunk_size, size))
+            yield min_val + np.searchsorted(running_total, positions, side='right')
+        return
+
+    occurrences = [0] * value_count
+    for _ in range(size):
+        occurrences[random.randint(0, value_count - 1)] += 1
+
+    chunk = []
+    for offset, count in enumerate(occurrences):
+        value = min_val + offset
+        while count > 0:
+            take = min(count, chunk_size - len(chunk))
+            chunk.extend([value] * take)
+            count -= take
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+    if chunk:
+        yield chunk
+
+
+def read_header(filename):
+    """
+    Read the header of a raw dataset file.
+
+    Returns:
+        dict: 'dtype' ('int32' or 'int64') and 'size' (number of elements)
+    """
+    with open(filename, 'rb') as f:
+        raw = f.read(HEADER_SIZE)
+    if len(raw) < HEADER_SIZE:
+        raise ValueError(f"'{filename}' is too short to be a dataset file")
+
+    magic, version, code, size = HEADER.unpack(raw)
+    if magic != MAGIC:
+        raise ValueError(f"'{filename}' is not an Activity 06 dataset file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported dataset version {version} in '{filename}'")
+    for dtype, (type_code, _, _) in ELEMENT_TYPES.items():
+        if type_code == code:
+            return {'dtype': dtype, 'size': size}
+    raise ValueError(f"Unknown element type {code!r} in '{filename}'")
+
+
+def open_dataset(filename, use_numpy=None):
+    """
+    Open a dataset file read-only, without copying it into memory.
+
+    Args:
+        filename (str): Path written by write_dataset
+        use_numpy (bool): Return a NumPy memmap (True) or a memoryview (False).
+            Defaults to NumPy when it is installed. ".npy" files always use NumPy.
+
+    Returns:
+        A read-only sequence of ints backed directly by the file
+    """
+    if use_numpy is None:
+        use_numpy = NUMPY_AVAILABLE
+
+    if filename.endswith('.npy'):
+        if not NUMPY_AVAILABLE:
+            raise ImportError(".npy datasets need NumPy. Install with: uv add numpy")
+        return np.load(filename, mmap_mode='r')
+
+    info = read_header(filename)
+    _, typecode, numpy_dtype = ELEMENT_TYPES[info['dtype']]
+    data_bytes = info['size'] * array(typecode).itemsize
+
+    if use_numpy:
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is not installed")
+        if info['size'] == 0:
+            return np.empty(0, dtype=numpy_dtype)  # mmap cannot map zero bytes
+        return np.memmap(filename, dtype=numpy_dtype, mode='r',
+                         offset=HEADER_SIZE, shape=(info['size'],))
+
+    if sys.byteorder != 'little':
+        raise OSError("memoryview datasets need a little-endian machine; use NumPy instead")
+    with open(filename, 'rb') as f:
+        if info['size'] == 0:
+            return memoryview(b"").cast(typecode)
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return memoryview(mapped)[HEADER_SIZE:HEADER_SIZE + data_bytes].cast(typecode)
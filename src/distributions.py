@@ -0,0 +1,163 @@
+"""
+Input Distributions - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+generate_test_data always makes uniform random numbers, but real data is
+rarely like that: lists arrive already sorted, a few values repeat a lot,
+or the thing we search for is not there at all. The same algorithm can
+behave very differently on each shape, so this module generates them all:
+
+- uniform:          every value in min_val..max_val equally likely
+- sorted:           uniform values in ascending order
+- reverse:          uniform values in descending order
+- nearly_sorted:    sorted, then 1% of the positions swapped at random
+- heavy_duplicates: only 10 different values, each repeated many times
+- all_distinct:     no value appears twice
+- zipf:             a few small values are very common (Zipf's law)
+- adversarial:      uniform values, but every target is chosen to be absent,
+                    so searches never stop early (the worst case)
+
+Every generator draws from the global 'random' module, so random.seed()
+makes the data reproducible. NumPy is used for speed when it is installed.
+"""
+
+import random
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DEFAULT_DISTRIBUTION = 'uniform'
+NEARLY_SORTED_SWAP_FRACTION = 0.01
+DUPLICATE_VALUE_COUNT = 10
+ZIPF_SKEW = 1.2
+ABSENT_TARGET_DISTRIBUTIONS = {'adversarial'}
+
+
+def _rng():
+    """A NumPy generator seeded from the global random module."""
+    return np.random.default_rng(random.getrandbits(32))
+
+
+def _uniform(size, min_val, max_val):
+    if NUMPY_AVAILABLE:
+        return _rng().integers(min_val, max_val + 1, size=size).tolist()
+    return [random.randint(min_val, max_val) for _ in range(size)]
+
+
+def _sorted(size, min_val, max_val):
+    return sorted(_uniform(size, min_val, max_val))
+
+
+def _reverse(size, min_val, max_val):
+    return sorted(_uniform(size, min_val, max_val), reverse=True)
+
+
+def _nearly_sorted(size, min_val, max_val):
+    data = _sorted(size, min_val, max_val)
+    swaps = int(size * NEARLY_SORTED_SWAP_FRACTION)
+    if size < 2 or swaps == 0:
+        return data
+
+    if NUMPY_AVAILABLE:
+        positions = _rng().integers(0, size, size=(swaps, 2)).tolist()
+    else:
+        positions = [(random.randrange(size), random.randrange(size)) for _ in range(swaps)]
+    for i, j in positions:
+        data[i], data[j] = data[j], data[i]
+    return data
+
+
+def _heavy_duplicates(size, min_val, max_val):
+    # Spread the few allowed values evenly across the range
+    span = max_val - min_val + 1
+    value_count = min(DUPLICATE_VALUE_COUNT, span)
+    allowed = [min_val + (span * i) // value_count for i in range(value_count)]
+    if NUMPY_AVAILABLE:
+        return np.asarray(allowed)[_rng().integers(0, value_count, size=size)].tolist()
+    return [random.choice(allowed) for _ in range(size)]
+
+
+def _all_distinct(size, min_val, max_val):
+    # If there are more elements than values, the range grows past max_val
+    span = max(max_val - min_val + 1, size)
+    if NUMPY_AVAILABLE:
+        return (min_val + _rng().choice(span, size=size, replace=False)).tolist()
+    return random.sample(range(min_val, min_val + span), size)
+
+
+def _zipf(size, min_val, max_val):
+    # Value min_val + r - 1 has weight 1 / r^skew, so min_val is the most common
+    span = max_val - min_val + 1
+    weights = [1 / rank ** ZIPF_SKEW for rank in range(1, span + 1)]
+    if NUMPY_AVAILABLE:
+        probabilities = np.asarray(weights) / sum(weights)
+        return (min_val + _rng().choice(span, size=size, p=probabilities)).tolist()
+    return random.choices(range(min_val, max_val + 1), weights=weights, k=size)
+
+
+DISTRIBUTIONS = {
+    'uniform': _uniform,
+    'sorted': _sorted,
+    'reverse': _reverse,
+    'nearly_sorted': _nearly_sorted,
+    'heavy_duplicates': _heavy_duplicates,
+    'all_distinct': _all_distinct,
+    'zipf': _zipf,
+    'adversarial': _uniform,
+}
+
+
+def generate_distribution(distribution, size, min_val=1, max_val=1000):
+    """
+    Generate test data with the given shape.
+
+    Args:
+        distribution (str): One of the names in DISTRIBUTIONS
+        size (int): Number of elements
+        min_val (int): Smallest value
+        max_val (int): Largest value (all_distinct may exceed it, see above)
+
+    Returns:
+        list: The generated numbers
+    """
+    if distribution not in DISTRIBUTIONS:
+        raise ValueError(f"Unknown distribution '{distribution}'. "
+                         f"Choose from: {', '.join(DISTRIBUTIONS)}")
+    return DISTRIBUTIONS[distribution](size, min_val, max_val)
+
+
+def pick_target(data, distribution, position):
+    """
+    Choose a search target: data[position], or a missing value for adversarial inputs.
+
+    Args:
+        data (list): The data that will be searched
+        distribution (str): The distribution the data came from
+        position (int): Index of the element to search for normally
+
+    Returns:
+        The target value
+    """
+    if distribution in ABSENT_TARGET_DISTRIBUTIONS or not data:
+        return max(data, default=0) + 1  # Bigger than everything, so never found
+    return data[position]
+
+
+def pick_target_sum(data, k, distribution):
+    """
+    Choose a target sum: the first k values added up, or an impossible sum.
+
+    Args:
+        data (list): The data that will be searched
+        k (int): How many numbers make up a group (2 for pairs)
+        distribution (str): The distribution the data came from
+
+    Returns:
+        int: The target sum
+    """
+    if distribution in ABSENT_TARGET_DISTRIBUTIONS or len(data) < k:
+        return k * max(data, default=0) + 1  # No group of k values can reach it
+    return sum(data[:k])
@@ -0,0 +1,119 @@
+"""
+Cache-Friendly Search Layout - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+Binary search on a huge sorted array jumps all over memory: the first few
+probes land far apart, so once the array is bigger than the CPU cache almost
+every probe is a slow trip to main memory.
+
+The Eytzinger layout (named after a 16th-century genealogist) stores the same
+sorted values in "breadth-first" order, like a binary heap:
+- position 1 holds the root (the middle value)
+- the children of position k are at positions 2k and 2k + 1
+
+The first levels of the search tree are then packed together at the front of
+the array, where they stay in cache, and each step moves to a nearby slot.
+Searching is still O(log n) - only the memory layout changes.
+
+This module needs NumPy. Answers use the same index semantics as
+binary_search_iterative on the original sorted list: the index of the first
+copy of the target, or -1 if the target is not present.
+"""
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class EytzingerIndex:
+    """
+    A read-only search structure built from sorted data in Eytzinger order.
+
+    Attributes:
+        size (int): Number of values stored
+        layout: NumPy array of the values in breadth-first order (slot 0 unused)
+        sorted_index: NumPy array mapping each layout slot back to its index
+            in the original sorted data (slot 0 holds -1 for "not found")
+    """
+
+    def __init__(self, sorted_data):
+        """
+        Build the layout from data that is already sorted in ascending order.
+
+        Args:
+            sorted_data: A sorted list or 1-D NumPy array
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("EytzingerIndex needs NumPy. Install with: uv add numpy")
+
+        values = np.asarray(sorted_data)
+        n = len(values)
+        self.size = n
+        self.depth = int(n).bit_length()  # Levels in the tree (0 when empty)
+
+        index_dtype = np.int32 if n < 2**31 - 1 else np.int64
+        self.layout = np.empty(n + 1, dtype=values.dtype)
+        self.sorted_index = np.empty(n + 1, dtype=index_dtype)
+        self.sorted_index[0] = -1
+        if n == 0:
+            return
+
+        # Picture a perfect tree with this many levels. The j-th node on level
+        # d would be at in-order position p = (2j + 1) * 2^(depth - 1 - d),
+        # counting from 1. Our tree is only missing leaves at the right end of
+        # the bottom level (leaf j sits at position 2j + 1), so a node's index
+        # in the sorted data is p - 1 minus the missing leaves to its left.
+        # Each level is a contiguous slice, so this is one NumPy step per level.
+        leaves_present = n - ((1 << (self.depth - 1)) - 1)
+        for level in range(self.depth):
+            start = 1 << level
+            stop = min(2 * start, n + 1)
+            j = np.arange(stop - start, dtype=np.int64)
+            position = (2 * j + 1) << (self.depth - 1 - level)
+            rank = position - 1 - np.maximum(0, position // 2 - leaves_present)
+            self.layout[start:stop] = values[rank]
+            self.sorted_index[start:stop] = rank
+
+    def __len__(self):
+        return self.size
+
+    def search_batch(self, targets):
+        """
+        Look up many targets at once.
+
+        Every target walks down the tree at the same time: one vectorized step
+        per level, with no branches - each step just picks child 2k or 2k + 1.
+
+        Args:
+            targets: List or NumPy array of values to find
+
+        Returns:
+            NumPy array: For each target, the index of its first copy in the
+            original sorted data, or -1 if it is not present
+        """
+        targets = np.asarray(targets)
+        if self.size == 0:
+            return np.full(len(targets), -1, dtype=np.int64)
+
+        layout = self.layout
+        n = self.size
+        k = np.ones(len(targets), dtype=np.int64)
+
+        for _ in range(self.depth):
+            active = k <= n
+            probe = layout[np.where(active, k, 1)]
+            k = np.where(active, 2 * k + (probe < targets), k)
+
+        # Walking down ended one level below the answer. Undo the trailing
+        # "went right" steps plus one more step to land on the lower bound.
+        lowest_zero_bit = (k + 1) & ~k
+        k = k // (2 * lowest_zero_bit)
+
+        found = (k != 0) & (layout[k] == targets)
+        return np.where(found, self.sorted_index[k], -1)
+
+    def search(self, target):
+        """Look up a single target (same result as search_batch for one value)."""
+        return int(self.search_batch([target])[0])
@@ -0,0 +1,159 @@
+"""
+Generalized k-Sum Search - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+find_all_pairs_with_sum finds pairs; this module finds groups of k numbers
+(triples, quadruples, ...) that add up to a target.
+
+The brute-force reference checks every group of k positions, which is
+O(n^k): O(n³) for triples and O(n⁴) for quadruples. Two faster engines do
+better by remembering what they have already seen in a dictionary:
+- 3-sum with a hash index: for every pair, look up the missing third
+  value directly instead of looping over it - O(n²) lookups
+- 4-sum meet-in-the-middle: store the sums of all "left" pairs, then for
+  every "right" pair look up the missing sum - O(n²) pairs on each side
+
+All engines follow the same rules as find_all_pairs_with_sum:
+- a group is a set of k different positions i < j < ... (so equal values
+  at different positions count as different groups)
+- each group is reported as a tuple of values in position order
+- groups are listed in the order the nested loops would find them
+- the second return value counts the basic steps (comparisons or lookups)
+"""
+
+import bisect
+from itertools import combinations
+
+
+def find_all_k_sums_brute_force(numbers, k, target_sum):
+    """
+    Check every group of k positions - the reference answer.
+
+    TIME COMPLEXITY: O(n^k)
+
+    Returns:
+        tuple: (list of k-tuples that sum to target, number of groups checked)
+    """
+    groups = []
+    comparisons = 0
+
+    for positions in combinations(range(len(numbers)), k):
+        comparisons += 1
+        values = tuple(numbers[p] for p in positions)
+        if sum(values) == target_sum:
+            groups.append(values)
+
+    return (groups, comparisons)
+
+
+def find_all_triples_hash(numbers, target_sum):
+    """
+    Find all triples using a value -> positions index.
+
+    For each pair of positions i < j we know exactly which third value is
+    needed, so we look up where that value appears after j instead of
+    looping over every k.
+
+    TIME COMPLEXITY: O(n²) lookups (plus the size of the answer)
+
+    Returns:
+        tuple: (list of triples that sum to target, number of lookups)
+    """
+    positions_of = {}
+    for index, value in enumerate(numbers):
+        positions_of.setdefault(value, []).append(index)  # Built in increasing order
+
+    triples = []
+    lookups = 0
+    n = len(numbers)
+
+    for i in range(n):
+        for j in range(i + 1, n):
+            lookups += 1
+            needed = target_sum - numbers[i] - numbers[j]
+            positions = positions_of.get(needed)
+            if positions is None:
+                continue
+            # Only positions after j are allowed, so groups are never repeated
+            for k in positions[bisect.bisect_right(positions, j):]:
+                triples.append((numbers[i], numbers[j], numbers[k]))
+
+    return (triples, lookups)
+
+
+def find_all_quadruples_meet_in_middle(numbers, target_sum):
+    """
+    Find all quadruples by meeting in the middle.
+
+    A quadruple i < j < k < l is a "left" pair (i, j) plus a "right" pair
+    (k, l). Walking k from left to right, we add every left pair ending just
+    before k to a dictionary keyed by its sum; then each right pair starting
+    at k only needs one dictionary lookup for the missing sum.
+
+    TIME COMPLEXITY: O(n²) pairs stored and looked up (plus the size of the answer)
+
+    Returns:
+        tuple: (list of quadruples that sum to target, number of lookups)
+    """
+    left_pairs_by_sum = {}
+    found_positions = []
+    lookups = 0
+    n = len(numbers)
+
+    for k in range(n):
+        # Every left pair (i, k - 1) becomes available once k moves past it
+        j = k - 1
+        for i in range(j):
+            left_pairs_by_sum.setdefault(numbers[i] + numbers[j], []).append((i, j))
+
+        for m in range(k + 1, n):
+            lookups += 1
+            needed = target_sum - numbers[k] - numbers[m]
+            for i, j in left_pairs_by_sum.get(needed, ()):
+                found_positions.append((i, j, k, m))
+
+    # Report the groups in the same order as the brute-force loops would
+    found_positions.sort()
+    quadruples = [tuple(numbers[p] for p in group) for group in found_positions]
+    return (quadruples, lookups)
+
+
+K_SUM_ENGINES = {
+    'brute': lambda numbers, k, target_sum: find_all_k_sums_brute_force(numbers, k, target_sum),
+    'hash': lambda numbers, k, target_sum: find_all_triples_hash(numbers, target_sum),
+    'meet': lambda numbers, k, target_sum: find_all_quadruples_meet_in_middle(numbers, target_sum),
+}
+
+ENGINE_GROUP_SIZES = {
+    'hash': 3,
+    'meet': 4,
+}
+
+
+def find_all_k_sums(numbers, k, target_sum, engine='auto'):
+    """
+    Find all groups of k numbers (at different positions) that add up to target_sum.
+
+    Args:
+        numbers (list): List of numbers to check
+        k (int): Group size (2 for pairs, 3 for triples, 4 for quadruples, ...)
+        target_sum: The sum we're looking for
+        engine (str): 'brute', 'hash' (k = 3 only), 'meet' (k = 4 only), or
+            'auto' to pick the fastest engine available for k
+
+    Returns:
+        tuple: (list of k-tuples that sum to target, number of steps taken)
+
+    Real-world example: Finding three items whose prices add up to a gift card balance
+    """
+    if k < 1:
+        raise ValueError("k must be at least 1")
+
+    if engine == 'auto':
+        engine = {3: 'hash', 4: 'meet'}.get(k, 'brute')
+    if engine not in K_SUM_ENGINES:
+        raise ValueError(f"Unknown k-sum engine '{engine}'")
+    if engine in ENGINE_GROUP_SIZES and ENGINE_GROUP_SIZES[engine] != k:
+        raise ValueError(f"The '{engine}' engine only handles k = {ENGINE_GROUP_SIZES[engine]}")
+
+    return K_SUM_ENGINES[engine](numbers, k, target_sum)
@@ -7,10 +7,42 @@ This follows the "Build a Better Algorithm" approach where students explore diff
 algorithmic solutions and reason about their efficiency.
 """
 
+import argparse
+import os
+
 from timer import (
     run_algorithm_experiment, print_algorithm_results, 
     create_comparison_plot, save_results_to_file, get_input_sizes
 )
+from distributions import DISTRIBUTIONS, DEFAULT_DISTRIBUTION
+from reproducibility import set_run_seed, pin_to_cpus
+from checkpoint import (
+    new_checkpoint, resume_checkpoint, remove_checkpoint, DEFAULT_CHECKPOINT_FILE
+)
+
+# Comparison reports (reports.py): (description, function name, arguments).
+# The sizes keep each report to roughly a minute or less.
+REPORTS = [
+    ("Linear search on each data distribution", "run_distribution_comparison",
+     ("Linear Search", [1000, 10000, 100000])),
+    ("Linear search on each query workload", "run_query_workload_comparison",
+     ("Linear Search", [1000, 10000])),
+    ("Binary search on memory-mapped datasets", "run_dataset_experiment",
+     ("Binary Search", [10000, 100000, 1000000])),
+    ("Parallel linear search (threads)", "run_parallel_scan_comparison", (1000000,)),
+    ("Parallel pair search (processes)", "run_parallel_pairs_comparison", (2000,)),
+    ("Sorting algorithms", "run_sort_comparison", ([1000, 5000],)),
+    ("Sort once + binary search vs. linear search", "run_sort_search_pipeline", (10000,)),
+    ("Search planner predictions", "run_planner_report", ()),
+    ("Mixed insert/search workloads", "run_workload_comparison", ([1000, 10000],)),
+    ("Sorted vs. Eytzinger layout", "run_layout_comparison", ([10000, 100000],)),
+    ("Memoized search with LRU cache", "run_cache_comparison", ([1000, 10000],)),
+    ("Bloom filter prefilter", "run_bloom_comparison", ([1000, 10000],)),
+    ("Micro-batched query service", "run_service_comparison", (100000,)),
+    ("Python vs. NumPy backends", "run_backend_report", ()),
+    ("Array access by container and access pattern", "run_access_benchmark", ()),
+    ("Streaming pair detector throughput", "run_stream_throughput", ()),
+]
 
 
 def display_algorithm_menu():
@@ -150,9 +182,145 @@ def explain_algorithm_details(algorithm_name):
     input("\nPress Enter when ready to run experiments...")
 
 
-def run_comparison_mode():
+def choose_checkpoint():
+    """
+    Offer to resume an interrupted sweep if a checkpoint file is present.
+    
+    Returns:
+        dict: A resumed checkpoint, or a fresh one for a new sweep
+    """
+    if os.path.exists(DEFAULT_CHECKPOINT_FILE):
+        choice = input("Found an interrupted run. Resume it? (y/n): ").strip().lower()
+        if choice in ['y', 'yes']:
+            print("Resuming - finished trials will be skipped.")
+            return resume_checkpoint(DEFAULT_CHECKPOINT_FILE)
+        remove_checkpoint(DEFAULT_CHECKPOINT_FILE)
+    return new_checkpoint()
+
+
+def choose_seed(checkpoint):
+    """
+    Pick the run seed, so the same test data can be generated again later.
+    
+    Args:
+        checkpoint (dict): The checkpoint in use; a resumed run keeps its seed
+    """
+    if checkpoint.get('run_seed') is not None:
+        print(f"Using the interrupted run's seed {checkpoint['run_seed']}.")
+        return
+    
+    while True:
+        choice = input("Random seed for the test data (Enter for a new one): ").strip()
+        if not choice or choice.isdigit():
+            break
+        print("Please enter a whole number, or just press Enter")
+    
+    seed = set_run_seed(int(choice) if choice else None)
+    print(f"Seed {seed} - enter it again next time to get exactly the same inputs.")
+
+
+def choose_cpu_pinning():
+    """
+    Optionally keep the benchmark on chosen CPU cores (Linux only).
+    
+    The choice is recorded in every result's environment fingerprint.
+    """
+    if not hasattr(os, 'sched_setaffinity'):
+        return
+    
+    available = sorted(os.sched_getaffinity(0))
+    while True:
+        choice = input(f"Pin the benchmark to CPU cores? Enter core numbers from "
+                       f"{available} separated by commas (Enter to skip): ").strip()
+        if not choice:
+            return
+        cores = [part.strip() for part in choice.split(',')]
+        if all(core.isdigit() and int(core) in available for core in cores):
+            break
+        print(f"Please enter cores from {available}, e.g. {available[0]}")
+    
+    pinned = pin_to_cpus([int(core) for core in cores])
+    print(f"Pinned to core(s) {pinned}.")
+
+
+def choose_distribution():
+    """
+    Let the student pick the shape of the input data.
+    
+    Returns:
+        str: Name of the chosen distribution
+    """
+    names = list(DISTRIBUTIONS)
+    print("\nInput data shape:")
+    for i, name in enumerate(names, 1):
+        print(f"{i}. {name}")
+    
+    while True:
+        choice = input(f"Choose a distribution (1-{len(names)}, Enter for "
+                       f"{DEFAULT_DISTRIBUTION}): ").strip()
+        if not choice:
+            return DEFAULT_DISTRIBUTION
+        if choice.isdigit() and 1 <= int(choice) <= len(names):
+            return names[int(choice) - 1]
+        print(f"Please enter a number from 1 to {len(names)}")
+
+
+def choose_report():
+    """
+    Let the student pick one of the comparison reports.
+    
+    Returns:
+        str: Name of the report function in reports.py
+    """
+    print("\nAvailable reports:")
+    for i, (description, function_name, arguments) in enumerate(REPORTS, 1):
+        print(f"{i:>2}. {description}")
+    
+    while True:
+        choice = input(f"Choose a report (1-{len(REPORTS)}): ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(REPORTS):
+            return REPORTS[int(choice) - 1][1]
+        print(f"Please enter a number from 1 to {len(REPORTS)}")
+
+
+def run_report(function_name):
+    """
+    Run one comparison report with the arguments listed in REPORTS.
+    
+    Args:
+        function_name (str): Name of the report function in reports.py
+        
+    Returns:
+        The report's rows
+    """
+    import reports  # Loaded only when a report is run - some need extra modules
+    
+    for description, name, arguments in REPORTS:
+        if name == function_name:
+            print(f"\nRunning report: {description}")
+            return getattr(reports, function_name)(*arguments)
+    raise ValueError(f"Unknown report '{function_name}'")
+
+
+def parse_arguments(argv=None):
+    """
+    Read the command line. Without arguments the activity runs interactively.
+    
+    Args:
+        argv (list): Arguments to parse (defaults to sys.argv)
+    """
+    parser = argparse.ArgumentParser(description="Build a Better Algorithm - Activity 06")
+    parser.add_argument("--report", choices=[name for _, name, _ in REPORTS],
+                        help="run one comparison report and exit")
+    return parser.parse_args(argv)
+
+
+def run_comparison_mode(checkpoint=None):
     """
     Allow students to compare multiple algorithms side by side.
+    
+    Args:
+        checkpoint (dict): Optional checkpoint used to save and resume progress
     """
     print("\n" + "="*50)
     print("COMPARISON MODE")
@@ -174,8 +342,9 @@ def run_comparison_mode():
     
     print(f"\nComparing: {', '.join(chosen_algorithms)}")
     
-    # Get input sizes
+    # Get input sizes and data shape
     sizes = get_input_sizes()
+    distribution = choose_distribution()
     
     print(f"\nRunning comparison with sizes: {sizes}")
     print("This may take a moment...")
@@ -183,7 +352,8 @@ def run_comparison_mode():
     # Run experiments for all chosen algorithms
     all_results = []
     for algorithm in chosen_algorithms:
-        results = run_algorithm_experiment(algorithm, sizes)
+        results = run_algorithm_experiment(algorithm, sizes, checkpoint,
+                                           distribution=distribution)
         all_results.append(results)
         print_algorithm_results(results)
     
@@ -201,24 +371,40 @@ def run_comparison_mode():
     print("• Find All Pairs should grow rapidly (steep curve)")
 
 
-def main():
+def main(argv=None):
     """
     Main function - orchestrates the entire activity.
+    
+    Args:
+        argv (list): Command-line arguments (see parse_arguments)
     """
+    arguments = parse_arguments(argv)
+    
     try:
+        if arguments.report:
+            # Command-line report: run it and skip the interactive activity
+            run_report(arguments.report)
+            return
+        
         # Welcome and menu
         display_algorithm_menu()
         
+        # Pick up an interrupted sweep, or start a new checkpoint
+        checkpoint = choose_checkpoint()
+        choose_seed(checkpoint)
+        choose_cpu_pinning()
+        
         # Ask if they want single algorithm study or comparison
         print("Choose your approach:")
         print("1. Study one algorithm in detail (recommended first)")
         print("2. Compare multiple algorithms side by side")
+        print("3. Run a comparison report (sorting, caches, memory access, ...)")
         
         while True:
-            mode = input("\nEnter choice (1-2): ").strip()
-            if mode in ['1', '2']:
+            mode = input("\nEnter choice (1-3): ").strip()
+            if mode in ['1', '2', '3']:
                 break
-            print("Please enter 1 or 2")
+            print("Please enter 1, 2 or 3")
         
         if mode == '1':
             # Single algorithm mode
@@ -231,12 +417,14 @@ def main():
             
             # Get experiment parameters
             sizes = get_input_sizes()
+            distribution = choose_distribution()
             
             print(f"\nRunning {algorithm_name} experiments with sizes: {sizes}")
             print("Analyzing performance patterns...")
             
             # Run the experiment
-            results = run_algorithm_experiment(algorithm_name, sizes)
+            results = run_algorithm_experiment(algorithm_name, sizes, checkpoint,
+                                               distribution=distribution)
             
             # Display results  
             print_algorithm_results(results)
@@ -244,9 +432,16 @@ def main():
             # Save results
             save_results_to_file([results], f"{algorithm_name.lower().replace(' ', '_')}_results.txt")
             
-        else:
+        elif mode == '2':
             # Comparison mode
-            run_comparison_mode()
+            run_comparison_mode(checkpoint)
+        
+        else:
+            # Report mode
+            run_report(choose_report())
+        
+        # The sweep finished, so there is nothing left to resume
+        remove_checkpoint(DEFAULT_CHECKPOINT_FILE)
         
         # Final instructions
         print("\n" + "="*60)
@@ -263,6 +458,9 @@ def main():
         
     except KeyboardInterrupt:
         print("\n\nActivity interrupted. Run again anytime!")
+        if os.path.exists(DEFAULT_CHECKPOINT_FILE):
+            print(f"Progress saved to '{DEFAULT_CHECKPOINT_FILE}' - choose the same")
+            print("algorithm and sizes next time to resume where you left off.")
     except Exception as e:
         print(f"\n❌ Error: {e}")
         print("Make sure all files are present and try again.")
@@ -0,0 +1,259 @@
+"""
+Memoized Lookup Layer - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+When the same targets are searched for again and again, there is no need to
+repeat the search: we can remember ("memoize") each answer. A cache lookup is
+a dictionary access - O(1) on average - no matter which search sits behind it.
+
+Two things keep the cache honest:
+1. It has a fixed capacity. When it is full, one entry is evicted using either
+   LRU (Least Recently Used) or LFU (Least Frequently Used).
+2. Answers are only valid for the data they were computed on. VersionedList
+   bumps a version number on every change, and the cache throws away all of
+   its answers as soon as it sees a new version.
+
+Hit, miss, eviction and invalidation counters show how much the cache helped.
+"""
+
+import random
+from collections import OrderedDict
+
+
+class VersionedList(list):
+    """
+    A list that counts its own changes.
+
+    Every method that modifies the list increases 'version' by one, so a
+    cache can tell whether answers it saved earlier are still correct.
+    """
+
+    version = 0
+
+    def _changed(self):
+        self.version += 1
+
+
+def _make_versioned(method_name):
+    """Wrap a list method so that calling it marks the list as changed."""
+    original = getattr(list, method_name)
+
+    def method(self, *args, **kwargs):
+        result = original(self, *args, **kwargs)
+        self._changed()
+        return result
+
+    method.__name__ = method_name
+    method.__doc__ = original.__doc__
+    return method
+
+
+for _name in ['__setitem__', '__delitem__', '__iadd__', '__imul__', 'append', 'extend',
+              'insert', 'pop', 'remove', 'clear', 'sort', 'reverse']:
+    setattr(VersionedList, _name, _make_versioned(_name))
+
+
+class LRUCache:
+    """Bounded cache that evicts the entry that was used least recently."""
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.entries = OrderedDict()
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, key, default=None):
+        """Return the cached value (and mark it as recently used), or default."""
+        if key not in self.entries:
+            return default
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry if full."""
+        if key in self.entries:
+            self.entries.move_to_end(key)
+        elif len(self.entries) >= self.capacity:
+            self.entries.popitem(last=False)
+            self.evictions += 1
+        self.entries[key] = value
+
+    def clear(self):
+        self.entries.clear()
+
+
+class LFUCache:
+    """
+    Bounded cache that evicts the entry that was used least often.
+
+    Keys are grouped by how many times they have been used, so finding the
+    entry to evict is O(1). Ties are broken by evicting the oldest entry.
+    """
+
+    def __init__(self, capacity):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.capacity = capacity
+        self.entries = {}      # key -> (value, use count)
+        self.by_count = {}     # use count -> OrderedDict of keys with that count
+        self.min_count = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _touch(self, key):
+        """Move a key from its current use-count group to the next one."""
+        value, count = self.entries[key]
+        group = self.by_count[count]
+        del group[key]
+        if not group:
+            del self.by_count[count]
+            if self.min_count == count:
+                self.min_count = count + 1
+        self.by_count.setdefault(count + 1, OrderedDict())[key] = None
+        self.entries[key] = (value, count + 1)
+        return value
+
+    def get(self, key, default=None):
+        """Return the cached value (and count one more use), or default."""
+        if key not in self.entries:
+            return default
+        return self._touch(key)
+
+    def put(self, key, value):
+        """Store a value, evicting the least frequently used entry if full."""
+        if key in self.entries:
+            self._touch(key)
+            self.entries[key] = (value, self.entries[key][1])
+            return
+
+        if len(self.entries) >= self.capacity:
+            evicted, _ = self.by_count[self.min_count].popitem(last=False)
+            if not self.by_count[self.min_count]:
+                del self.by_count[self.min_count]
+            del self.entries[evicted]
+            self.evictions += 1
+
+        self.entries[key] = (value, 1)
+        self.by_count.setdefault(1, OrderedDict())[key] = None
+        self.min_count = 1
+
+    def clear(self):
+        self.entries.clear()
+        self.by_count.clear()
+        self.min_count = 0
+
+
+CACHE_POLICIES = {
+    'lru': LRUCache,
+    'lfu': LFUCache,
+}
+
+
+class MemoizedSearch:
+    """
+    Opt-in memoization wrapper around a search function and its data.
+
+    Example:
+        data = VersionedList(generate_sorted_test_data(1000))
+        search = MemoizedSearch(binary_search_iterative, data, capacity=64)
+        search(500)        # miss - runs binary search
+        search(500)        # hit - answered from the cache
+        data.append(1001)  # new version
+        search(500)        # miss again - old answers were invalidated
+    """
+
+    def __init__(self, search_func, data, capacity=128, policy='lru'):
+        """
+        Args:
+            search_func: Function called as search_func(data, target)
+            data: The list to search. Use a VersionedList so changes are
+                noticed automatically; a plain list is assumed never to change
+                (call invalidate() yourself if it does)
+            capacity (int): Maximum number of remembered answers
+            policy (str): 'lru' or 'lfu'
+        """
+        if policy not in CACHE_POLICIES:
+            raise ValueError(f"Unknown cache policy '{policy}' (use 'lru' or 'lfu')")
+        self.search_func = search_func
+        self.data = data
+        self.policy = policy
+        self.cache = CACHE_POLICIES[policy](capacity)
+        self.version = self._data_version()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def _data_version(self):
+        return getattr(self.data, 'version', None)
+
+    def invalidate(self):
+        """Forget every saved answer."""
+        self.cache.clear()
+        self.invalidations += 1
+
+    def __call__(self, target):
+        """Search for target, using a saved answer when one is still valid."""
+        current_version = self._data_version()
+        if current_version != self.version:
+            self.invalidate()
+            self.version = current_version
+
+        # The version is part of the key, so an answer can never be used for
+        # data it was not computed on
+        key = (current_version, target)
+        missing = object()
+        result = self.cache.get(key, missing)
+        if result is not missing:
+            self.hits += 1
+            return result
+
+        self.misses += 1
+        result = self.search_func(self.data, target)
+        self.cache.put(key, result)
+        return result
+
+    def stats(self):
+        """
+        Summarize how well the cache worked.
+
+        Returns:
+            dict: hits, misses, evictions, invalidations, hit_rate and size
+        """
+        lookups = self.hits + self.misses
+        return {
+            'policy': self.policy,
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.cache.evictions,
+            'invalidations': self.invalidations,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.cache)
+        }
+
+
+def generate_skewed_targets(data, count, skew=1.2):
+    """
+    Pick search targets from data so that a few values are asked for very often.
+
+    The value at rank r (after shuffling the distinct values) is chosen with
+    probability proportional to 1 / r^skew - a Zipf-like distribution, which
+    is how real query logs tend to look.
+
+    Args:
+        data (list): Values to choose targets from
+        count (int): Number of targets to generate
+        skew (float): Larger values make the popular targets more dominant
+
+    Returns:
+        list: The generated targets
+    """
+    distinct = list(set(data))
+    random.shuffle(distinct)
+    weights = [1 / (rank ** skew) for rank in range(1, len(distinct) + 1)]
+    return random.choices(distinct, weights=weights, k=count)
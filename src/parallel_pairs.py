@@ -0,0 +1,131 @@
+"""
+Parallel Brute-Force Pair Search - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+find_all_pairs_with_sum is our O(n²) reference. This module runs the very
+same nested loops, but spreads them over several processes so every CPU
+core helps.
+
+How the work is shared:
+1. The numbers are copied ONCE into a block of shared memory
+   (multiprocessing.shared_memory), which every worker process can read
+   without receiving its own copy. Workers attach to it for each tile and
+   close their attachment again when the tile is done.
+2. The loops only visit pairs i < j, a triangle: row i has n - 1 - i pairs,
+   so early rows are much longer than late ones. We cut the rows into
+   "tiles" that each hold about the same number of pairs.
+3. Each worker runs the normal nested loops over its tiles. The partial
+   results are joined back together in tile order, so the pairs come out
+   in exactly the same order as the serial version, with the same count.
+"""
+
+import os
+from array import array
+from multiprocessing import Pool, shared_memory
+
+_shared_name = None  # Set in each worker process by _attach_worker
+_shared_length = 0
+
+TILES_PER_WORKER = 4  # Extra tiles let fast workers pick up the slack
+
+
+def split_triangle(n, tile_count):
+    """
+    Split rows 0..n-1 of the i < j triangle into contiguous, balanced tiles.
+
+    Args:
+        n (int): Number of elements
+        tile_count (int): Desired number of tiles
+
+    Returns:
+        list: (first_row, end_row) ranges covering every row exactly once
+    """
+    total_pairs = n * (n - 1) // 2
+    if n == 0 or tile_count <= 1 or total_pairs == 0:
+        return [(0, n)] if n else []
+
+    target = total_pairs / tile_count
+    tiles = []
+    start = 0
+    pairs_so_far = 0
+    for i in range(n):
+        pairs_so_far += n - 1 - i
+        # Close a tile once it holds its share of the total
+        if pairs_so_far >= target * (len(tiles) + 1) and len(tiles) < tile_count - 1:
+            tiles.append((start, i + 1))
+            start = i + 1
+    tiles.append((start, n))
+    return tiles
+
+
+def _attach_worker(block_name, length):
+    """Pool initializer: remember which shared block this worker reads."""
+    global _shared_name, _shared_length
+    _shared_name = block_name
+    _shared_length = length
+
+
+def _pairs_in_tile(tile, target_sum):
+    """Run the nested loops of find_all_pairs_with_sum for rows in one tile."""
+    # Attach for this tile only: the pool terminates its workers without
+    # running their exit handlers, so an attachment kept open would leak
+    block = shared_memory.SharedMemory(name=_shared_name)
+    numbers = block.buf[:_shared_length * 8].cast('q')
+    first_row, end_row = tile
+    pairs = []
+    comparisons = 0
+
+    try:
+        for i in range(first_row, end_row):
+            first = numbers[i]
+            # Slicing a memoryview does not copy; it just looks at part of the block
+            for second in numbers[i + 1:]:
+                comparisons += 1
+                if first + second == target_sum:
+                    pairs.append((first, second))
+    finally:
+        numbers.release()  # The block cannot close while a view of it is open
+        block.close()
+
+    return (pairs, comparisons)
+
+
+def parallel_find_all_pairs_with_sum(numbers, target_sum, workers=None):
+    """
+    Find all pairs that sum to target_sum using several processes.
+
+    Gives exactly the same answer as find_all_pairs_with_sum (same pairs,
+    same order, same comparison count).
+
+    Args:
+        numbers (list): List of integers (they must fit in 64 bits)
+        target_sum (int): The sum we're looking for
+        workers (int): Number of processes (defaults to the number of CPU cores)
+
+    Returns:
+        tuple: (list of pairs that sum to target, number of comparisons made)
+    """
+    workers = workers or os.cpu_count() or 1
+    values = array('q', numbers)
+    n = len(values)
+    if n < 2:
+        return ([], 0)
+
+    block = shared_memory.SharedMemory(create=True, size=n * 8)
+    try:
+        block.buf[:n * 8] = values.tobytes()
+        tiles = split_triangle(n, workers * TILES_PER_WORKER)
+
+        with Pool(workers, initializer=_attach_worker, initargs=(block.name, n)) as pool:
+            partials = pool.starmap(_pairs_in_tile, [(tile, target_sum) for tile in tiles])
+    finally:
+        block.close()
+        block.unlink()
+
+    # starmap keeps tile order, so joining the pieces gives the serial order
+    pairs = []
+    comparisons = 0
+    for tile_pairs, tile_comparisons in partials:
+        pairs.extend(tile_pairs)
+        comparisons += tile_comparisons
+    return (pairs, comparisons)
@@ -0,0 +1,107 @@
+"""
+Multi-Threaded Chunked Scan - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+linear_search_with_counter checks one element at a time on one CPU core.
+For very large (memory-mapped) inputs this module splits the data into
+chunks and scans them on several threads at once.
+
+Two ideas make this work:
+1. Each chunk is checked with one NumPy comparison (chunk == target). NumPy
+   releases Python's Global Interpreter Lock (GIL) while it does that, so the
+   threads really do run in parallel.
+2. Chunks are handed out from left to right. As soon as a match is found,
+   every chunk that starts after it is skipped - an earlier match can only
+   come from a chunk to its left, and those are already running or done.
+
+The answer is exactly what linear_search_with_counter would return: the
+first index of the target and the number of elements a left-to-right scan
+would have checked (index + 1, or n if the target is missing).
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from algorithms import linear_search_with_counter
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+DEFAULT_CHUNK_SIZE = 1 << 22  # 4M elements: large enough that thread overhead is tiny
+MIN_CHUNK_SIZE = 1 << 14      # Smaller chunks cost more in hand-off than they save
+CHUNKS_PER_WORKER = 4         # Extra chunks let fast threads pick up the slack
+
+
+class _FirstMatch:
+    """The smallest matching index found so far, shared by all worker threads."""
+
+    def __init__(self):
+        self.index = None
+        self.lock = threading.Lock()
+
+    def found_before(self, position):
+        """True if a match was already found to the left of position."""
+        index = self.index  # A single read is safe without the lock
+        return index is not None and index < position
+
+    def offer(self, index):
+        with self.lock:
+            if self.index is None or index < self.index:
+                self.index = index
+
+
+def choose_chunk_size(n, workers):
+    """
+    Chunk size that gives every thread several chunks of an n-element input.
+
+    Capped at DEFAULT_CHUNK_SIZE and kept above MIN_CHUNK_SIZE, so a small
+    input may end up in fewer chunks than threads.
+    """
+    return max(MIN_CHUNK_SIZE, min(DEFAULT_CHUNK_SIZE, n // (workers * CHUNKS_PER_WORKER)))
+
+
+def parallel_linear_search(data, target, workers=None, chunk_size=None):
+    """
+    Find the first position of target using several threads.
+
+    Args:
+        data: NumPy array, numpy.memmap, memoryview or list of numbers
+        target: The value to search for
+        workers (int): Number of threads (defaults to the number of CPU cores)
+        chunk_size (int): Elements per chunk (defaults to choose_chunk_size())
+
+    Returns:
+        tuple: (index if found or -1, number of elements a sequential scan checks)
+    """
+    if not NUMPY_AVAILABLE:
+        return linear_search_with_counter(data, target)
+
+    values = np.asarray(data)  # No copy for arrays, memmaps and memoryviews
+    n = len(values)
+    workers = workers or os.cpu_count() or 1
+    if chunk_size is None:
+        chunk_size = choose_chunk_size(n, workers)
+    first_match = _FirstMatch()
+
+    def scan_chunk(start):
+        if first_match.found_before(start):
+            return  # Cancelled: an earlier chunk already has the answer
+        matches = np.flatnonzero(values[start:start + chunk_size] == target)
+        if len(matches):
+            first_match.offer(start + int(matches[0]))
+
+    if workers == 1:
+        for start in range(0, n, chunk_size):
+            scan_chunk(start)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() waits for every chunk and re-raises any worker error
+            list(pool.map(scan_chunk, range(0, n, chunk_size)))
+
+    if first_match.index is None:
+        return (-1, n)
+    return (first_match.index, first_match.index + 1)
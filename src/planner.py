@@ -0,0 +1,272 @@
+"""
+Search Strategy Planner - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+Linear search costs nothing to set up but O(n) per query. Sorting first
+costs O(n log n) once, then each binary search is O(log n). A dictionary
+of positions costs O(n) to build, then each lookup is O(1). Which is
+cheapest depends on n AND on how many queries will follow:
+
+    total = setup + q × per_query
+
+A strategy with a setup cost beats repeated scans once q passes its
+break-even point, setup / (scan per query - its per query).
+
+The planner measures the constants of those formulas on THIS machine
+(calibrate_costs), predicts the total for each strategy and picks the
+smallest. search(data, targets) does all of that and runs the winner.
+
+Every strategy gives the same answers as linear_search_with_counter: the
+index of the first copy of each target in the ORIGINAL data, or -1.
+Predictions use the worst case for scanning (the target is absent).
+"""
+
+import bisect
+import math
+import random
+import time
+
+from algorithms import linear_search_with_counter
+
+CALIBRATION_SIZE = 20000
+CALIBRATION_SMALL_SIZE = 16
+CALIBRATION_QUERIES = 200
+CALIBRATION_REPEATS = 3
+CALIBRATION_SEED = 101  # Calibration uses its own generator, never the global one
+
+_costs = None  # Filled in by get_costs on first use
+
+
+# --- Strategies: prepare(data) -> prepared, run(prepared, target) -> index ---
+
+def _same_data(data):
+    return data
+
+
+def scan_lookup(data, target):
+    """Repeated scans: one linear search per query."""
+    return linear_search_with_counter(data, target)[0]
+
+
+def sorted_positions(data):
+    """Sort the positions by value; equal values keep their original order."""
+    order = sorted(range(len(data)), key=data.__getitem__)
+    return ([data[i] for i in order], order)
+
+
+def bisect_lookup(prepared, target):
+    """Binary search the sorted values, then map back to the original position."""
+    values, order = prepared
+    index = bisect.bisect_left(values, target)  # First copy, like a linear scan
+    if index < len(values) and values[index] == target:
+        return order[index]
+    return -1
+
+
+def first_positions(data):
+    """Dictionary value -> position of its first copy."""
+    # Walking backwards, earlier positions overwrite later ones
+    return dict(zip(reversed(data), range(len(data) - 1, -1, -1)))
+
+
+def hash_lookup(positions, target):
+    """One dictionary lookup per query."""
+    return positions.get(target, -1)
+
+
+# Strategy -> (prepare, run)
+STRATEGIES = {
+    'scan': (_same_data, scan_lookup),
+    'sort_bisect': (sorted_positions, bisect_lookup),
+    'hash_index': (first_positions, hash_lookup),
+}
+
+STRATEGY_LABELS = {
+    'scan': "repeated linear scans",
+    'sort_bisect': "sort once + binary search",
+    'hash_index': "build a hash index",
+}
+
+
+def _log2(n):
+    return math.log2(n) if n > 1 else 1.0
+
+
+def _best_time(function, repeats):
+    """Fastest of several runs - the least disturbed by other programs."""
+    best = None
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start_time
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def _fit(small, large, small_work, large_work):
+    """Fit time = fixed + unit × work through two measurements; returns (fixed, unit)."""
+    unit = max(0.0, (large - small) / (large_work - small_work))
+    return (max(0.0, small - unit * small_work), unit)
+
+
+def _measure(size, query_count, repeats, rng):
+    """Time each strategy's setup (once) and queries (per query) at one size."""
+    data = [rng.randint(1, 1000) for _ in range(size)]
+    present = [rng.choice(data) for _ in range(query_count)]
+    absent = [0] * query_count  # Scans are costed for the worst case
+
+    def per_query(run, prepared, targets):
+        def run_queries():
+            for target in targets:
+                run(prepared, target)
+        return _best_time(run_queries, repeats) / query_count
+
+    return {
+        'scan': per_query(scan_lookup, data, absent),
+        'sort': _best_time(lambda: sorted_positions(data), repeats),
+        'bisect': per_query(bisect_lookup, sorted_positions(data), present),
+        'index': _best_time(lambda: first_positions(data), repeats),
+        'hash': per_query(hash_lookup, first_positions(data), present),
+    }
+
+
+def calibrate_costs(size=CALIBRATION_SIZE, query_count=CALIBRATION_QUERIES,
+                    repeats=CALIBRATION_REPEATS, small_size=CALIBRATION_SMALL_SIZE):
+    """
+    Measure the cost constants of each strategy on this machine.
+
+    Every cost is measured at a small and a large size and fitted as
+    fixed + unit × work, where the work is n for a scan or an index build,
+    n·log₂(n) for a sort and log₂(n) for a binary search. The fixed part
+    (function calls, allocating lists) dominates on small inputs.
+
+    Args:
+        size (int): Large data size to measure on
+        query_count (int): Queries timed per strategy
+        repeats (int): Each measurement keeps the fastest of this many runs
+        small_size (int): Small data size to measure on
+
+    Returns:
+        dict: strategy step -> (fixed seconds, seconds per unit of work) for
+        'scan', 'sort', 'bisect' and 'index'; 'hash' -> seconds per lookup
+    """
+    rng = random.Random(CALIBRATION_SEED)
+    small = _measure(small_size, query_count, repeats, rng)
+    large = _measure(size, query_count, repeats, rng)
+    work = {
+        'scan': lambda n: n,
+        'sort': lambda n: n * _log2(n),
+        'bisect': _log2,
+        'index': lambda n: n,
+    }
+
+    costs = {step: _fit(small[step], large[step], measure(small_size), measure(size))
+             for step, measure in work.items()}
+    costs['hash'] = min(small['hash'], large['hash'])  # O(1): no growth to fit
+    return costs
+
+
+def get_costs():
+    """Return this machine's cost constants, calibrating them on first use."""
+    global _costs
+    if _costs is None:
+        _costs = calibrate_costs()
+    return _costs
+
+
+def strategy_costs(size, costs):
+    """
+    Predicted (setup, per query) seconds of each strategy for 'size' elements.
+
+    Returns:
+        dict: strategy -> (setup seconds, seconds per query)
+    """
+    def cost(step, work):
+        fixed, unit = costs[step]
+        return fixed + unit * work
+
+    log_n = _log2(size)
+    return {
+        'scan': (0.0, cost('scan', size)),
+        'sort_bisect': (cost('sort', size * log_n), cost('bisect', log_n)),
+        'hash_index': (cost('index', size), costs['hash']),
+    }
+
+
+def break_even(setup, per_query, scan_per_query):
+    """Queries after which a strategy with a setup cost beats scanning (None = never)."""
+    saving = scan_per_query - per_query
+    if saving <= 0:
+        return None
+    return max(1, math.ceil(setup / saving))
+
+
+def plan_search(size, query_count, costs=None):
+    """
+    Pick the cheapest strategy for 'query_count' queries on 'size' elements.
+
+    Args:
+        size (int): Number of elements searched
+        query_count (int): Number of queries expected
+        costs (dict): From calibrate_costs (defaults to get_costs())
+
+    Returns:
+        dict: 'strategy' (the winner), 'totals' (strategy -> predicted
+        seconds), 'break_even' (strategy -> queries to beat scanning, or
+        None) and 'explanation' (text)
+    """
+    if costs is None:
+        costs = get_costs()
+    per_strategy = strategy_costs(size, costs)
+    scan_per_query = per_strategy['scan'][1]
+
+    totals = {}
+    break_evens = {}
+    for strategy, (setup, per_query) in per_strategy.items():
+        totals[strategy] = setup + query_count * per_query
+        if strategy != 'scan':
+            break_evens[strategy] = break_even(setup, per_query, scan_per_query)
+    winner = min(totals, key=totals.get)
+
+    lines = [f"{query_count} queries on {size} elements: "
+             f"{STRATEGY_LABELS[winner]} is cheapest"]
+    for strategy, (setup, per_query) in per_strategy.items():
+        line = (f"  {STRATEGY_LABELS[strategy]:<26} setup {setup * 1e6:>10.1f} µs + "
+                f"{query_count} × {per_query * 1e6:.3f} µs = {totals[strategy] * 1e6:.1f} µs")
+        if strategy in break_evens:
+            queries = break_evens[strategy]
+            line += ("  (never beats scanning)" if queries is None
+                     else f"  (beats scanning from {queries} queries)")
+        lines.append(line)
+
+    return {
+        'strategy': winner,
+        'totals': totals,
+        'break_even': break_evens,
+        'explanation': "\n".join(lines),
+    }
+
+
+def run_strategy(strategy, data, targets):
+    """Answer every target with one strategy; returns first indices or -1."""
+    prepare, run = STRATEGIES[strategy]
+    prepared = prepare(data)
+    return [run(prepared, target) for target in targets]
+
+
+def search(data, targets, costs=None):
+    """
+    Find the first index of each target, with whichever strategy is cheapest.
+
+    Args:
+        data (list): The (unsorted) data
+        targets (list): Values to look for
+        costs (dict): From calibrate_costs (defaults to get_costs())
+
+    Returns:
+        list: For each target, the index of its first copy in data, or -1
+    """
+    targets = list(targets)
+    plan = plan_search(len(data), len(targets), costs)
+    return run_strategy(plan['strategy'], data, targets)
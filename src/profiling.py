@@ -0,0 +1,128 @@
+"""
+Profiling Helpers - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+The timing tables show HOW LONG an algorithm takes; a profile shows WHERE
+that time goes - which functions run, how often, and how long each one
+takes by itself.
+
+Python's built-in cProfile records every function call, which slows the
+code down. So profiles are always taken on an extra trial whose time is
+thrown away: the timed samples never include profiler overhead.
+
+For every (algorithm, size) two files are written:
+- <name>.pstats:    open with "python -m pstats <file>" or snakeviz
+- <name>.collapsed: "caller;callee;... microseconds" lines for flame graph
+                    tools (flamegraph.pl, speedscope, inferno)
+
+cProfile only remembers which function called which, not whole call
+stacks, so the collapsed stacks are rebuilt from those caller/callee links:
+a function's time is shared out among its callers in proportion to how
+much time each caller spent in it.
+"""
+
+import os
+import pstats
+import re
+
+DEFAULT_PROFILE_DIR = "profiles"
+HOT_FUNCTION_COUNT = 5
+
+
+def function_label(func):
+    """Turn a pstats (filename, line, name) key into a short readable label."""
+    filename, line, name = func
+    if filename == '~':
+        return name  # Built-in functions have no file
+    return f"{os.path.basename(filename)}:{line}({name})"
+
+
+def top_functions(stats, limit=HOT_FUNCTION_COUNT):
+    """
+    List the functions that spent the most time running their own code.
+
+    Args:
+        stats (pstats.Stats): Profile to read
+        limit (int): How many functions to return
+
+    Returns:
+        list: Dicts with 'function', 'calls', 'self_time' and 'total_time',
+        slowest first
+    """
+    rows = []
+    for func, (_, calls, self_time, total_time, _) in stats.stats.items():
+        rows.append({
+            'function': function_label(func),
+            'calls': calls,
+            'self_time': self_time,
+            'total_time': total_time
+        })
+    rows.sort(key=lambda row: row['self_time'], reverse=True)
+    return rows[:limit]
+
+
+def collapse_stacks(stats):
+    """
+    Rebuild "root;...;leaf" stacks with their self time in microseconds.
+
+    Args:
+        stats (pstats.Stats): Profile to read
+
+    Returns:
+        dict: Stack string -> microseconds spent in the last function of it
+    """
+    callees = {}
+    for func, (_, _, _, _, callers) in stats.stats.items():
+        for caller, (_, _, _, edge_total) in callers.items():
+            callees.setdefault(caller, []).append((func, edge_total))
+
+    roots = [func for func, entry in stats.stats.items() if not entry[4]]
+    stacks = {}
+
+    def walk(func, path, share):
+        _, _, self_time, total_time, _ = stats.stats[func]
+        path = path + [function_label(func)]
+        stack = ";".join(path)
+        stacks[stack] = stacks.get(stack, 0) + self_time * share * 1e6
+
+        for callee, edge_total in callees.get(func, []):
+            if function_label(callee) in path or total_time <= 0:
+                continue  # Skip recursion; its time is already in this frame
+            callee_total = stats.stats[callee][3]
+            if callee_total > 0:
+                walk(callee, path, share * min(1.0, edge_total / callee_total))
+
+    for root in roots:
+        walk(root, [], 1.0)
+    return {stack: int(round(micros)) for stack, micros in stacks.items() if micros >= 0.5}
+
+
+def save_profile(profiler, algorithm_name, size, directory=DEFAULT_PROFILE_DIR):
+    """
+    Write the .pstats and .collapsed files for one profiled trial.
+
+    Args:
+        profiler (cProfile.Profile): Profiler that has finished recording
+        algorithm_name (str): Name of the algorithm that was profiled
+        size (int): Input size that was profiled
+        directory (str): Folder for the profile files (created if needed)
+
+    Returns:
+        dict: 'size', 'pstats' and 'collapsed' file paths, and 'hot_functions'
+    """
+    os.makedirs(directory, exist_ok=True)
+    slug = re.sub(r'[^a-z0-9]+', '_', algorithm_name.lower()).strip('_')
+    base = os.path.join(directory, f"{slug}_{size}")
+
+    stats = pstats.Stats(profiler)
+    stats.dump_stats(base + ".pstats")
+    with open(base + ".collapsed", 'w') as f:
+        for stack, micros in sorted(collapse_stacks(stats).items()):
+            f.write(f"{stack} {micros}\n")
+
+    return {
+        'size': size,
+        'pstats': base + ".pstats",
+        'collapsed': base + ".collapsed",
+        'hot_functions': top_functions(stats)
+    }
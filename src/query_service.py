@@ -0,0 +1,288 @@
+"""
+Local Query Service with Micro-Batching - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+A binary search takes about a microsecond, but answering it over a socket
+costs much more: reading the request, waking up a task, writing the reply.
+When many clients ask at once, the service can save work by collecting
+requests for a very short time and answering the whole group ("micro-batch")
+with one vectorized NumPy call.
+
+Two limits keep the wait short:
+- max_batch_size: a batch is answered as soon as it is this big
+- max_wait: a batch is answered after this many seconds, even if small
+
+Protocol: one JSON object per line, over TCP or a Unix socket.
+    request:  {"op": "search", "target": 42}  -> {"result": index or -1}
+    request:  {"op": "pairs", "target": 500}  -> {"result": number of pairs}
+
+"search" returns the index of the first copy of target in the sorted data.
+"pairs" returns how many index pairs i < j have data[i] + data[j] == target.
+"""
+
+import asyncio
+import bisect
+import json
+import numbers
+import time
+from collections import Counter
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# The pair table has one slot per possible sum, so it is only built when the
+# values span at most this many times the number of elements (or PAIR_TABLE_MIN)
+PAIR_TABLE_SPAN_FACTOR = 4
+PAIR_TABLE_MIN = 1024
+
+
+class BatchLookup:
+    """Answers many search and pair-count queries at once."""
+
+    def __init__(self, data):
+        self.sorted_data = sorted(data)
+        self.array = None
+        self.pair_totals = None
+        self.counts = None
+
+        if NUMPY_AVAILABLE and self.sorted_data:
+            array = np.asarray(self.sorted_data)
+            if array.dtype.kind in 'iuf':  # Plain numbers - searchsorted works
+                self.array = array
+
+        if self.array is not None and self.array.dtype.kind in 'iu':
+            self.offset = int(self.array[0])
+            span = int(self.array[-1]) - self.offset + 1
+            if span <= max(PAIR_TABLE_SPAN_FACTOR * len(self.array), PAIR_TABLE_MIN):
+                # pair_totals[t] counts ordered pairs (a, b) of positions with
+                # a + b == t + 2·offset (including a == b), which is exactly a
+                # convolution of the value counts with themselves. Precomputing
+                # it once makes every pair query a single array lookup.
+                frequency = np.bincount(self.array - self.offset)
+                self.pair_totals = np.convolve(frequency, frequency)
+                self.frequency = frequency
+
+        if self.pair_totals is None:
+            # Wide or non-integer values: count pairs from the value counts instead
+            self.counts = Counter(self.sorted_data)
+
+    def search_many(self, targets):
+        """Return the index of the first copy of each target, or -1."""
+        if self.array is None:
+            results = []
+            for target in targets:
+                i = bisect.bisect_left(self.sorted_data, target)
+                found = i < len(self.sorted_data) and self.sorted_data[i] == target
+                results.append(i if found else -1)
+            return results
+
+        targets = np.asarray(targets)
+        positions = np.searchsorted(self.array, targets)
+        clipped = np.minimum(positions, len(self.array) - 1)
+        return np.where(self.array[clipped] == targets, positions, -1).tolist()
+
+    def count_pairs_many(self, targets):
+        """Return the number of index pairs i < j summing to each target."""
+        if self.pair_totals is None:
+            return [self._count_pairs(target) for target in targets]
+
+        raw = np.asarray(targets, dtype=np.float64)
+        whole = raw == np.floor(raw)  # Integer data cannot sum to 2.5
+        whole &= np.isfinite(raw) & (np.abs(raw) < 2.0 ** 63)  # inf, nan, beyond int64
+        targets = np.where(whole, raw, 0).astype(np.int64) - 2 * self.offset
+        in_range = whole & (targets >= 0) & (targets < len(self.pair_totals))
+        safe = np.where(in_range, targets, 0)
+        ordered = np.where(in_range, self.pair_totals[safe], 0)
+
+        # Remove pairs of a position with itself (value t/2 counted with itself)
+        half = safe // 2
+        has_half = in_range & (safe % 2 == 0) & (half < len(self.frequency))
+        self_pairs = np.where(has_half, self.frequency[np.where(has_half, half, 0)], 0)
+        return ((ordered - self_pairs) // 2).tolist()
+
+    def _count_pairs(self, target):
+        """Pairs summing to target from the value counts - O(k), k distinct values."""
+        pairs = 0
+        for value, count in self.counts.items():
+            partner = target - value
+            if partner == value:
+                pairs += count * (count - 1) // 2
+            elif value < partner:
+                pairs += count * self.counts.get(partner, 0)
+        return pairs
+
+
+class QueryService:
+    """
+    An asyncio server that answers search and pair queries.
+
+    With batching=False every request is answered on its own, straight away,
+    with a batch of one - the baseline to compare against.
+    """
+
+    def __init__(self, data, max_batch_size=32, max_wait=0.0005, batching=True):
+        self.lookup = BatchLookup(data)
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.batching = batching
+        self.queue = None
+        self.server = None
+        self.batch_task = None
+        self.batch_sizes = []  # Size of every batch answered, for reporting
+
+    async def start(self, host='127.0.0.1', port=0, unix_path=None):
+        """
+        Start listening. Use port 0 to let the operating system pick a free port.
+
+        Returns:
+            tuple: (host, port) for TCP, or (unix_path, None) for a Unix socket
+        """
+        self.queue = asyncio.Queue()
+        if self.batching:
+            self.batch_task = asyncio.create_task(self._batch_loop())
+
+        if unix_path is not None:
+            self.server = await asyncio.start_unix_server(self._handle_client, path=unix_path)
+            return (unix_path, None)
+
+        self.server = await asyncio.start_server(self._handle_client, host, port)
+        return self.server.sockets[0].getsockname()[:2]
+
+    async def stop(self):
+        """Stop accepting clients and shut down the batching task."""
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
+        if self.batch_task is not None:
+            self.batch_task.cancel()
+            try:
+                await self.batch_task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, op, target):
+        """Answer one query, going through a micro-batch if batching is on."""
+        if op not in ('search', 'pairs'):
+            raise ValueError(f"Unknown operation '{op}'")
+        if isinstance(target, bool) or not isinstance(target, numbers.Real):
+            raise TypeError(f"target must be a number, not {type(target).__name__}")
+
+        if not self.batching:
+            if op == 'search':
+                return self.lookup.search_many([target])[0]
+            return self.lookup.count_pairs_many([target])[0]
+
+        future = asyncio.get_running_loop().create_future()
+        await self.queue.put((op, target, future))
+        return await future
+
+    async def _batch_loop(self):
+        """Collect queued queries into batches and answer each batch at once."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                try:
+                    # Take everything that is already waiting without sleeping
+                    batch.append(self.queue.get_nowait())
+                    continue
+                except asyncio.QueueEmpty:
+                    pass
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            self.batch_sizes.append(len(batch))
+            self._answer(batch)
+
+    def _answer(self, batch):
+        """Run one vectorized call per operation type and hand out the results."""
+        for op, many in (('search', self.lookup.search_many),
+                         ('pairs', self.lookup.count_pairs_many)):
+            group = [(target, future) for kind, target, future in batch if kind == op]
+            if not group:
+                continue
+            try:
+                results = many([target for target, _ in group])
+            except Exception as e:
+                # Fail this group's queries only - the batch loop keeps running
+                for _, future in group:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            for (_, future), result in zip(group, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def _handle_client(self, reader, writer):
+        """Read one JSON request per line and write one JSON reply per line."""
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    result = await self.submit(request['op'], request['target'])
+                    reply = {'result': result}
+                except (ValueError, KeyError, TypeError) as e:
+                    reply = {'error': str(e)}
+                writer.write((json.dumps(reply) + "\n").encode())
+                await writer.drain()
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass  # The client went away first
+
+
+async def run_load(address, targets, connections=32, op='search'):
+    """
+    Load generator: send queries over several connections at the same time.
+
+    Each connection sends one request, waits for the reply, then sends the
+    next (a "closed loop"), so 'connections' requests are in flight at once.
+
+    Args:
+        address (tuple): (host, port) for TCP or (unix_path, None)
+        targets (list): Targets to send, shared out across the connections
+        connections (int): Number of concurrent client connections
+        op (str): 'search' or 'pairs'
+
+    Returns:
+        tuple: (list of per-request latencies in seconds, total wall time)
+    """
+    host, port = address
+    latencies = []
+
+    async def client(my_targets):
+        if port is None:
+            reader, writer = await asyncio.open_unix_connection(host)
+        else:
+            reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for target in my_targets:
+                start_time = time.perf_counter()
+                writer.write((json.dumps({'op': op, 'target': target}) + "\n").encode())
+                await writer.drain()
+                reply = json.loads(await reader.readline())
+                latencies.append(time.perf_counter() - start_time)
+                if 'error' in reply:
+                    raise RuntimeError(reply['error'])
+        finally:
+            writer.close()
+            await writer.wait_closed()
+
+    start_time = time.perf_counter()
+    await asyncio.gather(*(client(targets[i::connections]) for i in range(connections)))
+    return latencies, time.perf_counter() - start_time
@@ -0,0 +1,75 @@
+"""
+Query Workloads - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+A single search tells us little: looking for data[-1] is not even the
+worst case for linear search, because an earlier copy of the same value
+is usually found first. This module builds whole batches of targets that
+follow a pattern, so we can measure best, average and worst cases:
+
+- uniform: values at random positions (the "average" case)
+- best:    the value each search finds first (position 0 for linear
+           search, the middle element for binary search)
+- worst:   the slowest present value for linear search (the value whose
+           first copy is furthest right); for binary search a missing
+           value, since a miss always runs the full log2(n) halvings
+- absent:  values that are not in the data at all
+- hot:     a few popular values asked for again and again (Zipf skew)
+"""
+
+import random
+
+from memo_cache import generate_skewed_targets
+
+QUERY_WORKLOADS = ['uniform', 'best', 'worst', 'absent', 'hot']
+DEFAULT_QUERY_COUNT = 1000
+HOT_KEY_SKEW = 1.2
+
+
+def _absent_values(data, count):
+    """Values above the largest element, so none of them is ever found."""
+    top = max(data, default=0)
+    return [top + random.randint(1, 1000) for _ in range(count)]
+
+
+def _latest_first_occurrence(data):
+    """The value whose first copy appears furthest to the right."""
+    first_seen = {}
+    for index, value in enumerate(data):
+        first_seen.setdefault(value, index)
+    return max(first_seen, key=first_seen.get)
+
+
+def generate_query_targets(workload, data, count=DEFAULT_QUERY_COUNT, sorted_data=False):
+    """
+    Build a batch of search targets that follows a workload pattern.
+
+    Args:
+        workload (str): One of QUERY_WORKLOADS
+        data (list): The data that will be searched
+        count (int): Number of targets
+        sorted_data (bool): True for binary search (changes best and worst)
+
+    Returns:
+        list: The targets, in the order they should be searched for
+    """
+    if workload not in QUERY_WORKLOADS:
+        raise ValueError(f"Unknown query workload '{workload}'. "
+                         f"Choose from: {', '.join(QUERY_WORKLOADS)}")
+    if not data or workload == 'absent':
+        return _absent_values(data, count)
+
+    if workload == 'uniform':
+        return [data[random.randrange(len(data))] for _ in range(count)]
+
+    if workload == 'best':
+        # binary_search_iterative looks at (0 + n - 1) // 2 first
+        position = (len(data) - 1) // 2 if sorted_data else 0
+        return [data[position]] * count
+
+    if workload == 'worst':
+        if sorted_data:
+            return _absent_values(data, count)
+        return [_latest_first_occurrence(data)] * count
+
+    return generate_skewed_targets(data, count, HOT_KEY_SKEW)
@@ -0,0 +1,1254 @@
+"""
+Comparison Reports - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+timer.py measures one algorithm at a time. The functions here build on it to
+answer bigger questions - which distribution, workload, layout, cache,
+backend or container is fastest - and each prints a table and returns its
+rows.
+
+They are kept out of timer.py so that importing the timing harness stays
+quick: the reports that need a process pool, an event loop or
+memory-mapped files import those modules only when they run.
+"""
+
+import math
+import os
+import random
+import time
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from algorithms import (
+    array_access, binary_search_iterative, binary_search_with_counter,
+    linear_search_with_counter,
+    find_all_pairs_with_sum, count_pairs_with_sum, generate_test_data
+)
+from distributions import generate_distribution, DISTRIBUTIONS, DEFAULT_DISTRIBUTION
+from eytzinger import EytzingerIndex
+from verification import ResultVerifier
+from backends import BACKENDS, comparable_answer
+from access_patterns import (
+    CONTAINERS, CONTAINER_SIZE_CAPS, ACCESS_PATTERNS, generate_index_stream, boundary_sizes,
+    cache_sizes, memory_level
+)
+from reproducibility import seed_trial, get_run_seed, environment_fingerprint
+from streaming import StreamingPairDetector
+from sorting import SORTING_ALGORITHMS, count_builtin_comparisons
+from planner import calibrate_costs, plan_search, run_strategy, STRATEGIES
+from query_workloads import generate_query_targets, QUERY_WORKLOADS, DEFAULT_QUERY_COUNT
+from bloom_filter import PrefilteredSearch, DEFAULT_FALSE_POSITIVE_RATE
+from memo_cache import MemoizedSearch, VersionedList, generate_skewed_targets
+from sorted_container import WORKLOAD_STRATEGIES
+from timer import (
+    TRIALS_PER_SIZE, SORT_SIZE_CAPS, run_algorithm_experiment, get_algorithm_description,
+    get_timer_overhead, subtract_timer_overhead, check_answer, start_clock, stop_clock,
+    print_algorithm_results, create_comparison_plot
+)
+
+# Algorithms that can answer a batch of queries ->
+# (timed search function, comparison-counting version, needs sorted data?)
+QUERY_ALGORITHMS = {
+    "Linear Search": (linear_search_with_counter, linear_search_with_counter, False),
+    "Binary Search": (binary_search_iterative, binary_search_with_counter, True),
+}
+
+# The pure-Python pair search is O(n²), so the backend report stops there
+BACKEND_PAIRS_SIZE_CAP = 2000
+
+
+def run_distribution_comparison(algorithm_name, input_sizes, distributions=None):
+    """
+    Run the same experiment on several input distributions.
+    
+    Prints each distribution's results, then plots them side by side.
+    
+    Args:
+        algorithm_name (str): Name of algorithm to test
+        input_sizes (list): List of input sizes to test
+        distributions (list): Distribution names (defaults to all of them)
+        
+    Returns:
+        list: One results dict per distribution, ready for create_comparison_plot
+    """
+    if distributions is None:
+        distributions = list(DISTRIBUTIONS)
+    all_results = []
+    for distribution in distributions:
+        results = run_algorithm_experiment(algorithm_name, input_sizes,
+                                           distribution=distribution)
+        print_algorithm_results(results)
+        all_results.append(results)
+    create_comparison_plot(all_results)
+    return all_results
+
+
+def run_query_workload_experiment(algorithm_name, input_sizes, workload='uniform',
+                                  query_count=DEFAULT_QUERY_COUNT,
+                                  distribution=DEFAULT_DISTRIBUTION, verify=False,
+                                  samples=None):
+    """
+    Time whole batches of queries that follow a workload pattern.
+    
+    Each trial searches for query_count targets twice: once timed as one
+    batch (for an accurate mean), and once with every query timed on its
+    own (for the percentiles). Timer overhead is subtracted from both.
+    Comparisons are counted in a third, untimed pass.
+    
+    Args:
+        algorithm_name (str): "Linear Search" or "Binary Search"
+        input_sizes (list): List of input sizes to test
+        workload (str): Target pattern (see query_workloads.py)
+        query_count (int): Queries per trial
+        distribution (str): Shape of the input data (see distributions.py)
+        verify (bool): Check every answer with one ResultVerifier per dataset
+        samples (ExperimentResult): If given, every query's latency and
+            comparison count is recorded here (compact even for millions)
+        
+    Returns:
+        dict: Results like run_algorithm_experiment, where 'times' holds the
+        mean time per query and 'operations' the mean comparisons per query,
+        plus 'workload', 'query_count' and 'percentiles' (one dict per size
+        with 'p50', 'p90' and 'p99' in seconds)
+    """
+    if algorithm_name not in QUERY_ALGORITHMS:
+        raise ValueError(f"Query workloads support: {', '.join(QUERY_ALGORITHMS)}")
+    search, counting_search, needs_sorted = QUERY_ALGORITHMS[algorithm_name]
+    overhead = get_timer_overhead()
+    
+    results = {
+        'algorithm': algorithm_name,
+        'sizes': input_sizes,
+        'times': [],
+        'ratios': [],
+        'operations': [],
+        'description': get_algorithm_description(algorithm_name),
+        'distribution': distribution,
+        'workload': workload,
+        'query_count': query_count,
+        'percentiles': [],
+        'seed': get_run_seed(),
+        'environment': environment_fingerprint()
+    }
+    
+    for i, size in enumerate(input_sizes):
+        batch_times = []
+        latencies = []
+        total_operations = 0
+        
+        for trial in range(TRIALS_PER_SIZE):
+            seed_trial("queries", algorithm_name, workload, distribution, size, trial)
+            data = generate_distribution(distribution, size)
+            if needs_sorted:
+                data.sort()
+            targets = generate_query_targets(workload, data, query_count, needs_sorted)
+            
+            start_time = start_clock()
+            for target in targets:
+                search(data, target)
+            end_time = stop_clock()
+            batch_times.append(subtract_timer_overhead(end_time - start_time,
+                                                       len(targets), overhead))
+            
+            for target in targets:
+                start_time = start_clock()
+                search(data, target)
+                end_time = stop_clock()
+                latencies.append(subtract_timer_overhead(end_time - start_time, 0, overhead))
+            
+            # Counted separately so the counting never slows the timed searches
+            answers = [counting_search(data, target) for target in targets]
+            total_operations += sum(comparisons for _, comparisons in answers)
+            if samples is not None:
+                trial_latencies = latencies[-len(targets):] if targets else []
+                for latency, (_, comparisons) in zip(trial_latencies, answers):
+                    samples.append_sample(size, latency, comparisons)
+            
+            if verify:
+                verifier = ResultVerifier(data)  # Built once, then O(1) per query
+                for target, answer in zip(targets, answers):
+                    if needs_sorted:
+                        correct = verifier.check_binary_search(target, answer[0])
+                    else:
+                        correct = verifier.check_linear_search(target, answer)
+                    check_answer(correct, algorithm_name, target)
+        
+        total_queries = TRIALS_PER_SIZE * query_count
+        mean_time = sum(batch_times) / total_queries if total_queries else 0.0
+        results['times'].append(mean_time)
+        results['operations'].append(round(total_operations / total_queries, 1)
+                                     if total_queries else 0)
+        results['percentiles'].append({
+            'p50': percentile(latencies, 0.50),
+            'p90': percentile(latencies, 0.90),
+            'p99': percentile(latencies, 0.99)
+        })
+        
+        if i > 0:
+            previous = results['times'][i - 1]
+            results['ratios'].append(mean_time / previous if previous > 0 else 1.0)
+        else:
+            results['ratios'].append(0)
+    
+    return results
+
+
+def run_query_workload_comparison(algorithm_name, input_sizes, workloads=None,
+                                  query_count=DEFAULT_QUERY_COUNT):
+    """
+    Compare the query workloads for one algorithm side by side.
+    
+    Args:
+        algorithm_name (str): "Linear Search" or "Binary Search"
+        input_sizes (list): List of input sizes to test
+        workloads (list): Workload names (defaults to all of them)
+        query_count (int): Queries per trial
+        
+    Returns:
+        list: One results dict per workload (see run_query_workload_experiment)
+    """
+    if workloads is None:
+        workloads = QUERY_WORKLOADS
+    
+    results_list = [run_query_workload_experiment(algorithm_name, input_sizes, workload,
+                                                  query_count)
+                    for workload in workloads]
+    
+    print(f"\n=== {algorithm_name.upper()} QUERY WORKLOADS ({query_count} queries per trial) ===")
+    print(f"{'Workload':>8} | {'Size':>8} | {'Mean (µs)':>10} | {'p50 (µs)':>9} | "
+          f"{'p90 (µs)':>9} | {'p99 (µs)':>9} | {'Ops/query':>9}")
+    print("-" * 80)
+    for results in results_list:
+        for size, mean_time, ops, pct in zip(results['sizes'], results['times'],
+                                             results['operations'], results['percentiles']):
+            print(f"{results['workload']:>8} | {size:>8} | {mean_time * 1e6:>10.3f} | "
+                  f"{pct['p50'] * 1e6:>9.3f} | {pct['p90'] * 1e6:>9.3f} | "
+                  f"{pct['p99'] * 1e6:>9.3f} | {ops:>9}")
+    print()
+    return results_list
+
+
+def run_dataset_experiment(algorithm_name, input_sizes, directory="datasets", dtype='int32'):
+    """
+    Run an algorithm on memory-mapped datasets stored on disk.
+    
+    Datasets are generated once per size (in chunks, so they never have to
+    fit in memory) and reused by later runs. The algorithms read them through
+    a zero-copy memoryview, which makes 10^8-10^9 element inputs possible.
+    The results are printed like any other experiment's.
+    
+    Args:
+        algorithm_name (str): "Array Access", "Binary Search", "Linear Search"
+            or "Count Pairs"
+        input_sizes (list): List of input sizes to test
+        directory (str): Folder that holds the dataset files
+        dtype (str): 'int32' or 'int64'
+        
+    Returns:
+        dict: Results in the same format as run_algorithm_experiment
+    """
+    from datasets import write_dataset, open_dataset
+    
+    if algorithm_name not in ("Array Access", "Binary Search", "Linear Search", "Count Pairs"):
+        raise ValueError(f"{algorithm_name} is not supported on on-disk datasets")
+    
+    os.makedirs(directory, exist_ok=True)
+    sorted_order = algorithm_name == "Binary Search"
+    results = {
+        'algorithm': algorithm_name,
+        'sizes': input_sizes,
+        'times': [],
+        'ratios': [],
+        'operations': [],
+        'description': get_algorithm_description(algorithm_name)
+    }
+    
+    for i, size in enumerate(input_sizes):
+        kind = "sorted" if sorted_order else "random"
+        filename = os.path.join(directory, f"{kind}_{size}_{dtype}.bin")
+        if not os.path.exists(filename):
+            print(f"Writing dataset '{filename}'...")
+            seed_trial("Dataset", kind, size, dtype)  # No-op unless seeded
+            write_dataset(filename, size, sorted_order=sorted_order, dtype=dtype)
+        
+        print(f"Running with on-disk input size: {size}...")
+        data = open_dataset(filename, use_numpy=False)
+        
+        start_time = time.perf_counter()
+        if algorithm_name == "Array Access":
+            for index in [size // 4, size // 2, size * 3 // 4]:
+                array_access(data, index)
+            operation_count = 3
+        elif algorithm_name == "Binary Search":
+            target = data[size * 3 // 4] if size > 0 else 0
+            binary_search_iterative(data, target)
+            operation_count = math.ceil(math.log2(size)) if size > 0 else 1
+        elif algorithm_name == "Linear Search":
+            target = data[-1] if size > 0 else 0
+            _, operation_count = linear_search_with_counter(data, target)
+        else:
+            target_sum = data[0] + data[1] if size >= 2 else 10
+            _, operation_count = count_pairs_with_sum(data, target_sum)
+        execution_time = time.perf_counter() - start_time
+        
+        results['times'].append(execution_time)
+        results['operations'].append(operation_count)
+        if i > 0:
+            previous = results['times'][i-1]
+            results['ratios'].append(execution_time / previous if previous > 0 else 1.0)
+        else:
+            results['ratios'].append(0)
+    
+    print_algorithm_results(results)
+    return results
+
+
+def run_parallel_scan_comparison(size, worker_counts=(1, 2, 4, 8), directory="datasets"):
+    """
+    Time the multi-threaded chunked scan on a memory-mapped dataset.
+    
+    The target is a value that never appears (0), so every run has to scan
+    the whole file - the worst case for linear search. The chunk size is
+    picked from the size and the worker count (choose_chunk_size), so the
+    work really is split between the threads.
+    
+    Args:
+        size (int): Number of elements in the dataset
+        worker_counts (tuple): Thread counts to try
+        directory (str): Folder that holds the dataset files
+        
+    Returns:
+        list: One dict per worker count with 'workers', 'chunk_size', 'time'
+        and 'speedup'
+    """
+    from datasets import write_dataset, open_dataset
+    from parallel_scan import parallel_linear_search, choose_chunk_size
+    
+    os.makedirs(directory, exist_ok=True)
+    filename = os.path.join(directory, f"random_{size}_int32.bin")
+    if not os.path.exists(filename):
+        print(f"Writing dataset '{filename}'...")
+        seed_trial("Dataset", "random", size, 'int32')  # No-op unless seeded
+        write_dataset(filename, size)
+    data = open_dataset(filename)
+    
+    parallel_linear_search(data, 0)  # Warm-up: pull the file into the page cache
+    
+    rows = []
+    print(f"\n=== PARALLEL SCAN ({size:,} elements, target absent) ===")
+    print(f"{'Workers':>8} | {'Chunk size':>10} | {'Time (sec)':>12} | {'Speedup':>8}")
+    print("-" * 47)
+    
+    for workers in worker_counts:
+        chunk_size = choose_chunk_size(size, workers)
+        start_time = time.perf_counter()
+        index, comparisons = parallel_linear_search(data, 0, workers=workers,
+                                                    chunk_size=chunk_size)
+        execution_time = time.perf_counter() - start_time
+        
+        if index != -1 or comparisons != size:
+            raise AssertionError("Parallel scan returned a wrong answer")
+        baseline = rows[0]['time'] if rows else execution_time
+        row = {
+            'workers': workers,
+            'chunk_size': chunk_size,
+            'time': execution_time,
+            'speedup': baseline / execution_time if execution_time > 0 else float('inf')
+        }
+        rows.append(row)
+        print(f"{workers:>8} | {chunk_size:>10,} | {execution_time:>12.6f} | "
+              f"{row['speedup']:>7.2f}x")
+    
+    print()
+    return rows
+
+
+def run_parallel_pairs_comparison(size, worker_counts=(1, 2, 4, 8)):
+    """
+    Compare the serial pair search with the multi-process version.
+    
+    Every run uses the same input and must return exactly the serial answer.
+    
+    Args:
+        size (int): Number of elements (no 200-element cap here)
+        worker_counts (tuple): Process counts to try
+        
+    Returns:
+        list: One dict per worker count with 'workers', 'time' and 'speedup'
+        over the serial find_all_pairs_with_sum
+    """
+    from parallel_pairs import parallel_find_all_pairs_with_sum
+    
+    seed_trial("Parallel Pairs", size)  # No-op unless seeded
+    data = generate_test_data(size)
+    target_sum = data[0] + data[1] if size >= 2 else 10
+    
+    start_time = time.perf_counter()
+    expected = find_all_pairs_with_sum(data, target_sum)
+    serial_time = time.perf_counter() - start_time
+    
+    rows = []
+    print(f"\n=== PARALLEL PAIR SEARCH ({size:,} elements) ===")
+    print(f"{'Workers':>8} | {'Time (sec)':>12} | {'Speedup':>8}")
+    print("-" * 34)
+    print(f"{'serial':>8} | {serial_time:>12.6f} | {1.0:>7.2f}x")
+    
+    for workers in worker_counts:
+        start_time = time.perf_counter()
+        result = parallel_find_all_pairs_with_sum(data, target_sum, workers=workers)
+        execution_time = time.perf_counter() - start_time
+        
+        if result != expected:
+            raise AssertionError(f"Parallel pairs differ from serial with {workers} workers")
+        row = {
+            'workers': workers,
+            'time': execution_time,
+            'speedup': serial_time / execution_time if execution_time > 0 else float('inf')
+        }
+        rows.append(row)
+        print(f"{workers:>8} | {execution_time:>12.6f} | {row['speedup']:>7.2f}x")
+    
+    print()
+    return rows
+
+
+def run_sort_comparison(input_sizes, algorithms=None, distributions=None):
+    """
+    Time every sorting algorithm on every input distribution.
+    
+    Each cell sorts TRIALS_PER_SIZE fresh lists and keeps the average
+    time, plus the comparisons and moves of the first trial.
+    
+    Args:
+        input_sizes (list): Sizes to sort (O(n²) sorts stop at SORT_SIZE_CAPS)
+        algorithms (list): Names from SORTING_ALGORITHMS (defaults to all)
+        distributions (list): Distribution names (defaults to all of them)
+        
+    Returns:
+        list: One dict per (distribution, algorithm, size) with 'distribution',
+        'algorithm', 'size', 'time', 'comparisons' and 'moves' (None = not visible)
+    """
+    if algorithms is None:
+        algorithms = list(SORTING_ALGORITHMS)
+    if distributions is None:
+        distributions = list(DISTRIBUTIONS)
+    overhead = get_timer_overhead()
+    rows = []
+    
+    print(f"\n=== SORTING ALGORITHMS ===")
+    print(f"{'Distribution':>16} | {'Algorithm':>24} | {'Size':>8} | {'Time (sec)':>12} | "
+          f"{'Comparisons':>12} | {'Moves':>12}")
+    print("-" * 98)
+    
+    for distribution in distributions:
+        for algorithm_name in algorithms:
+            sort_function = SORTING_ALGORITHMS[algorithm_name]
+            cap = SORT_SIZE_CAPS.get(algorithm_name)
+            for size in input_sizes:
+                if cap is not None and size > cap:
+                    continue
+                times = []
+                for trial in range(TRIALS_PER_SIZE):
+                    seed_trial(algorithm_name, distribution, size, trial)  # No-op unless seeded
+                    data = generate_distribution(distribution, size)
+                    start_time = start_clock()
+                    result, comparisons, moves = sort_function(data)
+                    times.append(subtract_timer_overhead(stop_clock() - start_time, 1, overhead))
+                    if trial == 0:
+                        first = (data, comparisons, moves)
+                
+                data, comparisons, moves = first
+                if comparisons is None:
+                    comparisons = count_builtin_comparisons(data)
+                row = {
+                    'distribution': distribution,
+                    'algorithm': algorithm_name,
+                    'size': size,
+                    'time': sum(times) / len(times),
+                    'comparisons': comparisons,
+                    'moves': moves
+                }
+                rows.append(row)
+                moves_str = "n/a" if moves is None else f"{moves}"
+                print(f"{distribution:>16} | {algorithm_name:>24} | {size:>8} | "
+                      f"{row['time']:>12.6f} | {comparisons:>12} | {moves_str:>12}")
+    
+    print()
+    return rows
+
+
+def run_sort_search_pipeline(size, query_counts=(1, 10, 100, 1000, 10000),
+                             sort_algorithms=None, distribution=DEFAULT_DISTRIBUTION,
+                             sample_queries=200):
+    """
+    Cost "sort once, then binary search" against "linear search every time".
+    
+    Sorting is only worth it once enough queries share its cost:
+        sort + q × binary search  <  q × linear search
+    which happens from q = sort / (linear - binary) queries on - the
+    break-even point. Per-query times are averaged over sample_queries
+    uniform queries and then scaled to each query count; each sort time is
+    the average of TRIALS_PER_SIZE runs. Operation counts (comparisons,
+    plus moves for the sorts) are recorded too, outside the timed loops.
+    
+    Args:
+        size (int): Data size
+        query_counts (tuple): Numbers of queries to cost
+        sort_algorithms (list): Sorts to put in front of binary search
+            (defaults to all that accept this size)
+        distribution (str): Shape of the input data (see distributions.py)
+        sample_queries (int): Queries timed to find the per-query costs
+        
+    Returns:
+        list: One dict per sort with 'algorithm', 'sort_time', 'search_time'
+        and 'scan_time' (seconds per query), 'break_even' (queries, None if
+        sorting never pays off), 'totals' ({q: (pipeline, scan) seconds}),
+        'sort_operations' (comparisons + moves) and 'search_comparisons' and
+        'scan_comparisons' (average per query)
+    """
+    if sort_algorithms is None:
+        sort_algorithms = [name for name in SORTING_ALGORITHMS
+                           if size <= SORT_SIZE_CAPS.get(name, size)]
+    overhead = get_timer_overhead()
+    
+    seed_trial("Sort + Search", distribution, size)  # No-op unless seeded
+    data = generate_distribution(distribution, size)
+    sorted_data = sorted(data)
+    scan_targets = generate_query_targets('uniform', data, sample_queries)
+    search_targets = generate_query_targets('uniform', sorted_data, sample_queries,
+                                            sorted_data=True)
+    
+    start_time = start_clock()
+    for target in scan_targets:
+        linear_search_with_counter(data, target)
+    scan_time = subtract_timer_overhead(stop_clock() - start_time, sample_queries,
+                                        overhead) / sample_queries
+    
+    start_time = start_clock()
+    for target in search_targets:
+        binary_search_iterative(sorted_data, target)
+    search_time = subtract_timer_overhead(stop_clock() - start_time, sample_queries,
+                                          overhead) / sample_queries
+    
+    scan_comparisons = sum(linear_search_with_counter(data, target)[1]
+                           for target in scan_targets) / sample_queries
+    search_comparisons = sum(binary_search_with_counter(sorted_data, target)[1]
+                             for target in search_targets) / sample_queries
+    
+    print(f"\n=== SORT + SEARCH PIPELINE (size {size}, {distribution}) ===")
+    print(f"Linear search: {scan_time * 1e6:.2f} µs/query   "
+          f"Binary search: {search_time * 1e6:.2f} µs/query")
+    header = f"{'Sort':>24} | {'Sort (sec)':>10} | {'Break-even':>10}"
+    for q in query_counts:
+        header += f" | {'q=' + str(q):>10}"
+    print(header)
+    print("-" * len(header))
+    
+    rows = []
+    for algorithm_name in sort_algorithms:
+        sort_function = SORTING_ALGORITHMS[algorithm_name]
+        times = []
+        for trial in range(TRIALS_PER_SIZE):
+            start_time = start_clock()
+            result, comparisons, moves = sort_function(data)
+            times.append(subtract_timer_overhead(stop_clock() - start_time, 1, overhead))
+        sort_time = sum(times) / len(times)
+        if comparisons is None:  # Built-in sort: count its comparisons separately
+            comparisons, moves = count_builtin_comparisons(data), 0
+        
+        saving = scan_time - search_time  # Saved on every query once sorted
+        break_even = math.ceil(sort_time / saving) if saving > 0 else None
+        totals = {q: (sort_time + q * search_time, q * scan_time) for q in query_counts}
+        rows.append({
+            'algorithm': algorithm_name,
+            'sort_time': sort_time,
+            'search_time': search_time,
+            'scan_time': scan_time,
+            'break_even': break_even,
+            'totals': totals,
+            'sort_operations': comparisons + moves,
+            'search_comparisons': search_comparisons,
+            'scan_comparisons': scan_comparisons
+        })
+        
+        line = f"{algorithm_name:>24} | {sort_time:>10.6f} | "
+        line += f"{break_even if break_even is not None else 'never':>10}"
+        for q in query_counts:
+            pipeline, scan = totals[q]
+            line += f" | {'sort' if pipeline < scan else 'scan':>10}"
+        print(line)
+    
+    print("Each q column shows which is cheaper in total for that many queries.")
+    print()
+    return rows
+
+
+def run_planner_report(input_sizes=(10, 100, 1000, 10000), query_counts=(1, 10, 100, 1000),
+                       workload='absent', measure_limit=0.5, costs=None):
+    """
+    Check the search planner's predictions against real timings.
+    
+    The planner (planner.py) is calibrated once, then for every size and
+    query count we compare the strategy it picks with the one that is
+    actually fastest. Strategies predicted to take longer than
+    measure_limit seconds are not run (they would not win anyway).
+    
+    Args:
+        input_sizes (list): Data sizes to test
+        query_counts (tuple): Numbers of queries per batch
+        workload (str): Query workload (see query_workloads.py); 'absent'
+            matches the planner's worst-case cost for scanning
+        measure_limit (float): Skip strategies predicted to be slower than this
+        costs (dict): From calibrate_costs() (calibrated here if not given)
+        
+    Returns:
+        list: One dict per (size, queries) with 'size', 'queries', 'planned',
+        'predicted' and 'measured' (strategy -> seconds) and 'fastest'
+        (None when every strategy was over measure_limit)
+    """
+    if costs is None:
+        costs = calibrate_costs()
+    overhead = get_timer_overhead()
+    rows = []
+    
+    print(f"\n=== SEARCH PLANNER ({workload} queries) ===")
+    print(f"{'Size':>8} | {'Queries':>8} | {'Planned':>12} | {'Predicted':>12} | "
+          f"{'Measured':>12} | {'Fastest':>12}")
+    print("-" * 80)
+    
+    for size in input_sizes:
+        for query_count in query_counts:
+            plan = plan_search(size, query_count, costs)
+            seed_trial("Search Planner", workload, size, query_count)  # No-op unless seeded
+            data = generate_test_data(size)
+            targets = generate_query_targets(workload, data, query_count)
+            
+            measured = {}
+            for strategy in STRATEGIES:
+                if plan['totals'][strategy] > measure_limit:
+                    continue
+                start_time = start_clock()
+                run_strategy(strategy, data, targets)
+                measured[strategy] = subtract_timer_overhead(stop_clock() - start_time, 1,
+                                                             overhead)
+            fastest = min(measured, key=measured.get) if measured else None
+            
+            row = {
+                'size': size,
+                'queries': query_count,
+                'planned': plan['strategy'],
+                'predicted': plan['totals'],
+                'measured': measured,
+                'fastest': fastest
+            }
+            rows.append(row)
+            if plan['strategy'] in measured:
+                planned_time = f"{measured[plan['strategy']]:>12.6f}"
+            else:
+                planned_time = f"{'not measured':>12}"
+            print(f"{size:>8} | {query_count:>8} | {plan['strategy']:>12} | "
+                  f"{plan['totals'][plan['strategy']]:>12.6f} | "
+                  f"{planned_time} | {fastest or 'not measured':>12}")
+    
+    compared = [row for row in rows if row['fastest'] is not None]
+    agreed = sum(1 for row in compared if row['planned'] == row['fastest'])
+    print(f"Planner picked the fastest strategy in {agreed} of {len(compared)} measured cases.")
+    print()
+    return rows
+
+
+def run_workload_comparison(input_sizes):
+    """
+    Measure every sorted-data strategy on the same kind of mixed workload.
+    
+    Args:
+        input_sizes (list): Starting data sizes to test
+        
+    Returns:
+        list: One results dict per strategy (same format as run_algorithm_experiment)
+    """
+    all_results = []
+    for strategy in WORKLOAD_STRATEGIES:
+        all_results.append(run_algorithm_experiment(strategy, input_sizes))
+    print_throughput_table(all_results)
+    return all_results
+
+
+def print_throughput_table(results_list):
+    """
+    Print operations per second for each algorithm at each size.
+    
+    Args:
+        results_list (list): List of results from run_algorithm_experiment
+    """
+    sizes = results_list[0]['sizes']
+    
+    print(f"\n=== THROUGHPUT (operations per second) ===")
+    header = f"{'Size':>8} | " + " | ".join(f"{r['algorithm']:>20}" for r in results_list)
+    print(header)
+    print("-" * len(header))
+    
+    for i, size in enumerate(sizes):
+        cells = []
+        for results in results_list:
+            t = results['times'][i]
+            rate = results['operations'][i] / t if t > 0 else float('inf')
+            cells.append(f"{rate:>20,.0f}")
+        print(f"{size:>8} | " + " | ".join(cells))
+    print()
+
+
+def run_layout_comparison(input_sizes, query_count=100000):
+    """
+    Compare the Eytzinger layout against plain bisection on large sorted arrays.
+    
+    Both sides answer the same batch of queries with vectorized NumPy code:
+    plain bisection uses numpy.searchsorted on the sorted array, the other
+    walks an EytzingerIndex built from the same data. Sizes of 10^6 to 10^8
+    show where the cache-friendly layout starts to win.
+    
+    Args:
+        input_sizes (list): Array sizes to test
+        query_count (int): Number of targets looked up per size
+        
+    Returns:
+        list: One dict per size with 'size', 'bisect_ns', 'eytzinger_ns' (time
+        per query in nanoseconds) and 'speedup'
+    """
+    if not NUMPY_AVAILABLE:
+        print("⚠️  NumPy not available. Install with: uv add numpy")
+        return []
+    
+    seed_trial("Search Layout", query_count)  # No-op unless seeded
+    rng = np.random.default_rng(random.getrandbits(32))
+    rows = []
+    
+    print(f"\n=== SEARCH LAYOUT COMPARISON ({query_count:,} queries per size) ===")
+    print(f"{'Size':>12} | {'Bisect ns/q':>12} | {'Eytzinger ns/q':>15} | {'Speedup':>8}")
+    print("-" * 57)
+    
+    for size in input_sizes:
+        # Wide value range so most targets are distinct and about half are absent
+        data = np.sort(rng.integers(0, 2 * size, size=size, dtype=np.int64))
+        targets = rng.integers(0, 2 * size, size=query_count, dtype=np.int64)
+        index = EytzingerIndex(data)  # Building the layout is not timed
+        
+        start_time = time.perf_counter()
+        positions = np.searchsorted(data, targets)
+        clipped = np.minimum(positions, size - 1)
+        bisect_answers = np.where(data[clipped] == targets, positions, -1)
+        bisect_time = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        eytzinger_answers = index.search_batch(targets)
+        eytzinger_time = time.perf_counter() - start_time
+        
+        if not np.array_equal(bisect_answers, eytzinger_answers):
+            raise AssertionError(f"Eytzinger and bisection disagree at size {size}")
+        
+        row = {
+            'size': size,
+            'bisect_ns': bisect_time / query_count * 1e9,
+            'eytzinger_ns': eytzinger_time / query_count * 1e9,
+            'speedup': bisect_time / eytzinger_time if eytzinger_time > 0 else float('inf')
+        }
+        rows.append(row)
+        print(f"{size:>12,} | {row['bisect_ns']:>12.1f} | {row['eytzinger_ns']:>15.1f} | "
+              f"{row['speedup']:>7.2f}x")
+    
+    print()
+    return rows
+
+
+def run_cache_comparison(input_sizes, query_count=5000, capacity=128, policy='lru', skew=1.2):
+    """
+    Measure how much memoization helps when the same targets repeat.
+    
+    Each size runs the same skewed batch of targets through plain linear
+    search and through a MemoizedSearch wrapper around it.
+    
+    Args:
+        input_sizes (list): Data sizes to test
+        query_count (int): Number of targets per size
+        capacity (int): Maximum number of cached answers
+        policy (str): Cache eviction policy, 'lru' or 'lfu'
+        skew (float): Zipf skew of the target distribution
+        
+    Returns:
+        list: One dict per size with the times, speedup and cache stats
+    """
+    rows = []
+    
+    print(f"\n=== MEMOIZED LINEAR SEARCH ({policy.upper()}, capacity {capacity}, "
+          f"skew {skew}) ===")
+    print(f"{'Size':>8} | {'Plain (sec)':>12} | {'Cached (sec)':>12} | {'Speedup':>8} | "
+          f"{'Hit rate':>8} | {'Evictions':>9}")
+    print("-" * 74)
+    
+    for size in input_sizes:
+        seed_trial("Cache", policy, size)  # No-op unless seeded
+        data = VersionedList(generate_test_data(size))
+        targets = generate_skewed_targets(data, query_count, skew)
+        cached_search = MemoizedSearch(linear_search_with_counter, data, capacity, policy)
+        
+        start_time = time.perf_counter()
+        for target in targets:
+            linear_search_with_counter(data, target)
+        plain_time = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        for target in targets:
+            cached_search(target)
+        cached_time = time.perf_counter() - start_time
+        
+        row = {
+            'size': size,
+            'plain_time': plain_time,
+            'cached_time': cached_time,
+            'speedup': plain_time / cached_time if cached_time > 0 else float('inf'),
+            'cache_stats': cached_search.stats()
+        }
+        rows.append(row)
+        stats = row['cache_stats']
+        print(f"{size:>8} | {plain_time:>12.6f} | {cached_time:>12.6f} | "
+              f"{row['speedup']:>7.2f}x | {stats['hit_rate']:>8.1%} | {stats['evictions']:>9}")
+    
+    print()
+    return rows
+
+
+def run_bloom_comparison(input_sizes, query_count=2000, miss_fraction=0.9,
+                         false_positive_rate=DEFAULT_FALSE_POSITIVE_RATE):
+    """
+    Measure a Bloom filter prefilter in front of linear search on miss-heavy queries.
+    
+    Each size runs the same shuffled batch - miss_fraction absent targets,
+    the rest present - through plain linear search and through a
+    PrefilteredSearch. Building the filter is timed separately.
+    
+    Args:
+        input_sizes (list): Data sizes to test
+        query_count (int): Number of targets per size
+        miss_fraction (float): Share of targets that are not in the data
+        false_positive_rate (float): Wanted false-positive rate of the filter
+        
+    Returns:
+        list: One dict per size with the times, queries/sec, speedup,
+        build time and the filter stats (memory, observed false-positive rate)
+    """
+    rows = []
+    
+    print(f"\n=== BLOOM FILTER PREFILTER ({miss_fraction:.0%} misses, "
+          f"target false-positive rate {false_positive_rate:.2%}) ===")
+    print(f"{'Size':>8} | {'Plain q/sec':>12} | {'Filtered q/sec':>14} | {'Speedup':>8} | "
+          f"{'Build (sec)':>11} | {'Bytes':>7} | {'FP rate':>8}")
+    print("-" * 88)
+    
+    for size in input_sizes:
+        seed_trial("Bloom Filter", size)  # No-op unless seeded
+        data = generate_test_data(size)
+        miss_count = int(query_count * miss_fraction)
+        targets = (generate_query_targets('absent', data, miss_count) +
+                   generate_query_targets('uniform', data, query_count - miss_count))
+        random.shuffle(targets)
+        
+        start_time = start_clock()
+        filtered_search = PrefilteredSearch(linear_search_with_counter, data,
+                                            false_positive_rate)
+        build_time = stop_clock() - start_time
+        
+        start_time = start_clock()
+        for target in targets:
+            linear_search_with_counter(data, target)
+        plain_time = stop_clock() - start_time
+        
+        start_time = start_clock()
+        for target in targets:
+            filtered_search(target)
+        filtered_time = stop_clock() - start_time
+        
+        row = {
+            'size': size,
+            'plain_time': plain_time,
+            'filtered_time': filtered_time,
+            'plain_per_sec': query_count / plain_time if plain_time > 0 else float('inf'),
+            'filtered_per_sec': query_count / filtered_time if filtered_time > 0 else float('inf'),
+            'speedup': plain_time / filtered_time if filtered_time > 0 else float('inf'),
+            'build_time': build_time,
+            'filter_stats': filtered_search.stats()
+        }
+        rows.append(row)
+        stats = row['filter_stats']
+        print(f"{size:>8} | {row['plain_per_sec']:>12,.0f} | {row['filtered_per_sec']:>14,.0f} | "
+              f"{row['speedup']:>7.2f}x | {build_time:>11.6f} | {stats['nbytes']:>7} | "
+              f"{stats['false_positive_rate']:>8.2%}")
+    
+    print("Bytes is the filter's bit array; FP rate is the share of misses it let through.")
+    print()
+    return rows
+
+
+def percentile(values, fraction):
+    """
+    Return the value below which the given fraction of values fall.
+    
+    Uses the nearest-rank method: percentile(latencies, 0.99) is the
+    smallest latency that at least 99% of requests did not exceed.
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def run_service_comparison(size, request_count=5000, connections=32, op='search',
+                           max_batch_size=32, max_wait=0.0005):
+    """
+    Load-test the local query service with and without micro-batching.
+    
+    Both servers get the same data and the same targets from the same number
+    of concurrent clients, and must return the same answers.
+    
+    Args:
+        size (int): Number of elements the service searches
+        request_count (int): Total requests sent to each server
+        connections (int): Concurrent client connections
+        op (str): 'search' or 'pairs'
+        max_batch_size (int): Largest batch the batching server answers at once
+        max_wait (float): Longest time (seconds) a request waits for its batch
+        
+    Returns:
+        list: One dict per mode with throughput, p50/p99 latency and mean batch size
+    """
+    import asyncio
+    from query_service import QueryService, run_load
+    
+    seed_trial("Query Service", op, size)  # No-op unless seeded
+    data = generate_test_data(size)
+    if op == 'pairs':
+        targets = [random.randint(2, 2000) for _ in range(request_count)]
+    else:
+        targets = [random.randint(1, 1000) for _ in range(request_count)]
+    
+    async def measure(batching):
+        service = QueryService(data, max_batch_size, max_wait, batching=batching)
+        address = await service.start()
+        try:
+            latencies, wall_time = await run_load(address, targets, connections, op)
+        finally:
+            await service.stop()
+        batches = service.batch_sizes or [1] * len(latencies)
+        return {
+            'mode': 'micro-batch' if batching else 'no batching',
+            'throughput': len(latencies) / wall_time if wall_time > 0 else float('inf'),
+            'p50': percentile(latencies, 0.50),
+            'p99': percentile(latencies, 0.99),
+            'mean_batch': sum(batches) / len(batches)
+        }
+    
+    rows = []
+    print(f"\n=== QUERY SERVICE ({op}, {size:,} elements, {connections} clients) ===")
+    print(f"{'Mode':>12} | {'Req/sec':>10} | {'p50 (ms)':>9} | {'p99 (ms)':>9} | {'Batch':>6}")
+    print("-" * 58)
+    
+    for batching in (False, True):
+        row = asyncio.run(measure(batching))
+        rows.append(row)
+        print(f"{row['mode']:>12} | {row['throughput']:>10.0f} | {row['p50'] * 1000:>9.3f} | "
+              f"{row['p99'] * 1000:>9.3f} | {row['mean_batch']:>6.1f}")
+    
+    print()
+    return rows
+
+
+def run_backend_report(input_sizes=(100, 1000, 10000, 100000), problems=None,
+                       query_count=100, repeats=3):
+    """
+    Run every backend of every problem on identical inputs and compare them.
+    
+    For each size, all backends first answer the same queries untimed and
+    must agree (AssertionError otherwise). Then each backend's batch of
+    queries is timed, keeping the fastest of several repeats.
+    
+    Args:
+        input_sizes (tuple): Data sizes to test (Find All Pairs stops at
+            BACKEND_PAIRS_SIZE_CAP)
+        problems (list): Problem names from backends.BACKENDS (defaults to all)
+        query_count (int): Queries per batch (Find All Pairs uses one target)
+        repeats (int): Timed repeats per backend; the fastest is kept
+        
+    Returns:
+        dict: Problem -> {'sizes', 'times' (backend -> seconds per query),
+        'speedups' (backend -> python time / backend time), 'crossovers'
+        (backend -> first size from which it beats python for good, or None)}
+    """
+    if problems is None:
+        problems = list(BACKENDS)
+    report = {}
+    
+    for problem in problems:
+        backends = BACKENDS[problem]
+        sizes = [size for size in input_sizes
+                 if problem != "Find All Pairs" or size <= BACKEND_PAIRS_SIZE_CAP]
+        times = {backend: [] for backend in backends}
+        
+        for size in sizes:
+            seed_trial("Backend Report", problem, size)  # No-op unless seeded
+            data = generate_test_data(size)
+            if problem == "Binary Search":
+                data.sort()
+            if problem == "Array Access":
+                targets = [random.randrange(size) for _ in range(query_count)]
+            elif problem == "Find All Pairs":
+                targets = [data[0] + data[1]]
+            else:
+                targets = generate_query_targets('uniform', data, query_count)
+            
+            expected = None
+            for backend, (prepare, run) in backends.items():
+                prepared = prepare(data)
+                answers = [comparable_answer(problem, data, run(prepared, target))
+                           for target in targets]
+                if expected is None:
+                    expected = answers
+                elif answers != expected:
+                    raise AssertionError(f"{problem}: the {backend} backend disagrees with "
+                                         f"python at size {size}")
+                
+                best_time = None
+                for _ in range(repeats):
+                    start_time = start_clock()
+                    for target in targets:
+                        run(prepared, target)
+                    elapsed = stop_clock() - start_time
+                    if best_time is None or elapsed < best_time:
+                        best_time = elapsed
+                times[backend].append(best_time / len(targets))
+        
+        speedups = {backend: [base / t if t > 0 else float('inf')
+                              for base, t in zip(times['python'], backend_times)]
+                    for backend, backend_times in times.items()}
+        crossovers = {}
+        for backend in backends:
+            if backend == 'python':
+                continue
+            crossovers[backend] = None
+            for i, size in enumerate(sizes):
+                if all(speedup > 1 for speedup in speedups[backend][i:]):
+                    crossovers[backend] = size
+                    break
+        
+        report[problem] = {'sizes': sizes, 'times': times, 'speedups': speedups,
+                           'crossovers': crossovers}
+        print_backend_report(problem, report[problem])
+    
+    return report
+
+
+def print_backend_report(problem, entry):
+    """Print one problem's speedup matrix and crossover sizes."""
+    backends = list(entry['times'])
+    others = [backend for backend in backends if backend != 'python']
+    
+    print(f"\n=== BACKEND REPORT: {problem.upper()} (all backends agree) ===")
+    header = f"{'Size':>8} | {'python (µs)':>11}"
+    for backend in others:
+        header += f" | {backend:>8}"
+    print(header + f" | {'Fastest':>8}")
+    print("-" * len(header + " | Fastest  "))
+    
+    for i, size in enumerate(entry['sizes']):
+        row = f"{size:>8} | {entry['times']['python'][i] * 1e6:>11.3f}"
+        for backend in others:
+            row += f" | {entry['speedups'][backend][i]:>7.2f}x"
+        fastest = min(backends, key=lambda backend: entry['times'][backend][i])
+        print(row + f" | {fastest:>8}")
+    
+    for backend in others:
+        size = entry['crossovers'][backend]
+        if size is None:
+            print(f"{backend}: never beats python for good in this range")
+        else:
+            print(f"{backend}: beats python from n = {size:,}")
+    print()
+
+
+def run_access_benchmark(sizes=None, containers=None, patterns=None, access_count=50000,
+                         time_budget=0.2):
+    """
+    Time array_access on every container and index pattern at cache-crossing sizes.
+    
+    The indices are generated before timing, the fastest of TRIALS_PER_SIZE
+    passes is kept, and the timer overhead (one loop step and call per
+    access) is subtracted, so what remains is the access itself.
+    
+    Slow combinations (deque and linked-list indexing) run fewer accesses:
+    a short probe estimates the cost, and the timed passes get whatever is
+    left of time_budget seconds after the probe. A combination whose probe
+    alone uses up the budget is skipped.
+    
+    Each cell also names the memory level the container really fits in
+    (memory_level()): the size labels assume 8-byte elements, but list,
+    deque and linked list elements also carry an int object.
+    
+    Args:
+        sizes (list): (label, element count) pairs (defaults to boundary_sizes())
+        containers (list): Names from CONTAINERS (defaults to all)
+        patterns (list): Names from ACCESS_PATTERNS (defaults to all)
+        access_count (int): Accesses per combination (at most)
+        time_budget (float): Rough seconds allowed per combination
+        
+    Returns:
+        list: One dict per (container, pattern, size) with 'container',
+        'pattern', 'level', 'size', 'memory_level', 'accesses',
+        'ns_per_access' and 'skipped' (None, 'not built' or 'over budget';
+        ns_per_access is None when skipped)
+    """
+    if sizes is None:
+        sizes = boundary_sizes()
+    if containers is None:
+        containers = list(CONTAINERS)
+    if patterns is None:
+        patterns = ACCESS_PATTERNS
+    overhead = get_timer_overhead()
+    caches = cache_sizes()
+    probe_count = 64
+    rows = []
+    
+    for level, size in sizes:
+        values = list(range(size))
+        for container_name in containers:
+            cap = CONTAINER_SIZE_CAPS.get(container_name)
+            container = None
+            if cap is None or size <= cap:
+                container = CONTAINERS[container_name](values)
+            
+            for pattern in patterns:
+                row = {'container': container_name, 'pattern': pattern, 'level': level,
+                       'size': size,
+                       'memory_level': memory_level(container_name, size, caches),
+                       'accesses': 0, 'ns_per_access': None, 'skipped': None}
+                rows.append(row)
+                if container is None:
+                    row['skipped'] = 'not built'
+                    continue
+                
+                seed_trial("Access Benchmark", pattern, size)  # No-op unless seeded
+                indices = generate_index_stream(pattern, size, access_count)
+                
+                # Probe: stop early once it has used up the budget on its own
+                probed, probe_time = 0, 0.0
+                start_time = start_clock()
+                for index in indices[:probe_count]:
+                    array_access(container, index)
+                    probed += 1
+                    probe_time = stop_clock() - start_time
+                    if probe_time >= time_budget:
+                        break
+                per_access = max(probe_time / max(probed, 1), 1e-9)
+                count = min(access_count,
+                            int((time_budget - probe_time) / TRIALS_PER_SIZE / per_access))
+                if count < 1:
+                    row['skipped'] = 'over budget'
+                    continue
+                
+                elapsed = None
+                for trial in range(TRIALS_PER_SIZE):
+                    start_time = start_clock()
+                    for index in indices[:count]:
+                        array_access(container, index)
+                    trial_time = stop_clock() - start_time
+                    if elapsed is None or trial_time < elapsed:
+                        elapsed = trial_time  # Fastest pass: least disturbed by other programs
+                
+                elapsed = subtract_timer_overhead(elapsed, count, overhead)
+                row['accesses'] = count
+                row['ns_per_access'] = elapsed / count * 1e9
+            container = None  # Free the big container before building the next
+    
+    print("\n=== ARRAY ACCESS BY CONTAINER AND PATTERN (ns/access) ===")
+    header = f"{'Container':>12} | {'Pattern':>10}"
+    for level, size in sizes:
+        header += f" | {f'{level} {size:,}':>20}"
+    print(header)
+    print("-" * len(header))
+    for container_name in containers:
+        for pattern in patterns:
+            line = f"{container_name:>12} | {pattern:>10}"
+            for row in rows:
+                if row['container'] == container_name and row['pattern'] == pattern:
+                    if row['skipped'] == 'not built':
+                        cell = '-'
+                    elif row['skipped'] == 'over budget':
+                        cell = 'over budget'
+                    else:
+                        cell = f"{row['ns_per_access']:,.1f} ({row['memory_level']})"
+                    line += f" | {cell:>20}"
+            print(line)
+    print("Column sizes fill half of each cache level at 8 bytes per element; each "
+          "cell names the level the container really fits in.")
+    print("'-' = not built at that size; 'over budget' = the probe alone used "
+          "up time_budget.")
+    print()
+    return rows
+
+
+def run_stream_throughput(element_count=1000000, windows=(None, 1000, 100), chunk_size=100000):
+    """
+    Measure sustained elements/sec of the streaming pair detector.
+    
+    The stream is generated up front and fed in chunks, so only the
+    detector is timed. "Sustained" is the slowest chunk: a stream that must
+    keep up with its input is only as fast as its worst stretch.
+    
+    Args:
+        element_count (int): Total elements streamed per window setting
+        windows (tuple): Window sizes to test (None = no window)
+        chunk_size (int): Elements per timed chunk
+        
+    Returns:
+        list: One dict per window with 'window', 'elements_per_sec',
+        'sustained_per_sec' (slowest chunk) and 'pairs'
+    """
+    seed_trial("Stream Throughput", element_count)  # No-op unless seeded
+    values = generate_test_data(element_count)
+    target_sum = 1001  # The middle of the 2..2000 range of possible sums
+    rows = []
+    
+    print(f"\n=== STREAMING PAIR DETECTOR ({element_count:,} elements) ===")
+    print(f"{'Window':>10} | {'Elements/sec':>14} | {'Sustained/sec':>14} | {'Pairs':>14}")
+    print("-" * 62)
+    
+    for window in windows:
+        detector = StreamingPairDetector(target_sum, window)
+        total_time = 0.0
+        slowest_rate = None
+        
+        for start in range(0, element_count, chunk_size):
+            chunk = values[start:start + chunk_size]
+            start_time = start_clock()
+            detector.add_many(chunk)
+            elapsed = stop_clock() - start_time
+            total_time += elapsed
+            rate = len(chunk) / elapsed if elapsed > 0 else float('inf')
+            if slowest_rate is None or rate < slowest_rate:
+                slowest_rate = rate
+        
+        row = {
+            'window': window,
+            'elements_per_sec': element_count / total_time if total_time > 0 else float('inf'),
+            'sustained_per_sec': slowest_rate or 0.0,
+            'pairs': detector.total_pairs
+        }
+        rows.append(row)
+        label = "none" if window is None else f"{window:,}"
+        print(f"{label:>10} | {row['elements_per_sec']:>14,.0f} | "
+              f"{row['sustained_per_sec']:>14,.0f} | {row['pairs']:>14,}")
+    
+    print()
+    return rows
@@ -0,0 +1,166 @@
+"""
+Reproducible Runs - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+Two benchmark runs can only be compared if we know what was different
+between them. This module takes care of three things:
+
+1. Inputs: one run-level seed. Before every trial the global random
+   generator is re-seeded from (run seed, algorithm, size, trial), so a
+   trial gets the same data no matter which other experiments ran first.
+   All generators in this project (generate_test_data, distributions.py,
+   query_workloads.py, datasets.py) draw from that generator.
+2. CPU: optionally pin the process to chosen CPU cores (Linux only), so the
+   operating system does not move it around mid-measurement.
+3. Machine: an environment fingerprint (Python, CPU, governor, package
+   versions) saved next to the results.
+
+Re-running with the same seed reproduces identical inputs; any remaining
+difference comes from the code or the machine - and the fingerprint says
+which machine.
+"""
+
+import hashlib
+import os
+import platform
+import random
+import time
+from importlib import metadata
+
+FINGERPRINT_PACKAGES = ('numpy', 'matplotlib', 'pytest')
+GOVERNOR_FILE = "/sys/devices/system/cpu/cpu0/cpufreq/scaling_governor"
+
+_run_seed = None  # Set by set_run_seed; None means runs are not seeded
+_pinned_cpus = None  # Set by pin_to_cpus; None means the process is not pinned
+
+
+def set_run_seed(seed=None):
+    """
+    Start a reproducible run.
+
+    Args:
+        seed (int): The run seed, or None to pick a new random one
+
+    Returns:
+        int: The seed in use - print or save it to repeat the run later
+    """
+    global _run_seed
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    _run_seed = int(seed)
+    random.seed(_run_seed)
+    return _run_seed
+
+
+def get_run_seed():
+    """Return the current run seed, or None if the run is not seeded."""
+    return _run_seed
+
+
+def clear_run_seed():
+    """Stop seeding trials (the random generator keeps its current state)."""
+    global _run_seed
+    _run_seed = None
+
+
+def seed_trial(*labels):
+    """
+    Re-seed the random generator for one trial, if the run is seeded.
+
+    The trial seed is a hash of the run seed and the labels (for example
+    algorithm, distribution, size and trial number), so it does not depend
+    on what ran before.
+
+    Returns:
+        int: The trial seed, or None if the run is not seeded
+    """
+    if _run_seed is None:
+        return None
+    text = "|".join(str(label) for label in (_run_seed,) + labels)
+    trial_seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], 'little')
+    random.seed(trial_seed)
+    return trial_seed
+
+
+def pin_to_cpus(cpus):
+    """
+    Restrict this process to the given CPU cores.
+
+    Args:
+        cpus (list): Core numbers, e.g. [2] or [2, 3]
+
+    Returns:
+        list: The cores the process may now use, or None if this operating
+        system does not support pinning (e.g. macOS, Windows)
+    """
+    global _pinned_cpus
+    if not hasattr(os, 'sched_setaffinity'):
+        return None
+    os.sched_setaffinity(0, set(cpus))
+    _pinned_cpus = sorted(os.sched_getaffinity(0))
+    return _pinned_cpus
+
+
+def get_pinned_cpus():
+    """Return the cores set by pin_to_cpus, or None if the process is not pinned."""
+    return _pinned_cpus
+
+
+def _read_first_line(filename):
+    try:
+        with open(filename) as f:
+            return f.readline().strip() or None
+    except OSError:
+        return None
+
+
+def _cpu_model():
+    """The CPU model name from /proc/cpuinfo (Linux), or platform.processor()."""
+    try:
+        with open("/proc/cpuinfo") as f:
+            for line in f:
+                if line.startswith("model name"):
+                    return line.split(":", 1)[1].strip()
+    except OSError:
+        pass
+    return platform.processor() or None
+
+
+def _package_version(name):
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def environment_fingerprint():
+    """
+    Describe the machine and software a run used.
+
+    Fields that cannot be read on this system are None.
+
+    Returns:
+        dict: Python version and implementation, OS, CPU model, CPU count,
+        allowed cores, pinned cores (None unless pin_to_cpus was used),
+        frequency governor, clock resolution, package
+        versions, run seed and the time of the run
+    """
+    affinity = None
+    if hasattr(os, 'sched_getaffinity'):
+        affinity = sorted(os.sched_getaffinity(0))
+
+    return {
+        'python_version': platform.python_version(),
+        'python_implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'cpu_model': _cpu_model(),
+        'cpu_count': os.cpu_count(),
+        'cpu_affinity': affinity,
+        'pinned_cpus': _pinned_cpus,
+        'cpu_governor': _read_first_line(GOVERNOR_FILE),
+        'clock_resolution': time.get_clock_info('perf_counter').resolution,
+        'packages': {name: _package_version(name) for name in FINGERPRINT_PACKAGES},
+        'run_seed': _run_seed,
+        'recorded_at': time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    }
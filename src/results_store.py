@@ -0,0 +1,127 @@
+"""
+Compact Result Storage - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+A Python list of floats stores a pointer to a separate float object for
+every value: about 8 + 24 = 32 bytes per number. Ten million timing
+samples would need over 300 MB. An array('d') stores the raw 8-byte
+numbers one after another instead - a quarter of the memory - and NumPy
+can read that same memory directly, without copying (a "view").
+
+ExperimentResult keeps an experiment's results in such arrays:
+- the per-size summary: sizes, times, ratios, operations
+- every raw sample: size, time, operations and memory (bytes, 0 if not
+  measured), one entry per trial or per query
+
+It behaves like the results dictionary that run_algorithm_experiment
+returns (results['times'], results.get('profiles'), ...), so
+print_algorithm_results and the other report functions accept it as-is.
+"""
+
+from array import array
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+SUMMARY_KEYS = ('algorithm', 'sizes', 'times', 'ratios', 'operations', 'description')
+SAMPLE_COLUMNS = ('sample_sizes', 'sample_times', 'sample_operations', 'sample_memory')
+
+
+class ExperimentResult:
+    """Results of one experiment, stored in compact typed columns."""
+
+    __slots__ = SUMMARY_KEYS + SAMPLE_COLUMNS + ('extras',)
+
+    def __init__(self, algorithm, sizes=(), description=None, **extras):
+        """
+        Args:
+            algorithm (str): Name of the algorithm
+            sizes (list): Input sizes of the experiment
+            description (dict): From get_algorithm_description
+            **extras: Any other result fields (distribution, profiles, ...)
+        """
+        self.algorithm = algorithm
+        self.description = description
+        self.sizes = array('q', sizes)
+        self.times = array('d')
+        self.ratios = array('d')
+        self.operations = array('q')
+        self.sample_sizes = array('q')
+        self.sample_times = array('d')
+        self.sample_operations = array('q')
+        self.sample_memory = array('q')
+        self.extras = dict(extras)
+
+    # --- Dictionary-style access, so existing report code keeps working ---
+
+    def __getitem__(self, key):
+        if key in SUMMARY_KEYS:
+            return getattr(self, key)
+        return self.extras[key]
+
+    def __setitem__(self, key, value):
+        if key in SUMMARY_KEYS:
+            setattr(self, key, value)
+        else:
+            self.extras[key] = value
+
+    def __contains__(self, key):
+        return key in SUMMARY_KEYS or key in self.extras
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def keys(self):
+        return list(SUMMARY_KEYS) + list(self.extras)
+
+    # --- Raw samples ---
+
+    def append_sample(self, size, elapsed, operations, memory=0):
+        """Record one raw measurement (amortized O(1), no Python objects kept)."""
+        self.sample_sizes.append(size)
+        self.sample_times.append(elapsed)
+        self.sample_operations.append(int(operations))
+        self.sample_memory.append(memory)
+
+    @property
+    def sample_count(self):
+        return len(self.sample_times)
+
+    def numpy_views(self):
+        """
+        Zero-copy NumPy arrays over the sample columns.
+
+        The views share memory with the columns, so append_sample cannot
+        grow a column while a view of it is alive (Python raises
+        BufferError) - delete the views before recording more samples.
+
+        Returns:
+            dict: 'sizes', 'times', 'operations', 'memory' -> numpy.ndarray
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("NumPy is not installed. Install with: uv add numpy")
+        return {
+            'sizes': np.frombuffer(self.sample_sizes, dtype=np.int64),
+            'times': np.frombuffer(self.sample_times, dtype=np.float64),
+            'operations': np.frombuffer(self.sample_operations, dtype=np.int64),
+            'memory': np.frombuffer(self.sample_memory, dtype=np.int64),
+        }
+
+    def nbytes(self):
+        """Bytes used by all the numeric columns."""
+        columns = [self.sizes, self.times, self.ratios, self.operations]
+        columns += [getattr(self, name) for name in SAMPLE_COLUMNS]
+        return sum(len(column) * column.itemsize for column in columns)
+
+    def to_dict(self):
+        """Convert to a plain results dictionary of lists (e.g. for JSON)."""
+        results = {key: self[key] for key in SUMMARY_KEYS}
+        for key in ('sizes', 'times', 'ratios', 'operations'):
+            results[key] = results[key].tolist()
+        for name in SAMPLE_COLUMNS:
+            results[name] = getattr(self, name).tolist()
+        results.update(self.extras)
+        return results
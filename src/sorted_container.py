@@ -0,0 +1,290 @@
+"""
+Dynamic Sorted Container - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+Binary search needs a sorted list, but real data keeps changing. Re-sorting
+after every insert costs O(n log n), and even bisect.insort has to shift up to
+n elements in memory. This module keeps the data as a list of small sorted
+"buckets" instead, so an update only touches one short bucket.
+
+With buckets of about B elements, every operation costs roughly
+O(log n + B) for the search plus a shift inside a single bucket, which is
+sublinear in practice for the sizes used in this activity.
+
+It also provides a mixed insert/delete/query workload generator and three
+strategies the timer module can compare:
+1. Bucketed Sorted List - this container
+2. List + Insort - a plain sorted list updated with bisect.insort
+3. Re-sort Each Time - append to a plain list and call sort() after updates
+"""
+
+import bisect
+import random
+from itertools import accumulate
+
+from algorithms import binary_search_iterative
+
+DEFAULT_BUCKET_SIZE = 1000
+
+
+class BucketedSortedList:
+    """
+    A sorted collection made of many small sorted lists ("buckets").
+
+    The first element of every bucket is kept in a separate index list, so a
+    binary search over that index finds the right bucket, and a second binary
+    search inside the bucket finds the position.
+
+    Supports insert, delete, membership, rank and range queries.
+    """
+
+    def __init__(self, values=(), bucket_size=DEFAULT_BUCKET_SIZE):
+        """
+        Build the container from any iterable of values.
+
+        Args:
+            values: Initial values (any order)
+            bucket_size (int): Target number of elements per bucket
+        """
+        if bucket_size < 2:
+            raise ValueError("bucket_size must be at least 2")
+        self.bucket_size = bucket_size
+        ordered = sorted(values)
+        self.buckets = [ordered[i:i + bucket_size] for i in range(0, len(ordered), bucket_size)]
+        self.bucket_mins = [bucket[0] for bucket in self.buckets]
+        self.bucket_offsets = []  # Lazily rebuilt prefix counts used by rank()
+        self.size = len(ordered)
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        for bucket in self.buckets:
+            yield from bucket
+
+    def __repr__(self):
+        return f"BucketedSortedList({list(self)})"
+
+    def _find_bucket(self, value):
+        """Return the index of the bucket where value belongs."""
+        index = bisect.bisect_right(self.bucket_mins, value) - 1
+        return max(index, 0)
+
+    def insert(self, value):
+        """Add a value, keeping everything sorted. Duplicates are allowed."""
+        self.bucket_offsets = []
+        self.size += 1
+
+        if not self.buckets:
+            self.buckets.append([value])
+            self.bucket_mins.append(value)
+            return
+
+        b = self._find_bucket(value)
+        bucket = self.buckets[b]
+        bisect.insort(bucket, value)
+        self.bucket_mins[b] = bucket[0]
+
+        # Split a bucket that has grown too big into two halves
+        if len(bucket) > 2 * self.bucket_size:
+            half = len(bucket) // 2
+            self.buckets[b:b + 1] = [bucket[:half], bucket[half:]]
+            self.bucket_mins[b:b + 1] = [bucket[0], bucket[half]]
+
+    def delete(self, value):
+        """
+        Remove one copy of value.
+
+        Returns:
+            bool: True if a copy was removed, False if value was not present
+        """
+        if not self.buckets:
+            return False
+
+        b = self._find_bucket(value)
+        bucket = self.buckets[b]
+        i = bisect.bisect_left(bucket, value)
+        if i == len(bucket) or bucket[i] != value:
+            return False
+
+        del bucket[i]
+        self.size -= 1
+        self.bucket_offsets = []
+        if bucket:
+            self.bucket_mins[b] = bucket[0]
+        else:
+            del self.buckets[b]
+            del self.bucket_mins[b]
+        return True
+
+    def __contains__(self, value):
+        if not self.buckets:
+            return False
+        bucket = self.buckets[self._find_bucket(value)]
+        i = bisect.bisect_left(bucket, value)
+        return i < len(bucket) and bucket[i] == value
+
+    def _update_offsets(self):
+        """Rebuild the count of values before each bucket (at most once between updates)."""
+        if self.bucket_offsets:
+            return
+        self.bucket_offsets = list(accumulate(map(len, self.buckets), initial=0))
+
+    def rank(self, value):
+        """
+        Count how many stored values are strictly smaller than value.
+
+        Returns:
+            int: The rank, which is also the index value would be inserted at
+        """
+        if not self.buckets:
+            return 0
+        self._update_offsets()
+
+        # Equal values may start in an earlier bucket, so search by bisect_left
+        b = max(bisect.bisect_left(self.bucket_mins, value) - 1, 0)
+        return self.bucket_offsets[b] + bisect.bisect_left(self.buckets[b], value)
+
+    def count_range(self, low, high):
+        """Count the values v with low <= v <= high."""
+        if high < low:
+            return 0
+        return self.rank_right(high) - self.rank(low)
+
+    def rank_right(self, value):
+        """Count how many stored values are smaller than or equal to value."""
+        if not self.buckets:
+            return 0
+        self._update_offsets()
+        b = self._find_bucket(value)
+        return self.bucket_offsets[b] + bisect.bisect_right(self.buckets[b], value)
+
+    def range(self, low, high):
+        """Return a list of the values v with low <= v <= high, in order."""
+        result = []
+        if high < low or not self.buckets:
+            return result
+
+        b = max(bisect.bisect_left(self.bucket_mins, low) - 1, 0)
+        start = bisect.bisect_left(self.buckets[b], low)
+        for bucket in self.buckets[b:]:
+            if bucket[0] > high:
+                break
+            end = bisect.bisect_right(bucket, high)
+            result.extend(bucket[start:end])
+            start = 0
+        return result
+
+
+# Mixed workload generation and the three strategies being compared
+
+def generate_mixed_workload(initial_size, operation_count, update_fraction=0.5,
+                            min_val=1, max_val=1000):
+    """
+    Generate starting data plus a random mix of updates and lookups.
+
+    Deletes always name a value that is present at that point in the
+    workload, so every strategy does the same amount of real work.
+
+    Args:
+        initial_size (int): Number of values present before the workload starts
+        operation_count (int): Number of operations to generate
+        update_fraction (float): Share of operations that are inserts/deletes
+        min_val (int): Smallest possible value
+        max_val (int): Largest possible value
+
+    Returns:
+        tuple: (initial values, list of (operation, value) pairs) where the
+        operation is 'insert', 'delete', 'contains', 'rank' or 'range'
+    """
+    initial = [random.randint(min_val, max_val) for _ in range(initial_size)]
+    live = list(initial)
+    operations = []
+
+    for _ in range(operation_count):
+        if random.random() < update_fraction:
+            if live and random.random() < 0.5:
+                # Swap-remove a random live value so deletes always succeed
+                i = random.randrange(len(live))
+                live[i], live[-1] = live[-1], live[i]
+                operations.append(('delete', live.pop()))
+            else:
+                value = random.randint(min_val, max_val)
+                live.append(value)
+                operations.append(('insert', value))
+        else:
+            kind = random.choice(['contains', 'rank', 'range'])
+            operations.append((kind, random.randint(min_val, max_val)))
+
+    return initial, operations
+
+
+RANGE_WIDTH = 10  # 'range' operations ask for values in [value, value + RANGE_WIDTH]
+
+
+def run_workload_bucketed(container, operations):
+    """Run a mixed workload on a BucketedSortedList. Returns a result checksum."""
+    checksum = 0
+    for kind, value in operations:
+        if kind == 'insert':
+            container.insert(value)
+        elif kind == 'delete':
+            container.delete(value)
+        elif kind == 'contains':
+            checksum += value in container
+        elif kind == 'rank':
+            checksum += container.rank(value)
+        else:
+            checksum += container.count_range(value, value + RANGE_WIDTH)
+    return checksum
+
+
+def run_workload_insort(data, operations):
+    """Run a mixed workload on a plain sorted list updated with bisect.insort."""
+    checksum = 0
+    for kind, value in operations:
+        if kind == 'insert':
+            bisect.insort(data, value)
+        elif kind == 'delete':
+            del data[bisect.bisect_left(data, value)]
+        elif kind == 'contains':
+            checksum += binary_search_iterative(data, value) != -1
+        elif kind == 'rank':
+            checksum += bisect.bisect_left(data, value)
+        else:
+            checksum += (bisect.bisect_right(data, value + RANGE_WIDTH)
+                         - bisect.bisect_left(data, value))
+    return checksum
+
+
+def run_workload_resort(data, operations):
+    """Run a mixed workload that appends/removes freely and re-sorts before each lookup."""
+    needs_sort = False
+    checksum = 0
+    for kind, value in operations:
+        if kind == 'insert':
+            data.append(value)
+            needs_sort = True
+        elif kind == 'delete':
+            data.remove(value)
+        else:
+            if needs_sort:
+                data.sort()
+                needs_sort = False
+            if kind == 'contains':
+                checksum += binary_search_iterative(data, value) != -1
+            elif kind == 'rank':
+                checksum += bisect.bisect_left(data, value)
+            else:
+                checksum += (bisect.bisect_right(data, value + RANGE_WIDTH)
+                             - bisect.bisect_left(data, value))
+    return checksum
+
+
+# Strategy name -> (build the starting structure, run the workload on it).
+# Building is kept separate so the timer can leave it out of the measurement.
+WORKLOAD_STRATEGIES = {
+    "Bucketed Sorted List": (BucketedSortedList, run_workload_bucketed),
+    "List + Insort": (sorted, run_workload_insort),
+    "Re-sort Each Time": (sorted, run_workload_resort),
+}
@@ -0,0 +1,234 @@
+"""
+Sorting Algorithms - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+Binary search needs sorted data, and generate_sorted_test_data quietly pays
+for that with sorted(). If we only search a few times, that sort can cost
+more than every search put together - so sorting deserves its own
+measurements. This module has six ways to sort:
+
+- insertion_sort: O(n²), but O(n) on data that is already (nearly) sorted
+- merge_sort:     O(n log n) always, stable
+- heap_sort:      O(n log n) always, not stable
+- counting_sort:  O(n + k) for whole numbers in a small range of k values
+- radix_sort:     O(d·n) for non-negative whole numbers with d digits
+- builtin_sort:   Python's sorted() (Timsort), written in C
+
+Every function leaves its input alone and returns
+(sorted_list, comparisons, moves):
+- comparisons: how many times two elements were compared
+- moves:       how many times an element was written into a list
+Counting and radix sort never compare elements, so their comparisons
+are 0. Timsort runs inside C where we cannot see the moves, so those are
+None and count_builtin_comparisons counts its comparisons separately.
+"""
+
+RADIX_BASE = 10
+
+
+def insertion_sort(data):
+    """
+    Sort by growing a sorted prefix one element at a time.
+
+    Each new element is shifted left past every larger element before it,
+    so reversed data costs n(n-1)/2 comparisons but sorted data only n - 1.
+    """
+    result = list(data)
+    comparisons = 0
+    moves = 0
+    for i in range(1, len(result)):
+        value = result[i]
+        j = i - 1
+        while j >= 0:
+            comparisons += 1
+            if result[j] <= value:
+                break
+            result[j + 1] = result[j]  # Shift the larger element right
+            moves += 1
+            j -= 1
+        if j + 1 != i:
+            result[j + 1] = value
+            moves += 1
+    return (result, comparisons, moves)
+
+
+def merge_sort(data):
+    """
+    Sort by merging sorted runs of length 1, 2, 4, ... (bottom-up merge sort).
+
+    Every pass writes all n elements into the other buffer, and there are
+    about log₂(n) passes.
+    """
+    source = list(data)
+    n = len(source)
+    target = [None] * n
+    comparisons = 0
+    moves = 0
+    width = 1
+    while width < n:
+        for start in range(0, n, 2 * width):
+            middle = min(start + width, n)
+            end = min(start + 2 * width, n)
+            i, j, k = start, middle, start
+            while i < middle and j < end:
+                comparisons += 1
+                if source[i] <= source[j]:  # <= keeps equal elements in order
+                    target[k] = source[i]
+                    i += 1
+                else:
+                    target[k] = source[j]
+                    j += 1
+                k += 1
+            # One side ran out - copy the rest of the other side
+            target[k:end] = source[i:middle] if i < middle else source[j:end]
+            moves += end - start
+        source, target = target, source
+        width *= 2
+    return (source, comparisons, moves)
+
+
+def _sift_down(heap, root, end, counts):
+    """Move heap[root] down until it is larger than its children (counts = [comparisons, moves])."""
+    value = heap[root]
+    while True:
+        child = 2 * root + 1
+        if child >= end:
+            break
+        if child + 1 < end:
+            counts[0] += 1
+            if heap[child + 1] > heap[child]:
+                child += 1
+        counts[0] += 1
+        if heap[child] <= value:
+            break
+        heap[root] = heap[child]  # Pull the larger child up
+        counts[1] += 1
+        root = child
+    heap[root] = value
+    counts[1] += 1
+
+
+def heap_sort(data):
+    """
+    Sort by building a max-heap, then moving its top to the end n times.
+
+    Each removal sifts one element down at most log₂(n) levels, whatever
+    order the data started in.
+    """
+    heap = list(data)
+    n = len(heap)
+    counts = [0, 0]
+    for root in range(n // 2 - 1, -1, -1):
+        _sift_down(heap, root, n, counts)
+    for end in range(n - 1, 0, -1):
+        heap[0], heap[end] = heap[end], heap[0]  # Largest remaining goes to the back
+        counts[1] += 2
+        _sift_down(heap, 0, end, counts)
+    return (heap, counts[0], counts[1])
+
+
+def counting_sort(data, min_val=None, max_val=None):
+    """
+    Sort whole numbers by counting how many times each value appears.
+
+    Args:
+        data (list): Whole numbers
+        min_val (int): Smallest possible value (found from the data if None)
+        max_val (int): Largest possible value (found from the data if None)
+
+    The count table has one slot per possible value, so this only pays off
+    when the range is small - like the 1..1000 our generators use.
+    """
+    if not data:
+        return ([], 0, 0)
+    if min_val is None:
+        min_val = min(data)
+    if max_val is None:
+        max_val = max(data)
+
+    counts = [0] * (max_val - min_val + 1)
+    for value in data:
+        if not min_val <= value <= max_val:
+            raise ValueError(f"{value} is outside the range {min_val}..{max_val}")
+        counts[value - min_val] += 1
+
+    result = []
+    for offset, count in enumerate(counts):
+        if count:
+            result.extend([min_val + offset] * count)
+    return (result, 0, len(result))
+
+
+def radix_sort(data):
+    """
+    Sort non-negative whole numbers one digit at a time, last digit first.
+
+    Each pass deals the numbers into RADIX_BASE buckets by one digit,
+    keeping their order inside a bucket, so after the pass for the highest
+    digit the list is sorted. Numbers up to 1000 need 4 passes.
+    """
+    result = list(data)
+    if not result:
+        return (result, 0, 0)
+    if min(result) < 0:
+        raise ValueError("radix_sort only sorts non-negative numbers")
+
+    moves = 0
+    place = 1
+    largest = max(result)
+    while place <= largest:
+        buckets = [[] for _ in range(RADIX_BASE)]
+        for value in result:
+            buckets[(value // place) % RADIX_BASE].append(value)
+        result = [value for bucket in buckets for value in bucket]
+        moves += len(result)
+        place *= RADIX_BASE
+    return (result, 0, moves)
+
+
+def builtin_sort(data):
+    """
+    Sort with Python's sorted() (Timsort).
+
+    Timsort finds runs that are already in order and merges them, so sorted
+    and reversed data take O(n). Its work happens in C, so comparisons and
+    moves are returned as None - see count_builtin_comparisons.
+    """
+    return (sorted(data), None, None)
+
+
+class _CountedValue:
+    """Wraps a value and counts every < comparison made on it."""
+
+    __slots__ = ('value', 'counter')
+
+    def __init__(self, value, counter):
+        self.value = value
+        self.counter = counter
+
+    def __lt__(self, other):
+        self.counter[0] += 1
+        return self.value < other.value
+
+
+def count_builtin_comparisons(data):
+    """
+    Count the comparisons sorted() makes on this data.
+
+    Wrapping every value slows the sort down a lot, so run this separately
+    from any timing.
+    """
+    counter = [0]
+    sorted([_CountedValue(value, counter) for value in data])
+    return counter[0]
+
+
+# Algorithm name -> sort function
+SORTING_ALGORITHMS = {
+    "Insertion Sort": insertion_sort,
+    "Merge Sort": merge_sort,
+    "Heap Sort": heap_sort,
+    "Counting Sort": counting_sort,
+    "Radix Sort": radix_sort,
+    "Built-in Sort (Timsort)": builtin_sort,
+}
@@ -0,0 +1,113 @@
+"""
+Streaming Pair-Sum Detection - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+find_all_pairs_with_sum needs the whole list up front. When numbers arrive
+one at a time (sensor readings, prices, log events) and never stop, we
+want to know about new pairs the moment they appear.
+
+The trick is the same one count_pairs_with_sum uses: remember how many
+times each value has been seen. When a new value v arrives, every earlier
+copy of (target - v) forms a pair with it, so the number of new pairs is
+a single dictionary lookup - O(1) per element, however long the stream.
+
+Sliding window: with window=w, only the w most recent elements count.
+Before a new element is added, the oldest one is dropped if the window is
+full, so new pairs are formed with the previous w - 1 elements. Dropping
+is also O(1): subtract one from its count.
+"""
+
+from collections import deque
+
+
+class StreamingPairDetector:
+    """Counts pairs that sum to a target in an unbounded stream of numbers."""
+
+    def __init__(self, target_sum, window=None, on_pair=None):
+        """
+        Args:
+            target_sum: The sum we're looking for
+            window (int): Only pair elements that are less than this many
+                positions apart (None = pair with everything seen so far)
+            on_pair: Optional function called as on_pair(earlier_value, value,
+                count) whenever a new element completes 'count' pairs
+        """
+        if window is not None and window < 1:
+            raise ValueError("window must be at least 1")
+        self.target_sum = target_sum
+        self.window = window
+        self.on_pair = on_pair
+        self.counts = {}  # value -> copies currently held
+        self.recent = deque() if window is not None else None
+        self.elements_seen = 0
+        self.total_pairs = 0   # Every pair ever formed
+        self.active_pairs = 0  # Pairs whose two elements are both still held
+
+    def add(self, value):
+        """
+        Take in one element.
+
+        Returns:
+            int: Number of new pairs this element completes
+        """
+        counts = self.counts
+
+        if self.recent is not None and len(self.recent) == self.window:
+            self._evict()  # The window holds the last 'window' elements
+
+        partner = self.target_sum - value
+        new_pairs = counts.get(partner, 0)
+        counts[value] = counts.get(value, 0) + 1
+        if self.recent is not None:
+            self.recent.append(value)
+
+        self.elements_seen += 1
+        if new_pairs:
+            self.total_pairs += new_pairs
+            self.active_pairs += new_pairs
+            if self.on_pair is not None:
+                self.on_pair(partner, value, new_pairs)
+        return new_pairs
+
+    def add_many(self, values):
+        """
+        Take in a batch of elements, in order.
+
+        Returns:
+            int: Number of new pairs the batch completes
+        """
+        if self.recent is not None or self.on_pair is not None:
+            before = self.total_pairs
+            for value in values:
+                self.add(value)
+            return self.total_pairs - before
+
+        # No window and no callback: the same steps as add(), with the
+        # dictionary and target kept in local variables for speed
+        counts = self.counts
+        target_sum = self.target_sum
+        new_pairs = 0
+        seen = 0
+        for value in values:
+            new_pairs += counts.get(target_sum - value, 0)
+            counts[value] = counts.get(value, 0) + 1
+            seen += 1
+
+        self.elements_seen += seen
+        self.total_pairs += new_pairs
+        self.active_pairs += new_pairs
+        return new_pairs
+
+    def _evict(self):
+        """Drop the oldest element of the window and the pairs it was part of."""
+        old = self.recent.popleft()
+        remaining = self.counts[old] - 1
+        if remaining:
+            self.counts[old] = remaining
+        else:
+            del self.counts[old]  # Keeps the dictionary as small as the window
+        self.active_pairs -= self.counts.get(self.target_sum - old, 0)
+
+    def __len__(self):
+        """Number of elements currently held (all of them without a window)."""
+        return len(self.recent) if self.recent is not None else self.elements_seen
@@ -4,8 +4,14 @@ CS101 Fall 2025 - Build a Better Algorithm
 
 This module provides timing and analysis tools for the four algorithms.
 Students will use these functions to measure and understand algorithm complexity.
+The bigger comparison reports built on top of it live in reports.py.
 """
 
+import cProfile
+import json
+import math
+import os
+import random
 import time
 
 try:
@@ -16,42 +22,109 @@ except ImportError:
 
 from algorithms import (
     array_access, binary_search_iterative, linear_search_with_counter,
-    find_all_pairs_with_sum, generate_test_data, generate_sorted_test_data
+    find_all_pairs_with_sum, count_pairs_with_sum, verify_k_sums
 )
+from distributions import (
+    generate_distribution, pick_target, pick_target_sum, DEFAULT_DISTRIBUTION
+)
+from ksum import find_all_k_sums
+from profiling import save_profile, DEFAULT_PROFILE_DIR
+from verification import ResultVerifier
+from results_store import ExperimentResult
+from reproducibility import seed_trial, get_run_seed, environment_fingerprint
+from sorting import SORTING_ALGORITHMS, count_builtin_comparisons
+from sorted_container import generate_mixed_workload, WORKLOAD_STRATEGIES
+from checkpoint import get_cell, record_cell, save_checkpoint, DEFAULT_CHECKPOINT_FILE
+
+TRIALS_PER_SIZE = 3  # Run multiple times for better accuracy
+WORKLOAD_OPERATIONS = 2000  # Operations per trial for the mixed-workload strategies
+
+# Sorts that are O(n²) -> largest size they are timed on
+SORT_SIZE_CAPS = {"Insertion Sort": 2000}
+
+# A time must be this many times the clock's own cost before we trust it
+RELIABLE_OVERHEAD_MULTIPLE = 100
+_timer_overhead = None  # Filled in by get_timer_overhead on first use
+
+# k-sum algorithm -> (group size k, engine, size cap to keep timing reasonable)
+K_SUM_ALGORITHMS = {
+    "Find All Triples (Brute Force)": (3, 'brute', 150),
+    "Find All Triples (Hash)": (3, 'hash', 1000),
+    "Find All Quadruples (Brute Force)": (4, 'brute', 50),
+    "Find All Quadruples (Meet in Middle)": (4, 'meet', 200),
+}
 
 
-def run_algorithm_experiment(algorithm_name, input_sizes):
+def run_algorithm_experiment(algorithm_name, input_sizes, checkpoint=None,
+                             checkpoint_file=DEFAULT_CHECKPOINT_FILE,
+                             distribution=DEFAULT_DISTRIBUTION, profile=False,
+                             profile_dir=DEFAULT_PROFILE_DIR, verify=False,
+                             keep_samples=False):
     """
     Run timing experiments on a specific algorithm with different input sizes.
     
     Args:
         algorithm_name (str): Name of algorithm to test
         input_sizes (list): List of input sizes to test
+        checkpoint (dict): Optional checkpoint from checkpoint.py; finished cells
+            are reused and every new cell is saved to checkpoint_file
+        checkpoint_file (str): Where to save the checkpoint after each cell
+        distribution (str): Shape of the input data (see distributions.py)
+        profile (bool): Also profile one extra, untimed trial per size and
+            save it to profile_dir (see profiling.py)
+        profile_dir (str): Folder for the profile files
+        verify (bool): Check every answer against a ResultVerifier and raise
+            AssertionError on a wrong one (checking is never timed)
+        keep_samples (bool): Return an ExperimentResult that also keeps every
+            trial's raw time and operation count (see results_store.py)
         
     Returns:
-        dict: Results including times, ratios, and analysis
+        dict: Results including times, ratios, and analysis (an
+        ExperimentResult, which works like the dict, if keep_samples is True)
     """
     print(f"\n{'='*50}")
     print(f"TESTING: {algorithm_name.upper()}")
     print(f"{'='*50}")
     
-    results = {
-        'algorithm': algorithm_name,
-        'sizes': input_sizes,
-        'times': [],
-        'ratios': [],
-        'operations': [],  # For algorithms that count operations
-        'description': get_algorithm_description(algorithm_name)
-    }
+    if keep_samples:
+        results = ExperimentResult(algorithm_name, input_sizes,
+                                   get_algorithm_description(algorithm_name))
+    else:
+        results = {
+            'algorithm': algorithm_name,
+            'sizes': input_sizes,
+            'times': [],
+            'ratios': [],
+            'operations': [],  # For algorithms that count operations
+            'description': get_algorithm_description(algorithm_name)
+        }
+    results['distribution'] = distribution
+    results['seed'] = get_run_seed()
+    results['environment'] = environment_fingerprint()
+    results['timer_overhead'] = get_timer_overhead()
+    results['below_resolution'] = []  # True where the time is too small to trust
+    if profile:
+        results['profiles'] = []
     
     for i, size in enumerate(input_sizes):
         print(f"Running with input size: {size}...")
         
         # Run the specific algorithm
-        execution_time, operation_count = run_single_algorithm(algorithm_name, size)
+        execution_time, operation_count = run_single_algorithm(
+            algorithm_name, size, checkpoint, checkpoint_file, distribution, verify,
+            results if keep_samples else None
+        )
         
         results['times'].append(execution_time)
         results['operations'].append(operation_count)
+        results['below_resolution'].append(
+            execution_time < results['timer_overhead']['reliable_time']
+        )
+        
+        if profile:
+            results['profiles'].append(
+                run_profiled_trial(algorithm_name, size, distribution, profile_dir)
+            )
         
         # Calculate ratio compared to previous size
         if i > 0:
@@ -63,73 +136,66 @@ def run_algorithm_experiment(algorithm_name, input_sizes):
     return results
 
 
-def run_single_algorithm(algorithm_name, size):
+def results_label(results):
+    """Name a results dict by its algorithm, plus its distribution if not uniform."""
+    distribution = results.get('distribution', DEFAULT_DISTRIBUTION)
+    if distribution == DEFAULT_DISTRIBUTION:
+        return results['algorithm']
+    return f"{results['algorithm']} [{distribution}]"
+
+
+def run_single_algorithm(algorithm_name, size, checkpoint=None,
+                         checkpoint_file=DEFAULT_CHECKPOINT_FILE,
+                         distribution=DEFAULT_DISTRIBUTION, verify=False, samples=None):
     """
     Run a single algorithm with the given input size.
     
     Args:
         algorithm_name (str): Name of algorithm to run
         size (int): Size of input data
+        checkpoint (dict): Optional checkpoint; trials already in it are skipped
+        checkpoint_file (str): Where to save the checkpoint after each trial
+        distribution (str): Shape of the input data (see distributions.py)
+        verify (bool): Check each new trial's answer (see run_single_trial)
+        samples (ExperimentResult): If given, every trial is also recorded here
         
     Returns:
-        tuple: (execution_time, operation_count)
+        tuple: (execution_time, operation_count), with the timer's own
+        overhead subtracted from the time (see calibrate_timer_overhead)
     """
-    trials = 3  # Run multiple times for better accuracy
+    overhead = get_timer_overhead()
     times = []
     operation_counts = []
     
-    for _ in range(trials):
-        if algorithm_name == "Array Access":
-            # Test array access with random indices
-            data = generate_test_data(size)
-            indices_to_test = [size // 4, size // 2, size * 3 // 4]  # Test a few positions
-            
-            start_time = time.time()
-            for index in indices_to_test:
-                array_access(data, index)
-            end_time = time.time()
-            
-            times.append(end_time - start_time)
-            operation_counts.append(len(indices_to_test))  # Number of accesses
-            
-        elif algorithm_name == "Binary Search":
-            # Test binary search on sorted data
-            data = generate_sorted_test_data(size)
-            target = data[size * 3 // 4] if size > 0 else 1  # Search for element that exists
-            
-            start_time = time.time()
-            result = binary_search_iterative(data, target)
-            end_time = time.time()
-            
-            times.append(end_time - start_time)
-            # Estimate operations: log₂(size) comparisons
-            import math
-            operation_counts.append(math.ceil(math.log2(size)) if size > 0 else 1)
-            
-        elif algorithm_name == "Linear Search":
-            # Test linear search (worst case - search for last element)
-            data = generate_test_data(size)
-            target = data[-1] if size > 0 else 1  # Last element (worst case)
-            
-            start_time = time.time()
-            result_index, comparisons = linear_search_with_counter(data, target)
-            end_time = time.time()
-            
-            times.append(end_time - start_time)
-            operation_counts.append(comparisons)
-            
-        elif algorithm_name == "Find All Pairs":
-            # Test pair finding (use smaller size to avoid long execution)
-            actual_size = min(size, 200)  # Cap at 200 to keep reasonable timing
-            data = generate_test_data(actual_size)
-            target_sum = data[0] + data[1] if actual_size >= 2 else 10
-            
-            start_time = time.time()
-            pairs, comparisons = find_all_pairs_with_sum(data, target_sum)
-            end_time = time.time()
-            
-            times.append(end_time - start_time)
-            operation_counts.append(comparisons)
+    # Keep cells from different distributions apart in the checkpoint
+    cell_name = algorithm_name
+    if distribution != DEFAULT_DISTRIBUTION:
+        cell_name = f"{algorithm_name} [{distribution}]"
+    
+    for trial in range(TRIALS_PER_SIZE):
+        saved_cell = None
+        if checkpoint is not None:
+            saved_cell = get_cell(checkpoint, cell_name, size, trial)
+        
+        if saved_cell is not None:
+            # Finished before the interrupt - reuse the saved measurement
+            execution_time, operation_count = saved_cell
+        else:
+            seed_trial(algorithm_name, distribution, size, trial)  # No-op unless seeded
+            execution_time, operation_count = run_single_trial(algorithm_name, size, distribution,
+                                                                 verify=verify)
+            if checkpoint is not None:
+                record_cell(checkpoint, cell_name, size, trial,
+                            execution_time, operation_count)
+                save_checkpoint(checkpoint, checkpoint_file)
+        
+        # Checkpoints keep raw times; the correction is applied here
+        calls = timed_call_count(algorithm_name, operation_count)
+        execution_time = subtract_timer_overhead(execution_time, calls, overhead)
+        times.append(execution_time)
+        if samples is not None:
+            samples.append_sample(size, execution_time, operation_count)
+        operation_counts.append(operation_count)
     
     # Return average time and typical operation count
     avg_time = sum(times) / len(times)
@@ -138,6 +204,350 @@ def run_single_algorithm(algorithm_name, size):
     return avg_time, typical_operations
 
 
+def run_profiled_trial(algorithm_name, size, distribution=DEFAULT_DISTRIBUTION,
+                       directory=DEFAULT_PROFILE_DIR):
+    """
+    Profile one extra trial and save its profile files.
+    
+    The trial's time is not used anywhere, so profiler overhead never ends
+    up in the reported measurements. The random generator is put back
+    afterwards, so profiling never changes the inputs of later trials
+    (a resumed sweep gets the same data as an uninterrupted one).
+    
+    Returns:
+        dict: File paths and hot functions, from profiling.save_profile
+    """
+    profiler = cProfile.Profile()
+    random_state = random.getstate()
+    try:
+        seed_trial(algorithm_name, distribution, size, 0)  # Same input as the first trial
+        run_single_trial(algorithm_name, size, distribution, profiler)
+    finally:
+        random.setstate(random_state)
+    
+    name = algorithm_name
+    if distribution != DEFAULT_DISTRIBUTION:
+        name = f"{algorithm_name} {distribution}"
+    return save_profile(profiler, name, size, directory)
+
+
+def calibrate_timer_overhead(repeats=2000):
+    """
+    Measure how much time the measuring itself takes.
+    
+    Reading the clock is not free, and neither is one turn of a Python loop
+    with a function call in it. For very fast algorithms (Array Access takes
+    well under a microsecond) these costs are as big as the work, so we
+    measure them once and subtract them from every sample.
+    
+    Args:
+        repeats (int): How many empty timings and no-op calls to measure
+        
+    Returns:
+        dict: 'clock_cost' (an empty timed region), 'call_cost' (one loop
+        iteration plus one function call), 'resolution' (the clock's tick)
+        and 'reliable_time' (the smallest time we trust), all in seconds
+    """
+    def no_op(data, index):
+        return None
+    
+    empty_regions = []
+    for _ in range(repeats):
+        start_time = start_clock()
+        end_time = stop_clock()
+        empty_regions.append(end_time - start_time)
+    empty_regions.sort()
+    clock_cost = empty_regions[len(empty_regions) // 2]  # Median
+    
+    data = [0]
+    indices = [0] * repeats
+    best_loop = None
+    for _ in range(5):
+        start_time = start_clock()
+        for index in indices:
+            no_op(data, index)
+        elapsed = stop_clock() - start_time
+        if best_loop is None or elapsed < best_loop:
+            best_loop = elapsed
+    call_cost = max(0.0, (best_loop - clock_cost) / repeats)
+    
+    resolution = time.get_clock_info('perf_counter').resolution
+    return {
+        'clock_cost': clock_cost,
+        'call_cost': call_cost,
+        'resolution': resolution,
+        'reliable_time': RELIABLE_OVERHEAD_MULTIPLE * max(clock_cost, resolution)
+    }
+
+
+def get_timer_overhead():
+    """Return the timer overhead, calibrating it the first time it is needed."""
+    global _timer_overhead
+    if _timer_overhead is None:
+        _timer_overhead = calibrate_timer_overhead()
+    return _timer_overhead
+
+
+def timed_call_count(algorithm_name, operation_count):
+    """
+    How many loop-and-call steps a trial's timed region contains.
+    
+    Array Access loops over its indices and calls array_access once per
+    index; every other algorithm is a single call.
+    """
+    if algorithm_name == "Array Access":
+        return operation_count
+    return 1
+
+
+def subtract_timer_overhead(elapsed, calls, overhead):
+    """Remove the clock cost and the cost of 'calls' empty calls from a time."""
+    return max(0.0, elapsed - overhead['clock_cost'] - calls * overhead['call_cost'])
+
+
+def check_answer(correct, algorithm_name, target):
+    """Raise AssertionError if a verified answer was wrong."""
+    if not correct:
+        raise AssertionError(f"{algorithm_name} returned a wrong answer for target {target}")
+
+
+def start_clock(profiler=None):
+    """Start timing (and profiling, if a profiler is given); returns the start time."""
+    if profiler is not None:
+        profiler.enable()
+    return time.perf_counter()
+
+
+def stop_clock(profiler=None):
+    """Stop timing (and profiling); returns the end time."""
+    end_time = time.perf_counter()
+    if profiler is not None:
+        profiler.disable()
+    return end_time
+
+
+def run_single_trial(algorithm_name, size, distribution=DEFAULT_DISTRIBUTION, profiler=None,
+                     verify=False):
+    """
+    Run one timed trial of an algorithm with freshly generated data.
+    
+    Args:
+        algorithm_name (str): Name of algorithm to run
+        size (int): Size of input data
+        distribution (str): Shape of the input data (see distributions.py)
+        profiler (cProfile.Profile): Optional profiler, switched on only while
+            the algorithm itself runs (data generation is not recorded)
+        verify (bool): After timing, check the answer of Binary Search, Linear
+            Search, Find All Pairs and Count Pairs; raises AssertionError if wrong
+        
+    Returns:
+        tuple: (execution_time, operation_count)
+    """
+    if algorithm_name == "Array Access":
+        # Test array access with random indices
+        data = generate_distribution(distribution, size)
+        indices_to_test = [size // 4, size // 2, size * 3 // 4]  # Test a few positions
+        
+        start_time = start_clock(profiler)
+        for index in indices_to_test:
+            array_access(data, index)
+        end_time = stop_clock(profiler)
+        
+        return end_time - start_time, len(indices_to_test)  # Number of accesses
+        
+    elif algorithm_name == "Binary Search":
+        # Test binary search on sorted data
+        data = sorted(generate_distribution(distribution, size))
+        target = pick_target(data, distribution, size * 3 // 4)  # Exists unless adversarial
+        verifier = ResultVerifier(data) if verify else None  # One per dataset, built untimed
+        
+        start_time = start_clock(profiler)
+        result = binary_search_iterative(data, target)
+        end_time = stop_clock(profiler)
+        
+        if verify:
+            check_answer(verifier.check_binary_search(target, result),
+                         algorithm_name, target)
+        
+        # Estimate operations: log₂(size) comparisons
+        return end_time - start_time, math.ceil(math.log2(size)) if size > 0 else 1
+        
+    elif algorithm_name == "Linear Search":
+        # Test linear search (worst case - search for last element)
+        data = generate_distribution(distribution, size)
+        target = pick_target(data, distribution, -1)  # Last element, or absent if adversarial
+        verifier = ResultVerifier(data) if verify else None
+        
+        start_time = start_clock(profiler)
+        result_index, comparisons = linear_search_with_counter(data, target)
+        end_time = stop_clock(profiler)
+        
+        if verify:
+            check_answer(verifier.check_linear_search(
+                target, (result_index, comparisons)), algorithm_name, target)
+        
+        return end_time - start_time, comparisons
+        
+    elif algorithm_name == "Find All Pairs":
+        # Test pair finding (use smaller size to avoid long execution)
+        actual_size = min(size, 200)  # Cap at 200 to keep reasonable timing
+        data = generate_distribution(distribution, actual_size)
+        target_sum = pick_target_sum(data, 2, distribution)
+        verifier = ResultVerifier(data) if verify else None
+        
+        start_time = start_clock(profiler)
+        pairs, comparisons = find_all_pairs_with_sum(data, target_sum)
+        end_time = stop_clock(profiler)
+        
+        if verify:
+            check_answer(verifier.check_pairs(target_sum, (pairs, comparisons)),
+                         algorithm_name, target_sum)
+        
+        return end_time - start_time, comparisons
+        
+    elif algorithm_name == "Count Pairs":
+        # Count-only pair search - no size cap needed, it never builds the pairs
+        data = generate_distribution(distribution, size)
+        target_sum = pick_target_sum(data, 2, distribution)
+        verifier = ResultVerifier(data) if verify else None
+        
+        start_time = start_clock(profiler)
+        pair_count, operations = count_pairs_with_sum(data, target_sum)
+        end_time = stop_clock(profiler)
+        
+        if verify:
+            check_answer(verifier.check_pair_count(target_sum, pair_count),
+                         algorithm_name, target_sum)
+        
+        return end_time - start_time, operations
+        
+    elif algorithm_name in K_SUM_ALGORITHMS:
+        # Test k-sum search (capped like Find All Pairs)
+        k, engine, size_cap = K_SUM_ALGORITHMS[algorithm_name]
+        actual_size = min(size, size_cap)
+        data = generate_distribution(distribution, actual_size)
+        target_sum = pick_target_sum(data, k, distribution)
+        
+        start_time = start_clock(profiler)
+        groups, comparisons = find_all_k_sums(data, k, target_sum, engine)
+        end_time = stop_clock(profiler)
+        
+        if verify:
+            check_answer(verify_k_sums(data, k, target_sum, (groups, comparisons)),
+                         algorithm_name, target_sum)
+        
+        return end_time - start_time, comparisons
+        
+    elif algorithm_name in SORTING_ALGORITHMS:
+        # Sort a fresh copy of the data; operations are element comparisons
+        actual_size = min(size, SORT_SIZE_CAPS.get(algorithm_name, size))
+        data = generate_distribution(distribution, actual_size)
+        sort_function = SORTING_ALGORITHMS[algorithm_name]
+        
+        start_time = start_clock(profiler)
+        result, comparisons, moves = sort_function(data)
+        end_time = stop_clock(profiler)
+        
+        if comparisons is None:
+            comparisons = count_builtin_comparisons(data)  # Counted outside the timing
+        if verify:
+            check_answer(result == sorted(data), algorithm_name, "the sorted order")
+        
+        return end_time - start_time, comparisons
+        
+    elif algorithm_name in WORKLOAD_STRATEGIES:
+        # Mixed inserts, deletes and lookups starting from 'size' values
+        if distribution != DEFAULT_DISTRIBUTION:
+            raise ValueError("Workload strategies generate their own operations; "
+                             "only the uniform distribution is supported")
+        initial, operations = generate_mixed_workload(size, WORKLOAD_OPERATIONS)
+        build, run_workload = WORKLOAD_STRATEGIES[algorithm_name]
+        structure = build(initial)
+        
+        start_time = start_clock(profiler)
+        run_workload(structure, operations)
+        end_time = stop_clock(profiler)
+        
+        return end_time - start_time, len(operations)
+    
+    raise ValueError(f"Unknown algorithm: {algorithm_name}")
+
+
+def fit_scaling_exponent(sizes, times):
+    """
+    Fit time ≈ c × size^k with a least-squares line on a log-log scale.
+    
+    The slope k is the "growth exponent": about 0 for O(1), a little above 0
+    for O(log n), about 1 for O(n) and about 2 for O(n²).
+    
+    Args:
+        sizes (list): Input sizes (or operation counts) that were measured
+        times (list): Measured times, one per size
+        
+    Returns:
+        float: The fitted exponent k
+    """
+    points = [(math.log(s), math.log(t)) for s, t in zip(sizes, times) if s > 0 and t > 0]
+    if len(points) < 2:
+        raise ValueError("Need at least two positive measurements to fit an exponent")
+    
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if spread == 0:
+        raise ValueError("Need at least two different sizes to fit an exponent")
+    
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+
+def calibrate_machine_speed(loop_length=200000, repeats=5):
+    """
+    Measure how fast this machine runs a simple Python comparison loop.
+    
+    Throughput numbers (operations per second) only make sense next to a
+    reference, because every computer is a different speed. This reference
+    loop does one comparison per element, just like linear search.
+    
+    Args:
+        loop_length (int): Number of elements in the reference loop
+        repeats (int): How many times to run it (the fastest run is kept)
+        
+    Returns:
+        float: Reference comparisons per second
+    """
+    data = list(range(loop_length))
+    best_time = None
+    
+    for _ in range(repeats):
+        start_time = time.perf_counter()
+        for value in data:
+            if value == -1:
+                break
+        elapsed = time.perf_counter() - start_time
+        if best_time is None or elapsed < best_time:
+            best_time = elapsed
+    
+    return loop_length / best_time
+
+
+def append_benchmark_record(record, filename="benchmark_history.jsonl"):
+    """
+    Append one benchmark record to a JSON-lines history file.
+    
+    Each run adds a line, so the file can be loaded later to see whether
+    performance is improving or getting worse over time.
+    
+    Args:
+        record (dict): Measurements to save (must be JSON-friendly)
+        filename (str): History file to append to
+    """
+    record = dict(record)
+    record.setdefault('timestamp', time.strftime("%Y-%m-%dT%H:%M:%S"))
+    record.setdefault('environment', environment_fingerprint())
+    with open(filename, 'a') as f:
+        f.write(json.dumps(record) + "\n")
+
+
 def get_algorithm_description(algorithm_name):
     """Get a description of the algorithm's expected complexity."""
     descriptions = {
@@ -160,6 +570,76 @@ def get_algorithm_description(algorithm_name):
             "complexity": "O(n²) - Quadratic Time",
             "explanation": "Nested loops check every pair of elements",
             "pattern": "Time should quadruple when input size doubles"
+        },
+        "Count Pairs": {
+            "complexity": "O(n + k) - Linear Time",
+            "explanation": "Counts each value once, then multiplies counts of matching values",
+            "pattern": "Time should double when input size doubles"
+        },
+        "Find All Triples (Brute Force)": {
+            "complexity": "O(n³) - Cubic Time",
+            "explanation": "Three nested loops check every group of three",
+            "pattern": "Time should grow about 8x when input size doubles"
+        },
+        "Find All Triples (Hash)": {
+            "complexity": "O(n²) - Quadratic Time",
+            "explanation": "For each pair, a dictionary lookup finds the missing third value",
+            "pattern": "Time should quadruple when input size doubles"
+        },
+        "Find All Quadruples (Brute Force)": {
+            "complexity": "O(n⁴) - Quartic Time",
+            "explanation": "Four nested loops check every group of four",
+            "pattern": "Time should grow about 16x when input size doubles"
+        },
+        "Find All Quadruples (Meet in Middle)": {
+            "complexity": "O(n²) - Quadratic Time",
+            "explanation": "Pair sums are stored once, then matched with one lookup each",
+            "pattern": "Time should quadruple when input size doubles"
+        },
+        "Insertion Sort": {
+            "complexity": "O(n²) - Quadratic Time (O(n) if already sorted)",
+            "explanation": "Each element is shifted left past every larger element before it",
+            "pattern": "Time should quadruple when input size doubles on random data"
+        },
+        "Merge Sort": {
+            "complexity": "O(n log n) - Linearithmic Time",
+            "explanation": "About log₂(n) passes, each merging all n elements",
+            "pattern": "Time should grow a little more than 2x when input size doubles"
+        },
+        "Heap Sort": {
+            "complexity": "O(n log n) - Linearithmic Time",
+            "explanation": "n removals from a heap, each sifting down at most log₂(n) levels",
+            "pattern": "Time should grow a little more than 2x when input size doubles"
+        },
+        "Counting Sort": {
+            "complexity": "O(n + k) - Linear Time (k = range of values)",
+            "explanation": "Counts each value, then writes the values back in order - no comparisons",
+            "pattern": "Time should double when input size doubles"
+        },
+        "Radix Sort": {
+            "complexity": "O(d·n) - Linear Time (d = digits)",
+            "explanation": "One bucket pass per digit, never comparing two elements",
+            "pattern": "Time should double when input size doubles"
+        },
+        "Built-in Sort (Timsort)": {
+            "complexity": "O(n log n), O(n) on sorted or reversed runs",
+            "explanation": "Merges runs that are already in order, in C",
+            "pattern": "Time should grow a little more than 2x when input size doubles"
+        },
+        "Bucketed Sorted List": {
+            "complexity": "O(log n + B) per operation",
+            "explanation": "Updates only shift elements inside one small bucket",
+            "pattern": "Time per operation should grow very slowly with the data size"
+        },
+        "List + Insort": {
+            "complexity": "O(n) per update, O(log n) per lookup",
+            "explanation": "Each insert or delete shifts up to n elements of one big list",
+            "pattern": "Time should grow roughly in step with the data size"
+        },
+        "Re-sort Each Time": {
+            "complexity": "O(n) per update, O(n log n) per re-sort",
+            "explanation": "Every lookup after an update sorts the whole list again",
+            "pattern": "Time should grow at least as fast as the data size"
         }
     }
     return descriptions.get(algorithm_name, {"complexity": "Unknown", "explanation": "", "pattern": ""})
@@ -180,6 +660,10 @@ def print_algorithm_results(results):
     desc = results['description']
     
     print(f"\n=== {algorithm.upper()} RESULTS ===")
+    print(f"Input Distribution: {results.get('distribution', DEFAULT_DISTRIBUTION)}")
+    if 'workload' in results:
+        print(f"Query Workload: {results['workload']} ({results['query_count']} queries; "
+              f"times and operations are per query)")
     print(f"Expected Complexity: {desc['complexity']}")
     print(f"Why: {desc['explanation']}")
     print(f"Pattern to Watch: {desc['pattern']}\n")
@@ -188,13 +672,20 @@ def print_algorithm_results(results):
     print(f"{'Size':>8} | {'Time (sec)':>12} | {'Ratio':>8} | {'Operations':>12}")
     print("-" * 50)
     
+    below_resolution = results.get('below_resolution', [False] * len(sizes))
     for i, size in enumerate(sizes):
-        time_str = f"{times[i]:.6f}"
+        time_str = f"{times[i]:.6f}" + ("*" if below_resolution[i] else "")
         ratio_str = "─" if i == 0 else f"{ratios[i]:.2f}"
         ops_str = f"{operations[i]}"
         
         print(f"{size:>8} | {time_str:>12} | {ratio_str:>8} | {ops_str:>12}")
     
+    if any(below_resolution):
+        overhead = results['timer_overhead']
+        print(f"* Below {overhead['reliable_time'] * 1e6:.1f} µs, the smallest time this "
+              f"clock measures reliably (one clock read costs "
+              f"{overhead['clock_cost'] * 1e9:.0f} ns) - treat these as rough")
+    
     # Analyze the pattern
     print(f"\n--- ANALYSIS ---")
     if len(ratios) > 1:
@@ -225,6 +716,15 @@ def print_algorithm_results(results):
             else:
                 print("? UNEXPECTED: Ratios should be close to 4.0 for O(n²)")
     
+    if results.get('profiles'):
+        largest = results['profiles'][-1]
+        print(f"\n--- HOT FUNCTIONS (size {largest['size']}, profiled separately) ---")
+        print(f"{'Self (sec)':>12} | {'Calls':>8} | Function")
+        for row in largest['hot_functions']:
+            print(f"{row['self_time']:>12.6f} | {row['calls']:>8} | {row['function']}")
+        print(f"Full profiles: {os.path.dirname(largest['pstats']) or '.'}/ "
+              f"(.pstats and .collapsed files)")
+    
     print()
 
 
@@ -246,7 +746,7 @@ def create_comparison_plot(results_list):
         for results in results_list:
             plt.plot(results['sizes'], results['times'], 
                     marker='o', linewidth=2, markersize=8, 
-                    label=f"{results['algorithm']} - {results['description']['complexity']}")
+                    label=f"{results_label(results)} - {results['description']['complexity']}")
         
         plt.xlabel("Input Size")
         plt.ylabel("Execution Time (seconds)")
@@ -285,11 +785,10 @@ def create_text_visualization(results_list):
     print("="*60)
     
     for results in results_list:
-        algorithm = results['algorithm']
         times = results['times']
         sizes = results['sizes']
         
-        print(f"\n{algorithm} - {results['description']['complexity']}")
+        print(f"\n{results_label(results)} - {results['description']['complexity']}")
         print("-" * 40)
         
         # Normalize times for visualization (scale to 50 characters max)
@@ -314,6 +813,18 @@ def save_results_to_file(results_list, filename="algorithm_analysis_results.txt"
         f.write("CS101 Fall 2025 - Build a Better Algorithm\n")
         f.write("="*60 + "\n\n")
         
+        environment = next((r['environment'] for r in results_list if 'environment' in r), None)
+        if environment is not None:
+            seed = environment['run_seed']
+            f.write(f"Seed: {seed if seed is not None else 'not seeded'}\n")
+            f.write(f"Python: {environment['python_implementation']} "
+                    f"{environment['python_version']} on {environment['platform']}\n")
+            f.write(f"CPU: {environment['cpu_model']} ({environment['cpu_count']} cores, "
+                    f"governor {environment['cpu_governor']})\n")
+            packages = ", ".join(f"{name} {version}" for name, version
+                                 in environment['packages'].items() if version)
+            f.write(f"Packages: {packages or 'none'}\n\n")
+        
         for results in results_list:
             algorithm = results['algorithm']
             sizes = results['sizes']
@@ -323,19 +834,24 @@ def save_results_to_file(results_list, filename="algorithm_analysis_results.txt"
             desc = results['description']
             
             f.write(f"ALGORITHM: {algorithm}\n")
+            f.write(f"Distribution: {results.get('distribution', DEFAULT_DISTRIBUTION)}\n")
             f.write(f"Complexity: {desc['complexity']}\n")
             f.write(f"Explanation: {desc['explanation']}\n\n")
             
             f.write(f"{'Size':>8} | {'Time (sec)':>12} | {'Ratio':>8} | {'Operations':>12}\n")
             f.write("-" * 50 + "\n")
             
+            below_resolution = results.get('below_resolution', [False] * len(sizes))
             for i, size in enumerate(sizes):
-                time_str = f"{times[i]:.6f}"
+                time_str = f"{times[i]:.6f}" + ("*" if below_resolution[i] else "")
                 ratio_str = "─" if i == 0 else f"{ratios[i]:.2f}"
                 ops_str = f"{operations[i]}"
                 
                 f.write(f"{size:>8} | {time_str:>12} | {ratio_str:>8} | {ops_str:>12}\n")
             
+            if any(below_resolution):
+                f.write("* Below the smallest time this clock measures reliably\n")
+            
             f.write("\n" + "-"*50 + "\n\n")
     
     print(f"📁 Results saved to '{filename}'")
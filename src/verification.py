@@ -0,0 +1,109 @@
+"""
+Scalable Result Verification - Activity 06
+CS101 Fall 2025 - Build a Better Algorithm
+
+The verify_* helpers in algorithms.py check one answer at a time, and a
+linear-search check costs another O(n) scan. Checking thousands of answers
+on a million-element list that way costs far more than the benchmark.
+
+ResultVerifier pays O(n) ONCE per dataset to build two tables:
+- first_index: value -> position of its first copy
+- counts:      value -> how many times it appears
+
+After that, every check is cheap:
+- a linear or binary search answer: O(1)
+- a list of pairs: O(k + number of pairs), k = number of distinct values,
+  and it catches pairs that are MISSING or EXTRA, not just wrong sums
+- a pair count: O(k)
+"""
+
+from collections import Counter
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class ResultVerifier:
+    """Checks many search and pair results against one dataset."""
+
+    def __init__(self, data):
+        """
+        Build the lookup tables (O(n)).
+
+        Args:
+            data: The list, array or mapped dataset that was searched
+        """
+        self.data = data
+        self.size = len(data)
+        self._expected_pairs = {}  # target_sum -> Counter of value pairs
+
+        if NUMPY_AVAILABLE and self.size:
+            values, first, counts = np.unique(np.asarray(data), return_index=True,
+                                              return_counts=True)
+            values = values.tolist()
+            self.first_index = dict(zip(values, first.tolist()))
+            self.counts = dict(zip(values, counts.tolist()))
+        else:
+            self.first_index = {}
+            for index, value in enumerate(data):
+                self.first_index.setdefault(value, index)
+            self.counts = dict(Counter(data))
+
+    def check_linear_search(self, target, result_tuple):
+        """True if (index, comparisons) is exactly what linear search must return."""
+        index, comparisons = result_tuple
+        first = self.first_index.get(target)
+        if first is None:
+            return index == -1 and comparisons == self.size
+        return index == first and comparisons == first + 1
+
+    def check_binary_search(self, target, result):
+        """True if result is a correct binary-search answer (data must be sorted)."""
+        if result == -1:
+            return target not in self.counts
+        return 0 <= result < self.size and self.data[result] == target
+
+    def expected_pairs(self, target_sum):
+        """
+        Every (smaller value, larger value) pair that sums to target_sum,
+        with how many position pairs hold it. Cached per target.
+        """
+        if target_sum not in self._expected_pairs:
+            expected = Counter()
+            for value, count in self.counts.items():
+                partner = target_sum - value
+                if partner == value and count > 1:
+                    expected[(value, value)] = count * (count - 1) // 2
+                elif value < partner and partner in self.counts:
+                    expected[(value, partner)] = count * self.counts[partner]
+            self._expected_pairs[target_sum] = expected
+        return self._expected_pairs[target_sum]
+
+    def pair_differences(self, target_sum, pairs):
+        """
+        Compare a list of pairs with the complete answer.
+
+        Returns:
+            tuple: (Counter of missing value pairs, Counter of extra value pairs);
+            both are empty when the list is exactly right
+        """
+        found = Counter((min(pair), max(pair)) for pair in pairs)
+        expected = self.expected_pairs(target_sum)
+        return (expected - found, found - expected)
+
+    def check_pairs(self, target_sum, result_tuple):
+        """True if (pairs, comparisons) is the complete find_all_pairs_with_sum answer."""
+        pairs, comparisons = result_tuple
+        if comparisons != self.size * (self.size - 1) // 2:
+            return False
+        if any(len(pair) != 2 for pair in pairs):
+            return False
+        missing, extra = self.pair_differences(target_sum, pairs)
+        return not missing and not extra
+
+    def check_pair_count(self, target_sum, count):
+        """True if count is the number of position pairs summing to target_sum."""
+        return count == sum(self.expected_pairs(target_sum).values())
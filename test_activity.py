@@ -197,6 +197,1001 @@ def test_all_algorithms_scaling():
     return True
 
 
+def test_checkpoint_resume():
+    """Test that an interrupted sweep resumes with identical inputs."""
+    print("\n" + "="*60)
+    print("TESTING CHECKPOINT AND RESUME")
+    print("="*60)
+    
+    import random
+    from timer import run_algorithm_experiment
+    from checkpoint import new_checkpoint, resume_checkpoint, remove_checkpoint
+    
+    checkpoint_file = 'checkpoint_test.json'
+    sizes = [50, 100, 200]
+    
+    print("1. Running an uninterrupted sweep...")
+    random.seed(42)
+    full = run_algorithm_experiment('Linear Search', sizes)
+    
+    print("2. Running the first size only, then scrambling the random state...")
+    random.seed(42)
+    run_algorithm_experiment('Linear Search', sizes[:1], new_checkpoint(), checkpoint_file)
+    random.seed(999)
+    
+    print("3. Resuming from the checkpoint...")
+    checkpoint = resume_checkpoint(checkpoint_file)
+    resumed = run_algorithm_experiment('Linear Search', sizes, checkpoint, checkpoint_file)
+    remove_checkpoint(checkpoint_file)
+    
+    print(f"   Uninterrupted operations: {full['operations']}")
+    print(f"   Resumed operations:       {resumed['operations']}")
+    assert resumed['operations'] == full['operations'], "Resumed sweep used different inputs"
+    print("   ✓ Resumed sweep matches the uninterrupted sweep")
+    
+    return True
+
+
+def test_sorted_container():
+    """Test the bucketed sorted list against a plain sorted list."""
+    print("\n" + "="*60)
+    print("TESTING DYNAMIC SORTED CONTAINER")
+    print("="*60)
+    
+    import bisect
+    from sorted_container import (
+        BucketedSortedList, generate_mixed_workload, WORKLOAD_STRATEGIES
+    )
+    
+    print("1. Replaying a mixed workload on small buckets...")
+    initial, operations = generate_mixed_workload(500, 2000, update_fraction=0.6)
+    container = BucketedSortedList(initial, bucket_size=8)
+    reference = sorted(initial)
+    
+    for kind, value in operations:
+        if kind == 'insert':
+            container.insert(value)
+            bisect.insort(reference, value)
+        elif kind == 'delete':
+            assert container.delete(value), "Delete of a present value failed"
+            reference.remove(value)
+        assert (value in container) == (value in reference), "Membership mismatch"
+        assert container.rank(value) == bisect.bisect_left(reference, value), "Rank mismatch"
+    
+    assert list(container) == reference, "Container lost its sorted order"
+    assert container.range(100, 200) == [v for v in reference if 100 <= v <= 200]
+    print(f"   ✓ {len(operations)} operations matched a plain sorted list")
+    
+    print("2. Checking every strategy gives the same answers...")
+    answers = [run(build(initial), operations) for build, run in WORKLOAD_STRATEGIES.values()]
+    assert len(set(answers)) == 1, "Strategies disagree"
+    print(f"   ✓ All {len(answers)} strategies agree")
+    
+    return True
+
+
+def test_eytzinger_layout():
+    """Test that the Eytzinger index answers like binary search."""
+    print("\n" + "="*60)
+    print("TESTING EYTZINGER SEARCH LAYOUT")
+    print("="*60)
+    
+    import bisect
+    from eytzinger import EytzingerIndex, NUMPY_AVAILABLE
+    from algorithms import generate_sorted_test_data, verify_binary_search
+    
+    if not NUMPY_AVAILABLE:
+        print("   ⚠️  NumPy not available - skipping")
+        return True
+    
+    for size in [0, 1, 2, 7, 100, 1023, 1024, 5000]:
+        data = generate_sorted_test_data(size)
+        index = EytzingerIndex(data)
+        targets = list(range(0, 1002))
+        answers = index.search_batch(targets)
+        
+        for target, answer in zip(targets, answers):
+            assert verify_binary_search(data, target, answer), f"Wrong answer for {target}"
+            if answer != -1:
+                assert answer == bisect.bisect_left(data, target), "Not the first copy"
+        print(f"   ✓ Size {size}: all {len(targets)} targets answered correctly")
+    
+    return True
+
+
+def test_memoized_search():
+    """Test cache hits, eviction order and automatic invalidation."""
+    print("\n" + "="*60)
+    print("TESTING MEMOIZED LOOKUP LAYER")
+    print("="*60)
+    
+    from algorithms import binary_search_iterative, linear_search_with_counter
+    from memo_cache import MemoizedSearch, VersionedList, LRUCache, LFUCache
+    
+    print("1. Testing hits, misses and invalidation...")
+    data = VersionedList([1, 3, 5, 7, 9])
+    search = MemoizedSearch(binary_search_iterative, data, capacity=4)
+    assert search(7) == 3 and search(7) == 3, "Cached answer changed"
+    data.insert(0, 0)  # Shifts every index, so old answers are now wrong
+    assert search(7) == 4, "Stale answer survived a data change"
+    stats = search.stats()
+    print(f"   ✓ Stats after change: {stats}")
+    assert (stats['hits'], stats['misses'], stats['invalidations']) == (1, 2, 1)
+    
+    print("2. Testing LRU and LFU eviction order...")
+    lru = LRUCache(2)
+    lru.put('a', 1)
+    lru.put('b', 2)
+    lru.get('a')  # 'a' is now the most recently used
+    lru.put('c', 3)
+    assert lru.get('b') is None and lru.get('a') == 1, "LRU evicted the wrong entry"
+    
+    lfu = LFUCache(2)
+    lfu.put('a', 1)
+    lfu.get('a')  # 'a' has been used twice, 'b' only once
+    lfu.put('b', 2)
+    lfu.put('c', 3)
+    assert lfu.get('b') is None and lfu.get('a') == 1, "LFU evicted the wrong entry"
+    assert lru.evictions == 1 and lfu.evictions == 1
+    print("   ✓ Both policies evicted the expected entry")
+    
+    print("3. Testing the linear search wrapper...")
+    cached = MemoizedSearch(linear_search_with_counter, [5, 2, 8, 1], policy='lfu')
+    assert cached(8) == linear_search_with_counter([5, 2, 8, 1], 8)
+    print("   ✓ Cached linear search matches the plain function")
+    
+    return True
+
+
+def test_count_pairs():
+    """Test that count-only pair modes agree with the full pair list."""
+    print("\n" + "="*60)
+    print("TESTING COUNT-ONLY PAIR AGGREGATION")
+    print("="*60)
+    
+    from collections import Counter
+    from algorithms import (
+        find_all_pairs_with_sum, count_pairs_with_sum, count_pairs_by_value,
+        generate_test_data
+    )
+    
+    data = generate_test_data(300, 1, 50)  # Many duplicates
+    target = data[0] + data[1]
+    pairs, _ = find_all_pairs_with_sum(data, target)
+    
+    count, operations = count_pairs_with_sum(data, target)
+    print(f"   ✓ count_pairs_with_sum = {count} ({operations} operations)")
+    assert count == len(pairs), "Pair count does not match the pair list"
+    
+    groups, _ = count_pairs_by_value(data, target)
+    expected = Counter(tuple(sorted(pair)) for pair in pairs)
+    assert groups == dict(expected), "Grouped counts do not match the pair list"
+    print(f"   ✓ count_pairs_by_value found {len(groups)} distinct value pairs")
+    
+    assert count_pairs_with_sum([5, 5, 5], 10)[0] == 3, "Self-pairs counted wrong"
+    
+    return True
+
+
+def test_k_sum_engines():
+    """Test that the fast k-sum engines match the brute-force reference."""
+    print("\n" + "="*60)
+    print("TESTING K-SUM SEARCH")
+    print("="*60)
+    
+    from algorithms import find_all_pairs_with_sum, generate_test_data, verify_k_sums
+    from ksum import find_all_k_sums
+    
+    print("1. Checking k = 2 matches find_all_pairs_with_sum...")
+    numbers = [1, 2, 3, 4, 5]
+    assert find_all_k_sums(numbers, 2, 7) == find_all_pairs_with_sum(numbers, 7)
+    print("   ✓ Pairs match exactly")
+    
+    print("2. Checking fast engines against brute force (with duplicates)...")
+    data = generate_test_data(40, 1, 10)  # Small range -> many duplicate values
+    for k, engine in [(3, 'hash'), (4, 'meet')]:
+        target = sum(data[:k])
+        reference = find_all_k_sums(data, k, target, 'brute')
+        fast = find_all_k_sums(data, k, target, engine)
+        assert fast[0] == reference[0], f"{engine} engine disagrees with brute force"
+        assert verify_k_sums(data, k, target, fast), f"{engine} returned a wrong group"
+        print(f"   ✓ k={k} '{engine}': {len(fast[0])} groups in {fast[1]} steps "
+              f"(brute force: {reference[1]} steps)")
+    
+    print("3. Checking verify_k_sums catches missing and repeated groups...")
+    groups, steps = find_all_k_sums(data, 3, sum(data[:3]), 'hash')
+    assert not verify_k_sums(data, 3, sum(data[:3]), (groups[1:], steps))
+    assert not verify_k_sums(data, 3, sum(data[:3]), (groups + groups[:1], steps))
+    print("   ✓ A dropped or duplicated group fails the check")
+    
+    return True
+
+
+def test_mapped_datasets():
+    """Test writing datasets to disk and searching them through mmap."""
+    print("\n" + "="*60)
+    print("TESTING MEMORY-MAPPED DATASETS")
+    print("="*60)
+    
+    import tempfile
+    from algorithms import (
+        binary_search_iterative, linear_search_with_counter,
+        verify_binary_search, verify_linear_search
+    )
+    from datasets import write_dataset, open_dataset, read_header
+    from reports import run_dataset_experiment
+    
+    with tempfile.TemporaryDirectory() as directory:
+        print("1. Writing sorted and unsorted datasets in small chunks...")
+        sorted_file = write_dataset(os.path.join(directory, 'sorted.bin'), 10000,
+                                    sorted_order=True, dtype='int64', chunk_size=999)
+        random_file = write_dataset(os.path.join(directory, 'random.bin'), 10000, chunk_size=999)
+        assert read_header(sorted_file) == {'dtype': 'int64', 'size': 10000}
+        assert os.path.getsize(random_file) == 32 + 4 * 10000, "Raw file has the wrong size"
+        print("   ✓ Headers and file sizes are correct")
+        
+        print("2. Searching the mapped data directly...")
+        sorted_data = open_dataset(sorted_file, use_numpy=False)
+        random_data = open_dataset(random_file, use_numpy=False)
+        assert list(sorted_data) == sorted(sorted_data), "Sorted dataset is not sorted"
+        
+        target = sorted_data[7000]
+        result = binary_search_iterative(sorted_data, target)
+        assert verify_binary_search(list(sorted_data), target, result)
+        result = linear_search_with_counter(random_data, random_data[-1])
+        assert verify_linear_search(list(random_data), random_data[-1], result)
+        print("   ✓ Binary and linear search work on memory-mapped data")
+        
+        print("3. Tiny datasets...")
+        for algorithm in ("Binary Search", "Linear Search", "Count Pairs"):
+            results = run_dataset_experiment(algorithm, [0, 1, 2], directory)
+            assert len(results['times']) == 3
+        print("   ✓ Sizes 0, 1 and 2 run without errors")
+    
+    return True
+
+
+def test_parallel_scan():
+    """Test that the threaded scan matches sequential linear search exactly."""
+    print("\n" + "="*60)
+    print("TESTING MULTI-THREADED CHUNKED SCAN")
+    print("="*60)
+    
+    from algorithms import linear_search_with_counter, generate_test_data
+    from parallel_scan import parallel_linear_search, choose_chunk_size, NUMPY_AVAILABLE
+    
+    if not NUMPY_AVAILABLE:
+        print("   ⚠️  NumPy not available - skipping")
+        return True
+    
+    import numpy as np
+    data = generate_test_data(5000, 1, 200)
+    array_data = np.array(data)
+    
+    for target in [data[0], data[2500], data[-1], 0]:  # 0 never appears
+        expected = linear_search_with_counter(data, target)
+        for workers in [1, 4]:
+            result = parallel_linear_search(array_data, target, workers=workers, chunk_size=97)
+            assert result == expected, f"Got {result}, expected {expected}"
+        print(f"   ✓ target {target}: {expected} with 1 and 4 threads")
+    
+    for workers in [1, 2, 4, 8]:
+        chunk_size = choose_chunk_size(1000000, workers)
+        assert -(-1000000 // chunk_size) >= workers, "Every thread should get a chunk"
+    assert parallel_linear_search(array_data, 0) == linear_search_with_counter(data, 0)
+    print("   ✓ Default chunk size splits a 1M-element input between up to 8 threads")
+    
+    return True
+
+
+def test_parallel_pairs():
+    """Test that the multi-process pair search matches the serial version."""
+    print("\n" + "="*60)
+    print("TESTING SHARED-MEMORY PARALLEL PAIR SEARCH")
+    print("="*60)
+    
+    from algorithms import find_all_pairs_with_sum, generate_test_data
+    from parallel_pairs import parallel_find_all_pairs_with_sum, split_triangle
+    
+    print("1. Checking the tiles cover every row once...")
+    tiles = split_triangle(100, 8)
+    assert [row for first, end in tiles for row in range(first, end)] == list(range(100))
+    print(f"   ✓ {len(tiles)} tiles: {tiles}")
+    
+    print("2. Comparing against find_all_pairs_with_sum...")
+    data = generate_test_data(300, 1, 100)
+    target = data[0] + data[1]
+    expected = find_all_pairs_with_sum(data, target)
+    result = parallel_find_all_pairs_with_sum(data, target, workers=2)
+    assert result == expected, "Parallel result differs from the serial result"
+    print(f"   ✓ Same {len(result[0])} pairs and {result[1]} comparisons")
+    
+    return True
+
+
+def test_query_service():
+    """Test that the query service answers like the plain functions, batched or not."""
+    print("\n" + "="*60)
+    print("TESTING MICRO-BATCHING QUERY SERVICE")
+    print("="*60)
+    
+    import asyncio
+    import json
+    from algorithms import count_pairs_with_sum, generate_test_data
+    from query_service import BatchLookup, QueryService, run_load
+    
+    data = generate_test_data(500, 1, 100)
+    sorted_data = sorted(data)
+    
+    async def ask_all(batching):
+        service = QueryService(data, max_batch_size=8, batching=batching)
+        host, port = await service.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        answers = []
+        for op, target in [('search', t) for t in (0, 1, 50, 100, 101)] + \
+                          [('pairs', t) for t in (1, 2, 101, 200, 201)]:
+            writer.write((json.dumps({'op': op, 'target': target}) + "\n").encode())
+            await writer.drain()
+            answers.append(json.loads(await reader.readline())['result'])
+        writer.close()
+        latencies, _ = await run_load((host, port), list(range(200)), connections=8)
+        await service.stop()
+        return answers, len(latencies), service.batch_sizes
+    
+    expected = [sorted_data.index(t) if t in sorted_data else -1 for t in (0, 1, 50, 100, 101)]
+    expected += [count_pairs_with_sum(data, t)[0] for t in (1, 2, 101, 200, 201)]
+    
+    print("1. Asking without batching...")
+    answers, answered, _ = asyncio.run(ask_all(False))
+    assert answers == expected, f"Expected {expected}, got {answers}"
+    assert answered == 200
+    print(f"   ✓ Answers match: {answers}")
+    
+    print("2. Asking with micro-batching...")
+    answers, answered, batch_sizes = asyncio.run(ask_all(True))
+    assert answers == expected, f"Expected {expected}, got {answers}"
+    assert answered == 200 and sum(batch_sizes) == 210
+    assert max(batch_sizes) <= 8
+    print(f"   ✓ Answers match, largest batch {max(batch_sizes)}")
+    
+    print("3. Bad requests do not stop the service...")
+    async def ask_bad_then_good():
+        service = QueryService(data, max_batch_size=8)
+        host, port = await service.start()
+        reader, writer = await asyncio.open_connection(host, port)
+        replies = []
+        for request in ({'op': 'pairs', 'target': 'x'}, {'op': 'search', 'target': None},
+                        {'op': 'search', 'target': 50}):
+            writer.write((json.dumps(request) + "\n").encode())
+            await writer.drain()
+            replies.append(json.loads(await asyncio.wait_for(reader.readline(), 5)))
+        writer.close()
+        await writer.wait_closed()
+        await service.stop()
+        return replies
+    
+    replies = asyncio.run(ask_bad_then_good())
+    assert 'error' in replies[0] and 'error' in replies[1]
+    assert replies[2] == {'result': expected[2]}
+    print("   ✓ Non-numeric targets get an error reply; later queries are answered")
+    
+    print("4. Wide value ranges skip the pair table...")
+    wide = data[:50] + [10 ** 9]
+    lookup = BatchLookup(wide)
+    assert lookup.pair_totals is None
+    assert lookup.count_pairs_many([101, 10 ** 9 + 1]) == [
+        count_pairs_with_sum(wide, 101)[0], count_pairs_with_sum(wide, 10 ** 9 + 1)[0]]
+    print("   ✓ Counted from the value counts instead")
+    
+    print("5. Non-finite targets count zero pairs...")
+    import warnings
+    lookup = BatchLookup(data)
+    assert lookup.pair_totals is not None
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")  # No "invalid value encountered in cast"
+        counts = lookup.count_pairs_many([float('inf'), float('nan'), 1e300, 2.5])
+    assert counts == [0, 0, 0, 0]
+    print("   ✓ inf, nan and huge targets answered without warnings")
+    
+    return True
+
+
+def test_input_distributions():
+    """Test the input-distribution generators and that results record them."""
+    print("\n" + "="*60)
+    print("TESTING INPUT DISTRIBUTIONS")
+    print("="*60)
+    
+    import random
+    from distributions import DISTRIBUTIONS, generate_distribution, pick_target
+    from timer import run_algorithm_experiment
+    
+    print("1. Checking each shape...")
+    for name in DISTRIBUTIONS:
+        random.seed(7)
+        data = generate_distribution(name, 500)
+        random.seed(7)
+        assert generate_distribution(name, 500) == data, f"{name} is not reproducible"
+        assert len(data) == 500
+    ascending = generate_distribution('sorted', 300)
+    assert ascending == sorted(ascending)
+    reverse = generate_distribution('reverse', 300)
+    assert reverse == sorted(reverse, reverse=True)
+    assert len(set(generate_distribution('all_distinct', 2000))) == 2000
+    assert len(set(generate_distribution('heavy_duplicates', 2000))) <= 10
+    print(f"   ✓ {len(DISTRIBUTIONS)} distributions are reproducible and well-formed")
+    
+    print("2. Adversarial targets are never found...")
+    data = generate_distribution('adversarial', 1000)
+    assert pick_target(data, 'adversarial', -1) not in data
+    results = run_algorithm_experiment("Linear Search", [100, 200], distribution='adversarial')
+    assert results['distribution'] == 'adversarial'
+    assert results['operations'] == [100, 200], "Absent target should scan everything"
+    print(f"   ✓ Linear search checked {results['operations']} elements")
+    
+    return True
+
+
+def test_profiling_hooks():
+    """Test that opt-in profiling writes profile files and finds hot functions."""
+    print("\n" + "="*60)
+    print("TESTING PROFILING HOOKS")
+    print("="*60)
+    
+    import pstats
+    import random
+    import shutil
+    import tempfile
+    from timer import run_algorithm_experiment, run_profiled_trial
+    
+    directory = tempfile.mkdtemp()
+    try:
+        print("1. Profiling Find All Pairs...")
+        results = run_algorithm_experiment("Find All Pairs", [50, 100], profile=True,
+                                           profile_dir=directory)
+        assert len(results['profiles']) == 2
+        profile = results['profiles'][-1]
+        assert os.path.exists(profile['pstats']) and os.path.exists(profile['collapsed'])
+        pstats.Stats(profile['pstats'])  # Must load as a normal pstats file
+        print(f"   ✓ Wrote {os.path.basename(profile['pstats'])} and "
+              f"{os.path.basename(profile['collapsed'])}")
+        
+        print("2. Checking the hot functions and collapsed stacks...")
+        hot_names = [row['function'] for row in profile['hot_functions']]
+        assert any('find_all_pairs_with_sum' in name for name in hot_names), hot_names
+        assert not any('generate' in name for name in hot_names), "Data generation was profiled"
+        with open(profile['collapsed']) as f:
+            lines = f.read().splitlines()
+        assert lines and all(line.rsplit(' ', 1)[1].isdigit() for line in lines)
+        print(f"   ✓ Hottest: {hot_names[0]}; {len(lines)} collapsed stacks")
+        
+        print("3. Profiling is off by default...")
+        assert 'profiles' not in run_algorithm_experiment("Linear Search", [100])
+        print("   ✓ No profiles unless asked for")
+        
+        print("4. Profiling leaves the random generator alone...")
+        random.seed(11)
+        state = random.getstate()
+        run_profiled_trial("Linear Search", 100, directory=directory)
+        assert random.getstate() == state, "Profiled trial changed later inputs"
+        print("   ✓ Later trials get the same data with or without profiling")
+    finally:
+        shutil.rmtree(directory)
+    
+    return True
+
+
+def test_timer_overhead():
+    """Test the timer-overhead calibration, subtraction and resolution flags."""
+    print("\n" + "="*60)
+    print("TESTING TIMER-OVERHEAD CALIBRATION")
+    print("="*60)
+    
+    from timer import (
+        calibrate_timer_overhead, subtract_timer_overhead, run_algorithm_experiment
+    )
+    
+    print("1. Calibrating...")
+    overhead = calibrate_timer_overhead(repeats=500)
+    assert overhead['clock_cost'] > 0 and overhead['call_cost'] >= 0
+    assert overhead['reliable_time'] > overhead['clock_cost']
+    print(f"   ✓ Clock read {overhead['clock_cost'] * 1e9:.0f} ns, "
+          f"call {overhead['call_cost'] * 1e9:.0f} ns")
+    
+    print("2. Subtracting overhead...")
+    assert subtract_timer_overhead(0.0, 3, overhead) == 0.0, "Times must never go negative"
+    big = 1.0
+    expected = big - overhead['clock_cost'] - 3 * overhead['call_cost']
+    assert abs(subtract_timer_overhead(big, 3, overhead) - expected) < 1e-12
+    print("   ✓ Overhead removed and clamped at zero")
+    
+    print("3. Flagging tiny measurements...")
+    results = run_algorithm_experiment("Array Access", [100, 200])
+    reliable = results['timer_overhead']['reliable_time']
+    assert results['below_resolution'] == [t < reliable for t in results['times']]
+    print(f"   ✓ Flags: {results['below_resolution']}")
+    
+    return True
+
+
+def test_query_workloads():
+    """Test the query workload generators and batched per-query timing."""
+    print("\n" + "="*60)
+    print("TESTING QUERY WORKLOADS")
+    print("="*60)
+    
+    from algorithms import (
+        binary_search_iterative, binary_search_with_counter, generate_sorted_test_data
+    )
+    from query_workloads import QUERY_WORKLOADS, generate_query_targets
+    from reports import run_query_workload_experiment
+    
+    print("1. Checking the counting binary search...")
+    data = generate_sorted_test_data(500)
+    for target in [0, data[0], data[250], data[-1], 2000]:
+        index, comparisons = binary_search_with_counter(data, target)
+        assert index == binary_search_iterative(data, target)
+        assert 1 <= comparisons <= 10
+    print("   ✓ Same answers as binary_search_iterative, at most log₂(n) + 1 checks")
+    
+    print("2. Checking the target patterns...")
+    for workload in QUERY_WORKLOADS:
+        assert len(generate_query_targets(workload, data, 50, sorted_data=True)) == 50
+    assert not set(generate_query_targets('absent', data, 50)) & set(data)
+    print(f"   ✓ {len(QUERY_WORKLOADS)} workloads generated")
+    
+    print("3. Comparing best, worst and absent linear searches...")
+    operations = {}
+    for workload in ['best', 'uniform', 'worst', 'absent']:
+        results = run_query_workload_experiment("Linear Search", [400], workload, 100)
+        operations[workload] = results['operations'][0]
+        pct = results['percentiles'][0]
+        assert pct['p50'] <= pct['p90'] <= pct['p99']
+    assert operations['best'] == 1 and operations['absent'] == 400
+    assert operations['uniform'] <= operations['worst'] <= operations['absent']
+    print(f"   ✓ Comparisons per query: {operations}")
+    
+    return True
+
+
+def test_scalable_verification():
+    """Test that verification catches missing and extra answers, not just wrong ones."""
+    print("\n" + "="*60)
+    print("TESTING SCALABLE RESULT VERIFICATION")
+    print("="*60)
+    
+    from algorithms import (
+        find_all_pairs_with_sum, generate_test_data, linear_search_with_counter,
+        verify_linear_search, verify_pairs
+    )
+    from verification import ResultVerifier
+    from timer import run_algorithm_experiment
+    
+    data = generate_test_data(300, 1, 50)
+    target_sum = data[0] + data[1]
+    pairs, comparisons = find_all_pairs_with_sum(data, target_sum)
+    verifier = ResultVerifier(data)
+    
+    print("1. Complete pair lists pass, incomplete ones fail...")
+    assert verify_pairs(data, target_sum, (pairs, comparisons))
+    assert verifier.check_pairs(target_sum, (pairs, comparisons))
+    assert not verify_pairs(data, target_sum, (pairs[1:], comparisons)), "Missing pair not caught"
+    assert not verify_pairs(data, target_sum, (pairs + [pairs[0]], comparisons)), \
+        "Extra pair not caught"
+    missing, extra = verifier.pair_differences(target_sum, pairs[1:])
+    assert sum(missing.values()) == 1 and not extra
+    print(f"   ✓ {len(pairs)} pairs checked; a dropped or duplicated pair is reported")
+    
+    print("2. Linear search must report the FIRST copy...")
+    target = data[-1]
+    answer = linear_search_with_counter(data, target)
+    assert verify_linear_search(data, target, answer)
+    assert verifier.check_linear_search(target, answer)
+    later = max(i for i, value in enumerate(data) if value == target)
+    if later != answer[0]:
+        assert not verifier.check_linear_search(target, (later, later + 1))
+        assert not verify_linear_search(data, target, (later, later + 1), verifier)
+    assert verifier.check_linear_search(0, (-1, len(data)))
+    print("   ✓ Later copies and missing targets handled")
+    
+    print("3. Verified experiments...")
+    for algorithm in ["Binary Search", "Linear Search", "Find All Pairs", "Count Pairs",
+                      "Find All Triples (Hash)", "Find All Quadruples (Meet in Middle)"]:
+        run_algorithm_experiment(algorithm, [100, 200], verify=True)
+    print("   ✓ Every trial's answer verified")
+    
+    return True
+
+
+def test_backend_report():
+    """Test that every backend agrees with the pure-Python version."""
+    print("\n" + "="*60)
+    print("TESTING DIFFERENTIAL BACKEND REPORT")
+    print("="*60)
+    
+    from algorithms import generate_sorted_test_data
+    from backends import BACKENDS, comparable_answer
+    from reports import run_backend_report
+    
+    print("1. Checking edge cases by hand...")
+    data = generate_sorted_test_data(200, 1, 50)
+    for problem in ["Binary Search", "Linear Search"]:
+        for target in [0, data[0], data[100], data[-1], 51]:
+            answers = {backend: comparable_answer(problem, data, run(prepare(data), target))
+                       for backend, (prepare, run) in BACKENDS[problem].items()}
+            assert len(set(answers.values())) == 1, f"{problem} backends disagree: {answers}"
+    print(f"   ✓ Backends agree: {', '.join(BACKENDS['Linear Search'])}")
+    
+    print("2. Running the report...")
+    report = run_backend_report(input_sizes=(50, 200), query_count=20, repeats=1)
+    assert set(report) == set(BACKENDS)
+    for problem, entry in report.items():
+        assert entry['speedups']['python'] == [1.0] * len(entry['sizes'])
+        assert set(entry['crossovers']) == set(BACKENDS[problem]) - {'python'}
+    print("   ✓ Speedup matrix and crossovers for every problem")
+    
+    return True
+
+
+def test_results_store():
+    """Test the compact columnar ExperimentResult store."""
+    print("\n" + "="*60)
+    print("TESTING COMPACT RESULT STORAGE")
+    print("="*60)
+    
+    from results_store import ExperimentResult, NUMPY_AVAILABLE
+    from timer import run_algorithm_experiment, print_algorithm_results, TRIALS_PER_SIZE
+    
+    print("1. Recording raw samples...")
+    store = ExperimentResult("Linear Search", [10, 20])
+    for i in range(1000):
+        store.append_sample(10, i * 1e-6, i)
+    assert store.sample_count == 1000
+    assert store.nbytes() == 2 * 8 + 4 * 1000 * 8, "Every number should take 8 bytes"
+    print(f"   ✓ 1000 samples in {store.nbytes()} bytes")
+    
+    if NUMPY_AVAILABLE:
+        print("2. Zero-copy NumPy views...")
+        views = store.numpy_views()
+        assert views['operations'].sum() == sum(range(1000))
+        store.sample_times[0] = 42.0
+        assert views['times'][0] == 42.0, "View should share memory with the column"
+        del views
+        store.append_sample(20, 0.5, 1)  # Allowed again once the views are gone
+        print("   ✓ Views share memory with the columns")
+    
+    print("3. Works with the report functions...")
+    results = run_algorithm_experiment("Linear Search", [100, 200], keep_samples=True)
+    assert isinstance(results, ExperimentResult)
+    assert results.sample_count == 2 * TRIALS_PER_SIZE, "One sample per trial"
+    assert results['distribution'] == 'uniform' and 'description' in results
+    print_algorithm_results(results)
+    assert results.to_dict()['times'] == list(results['times'])
+    print("   ✓ print_algorithm_results accepts an ExperimentResult")
+    
+    return True
+
+
+def test_reproducible_runs():
+    """Test run seeds, per-trial seeding and the environment fingerprint."""
+    print("\n" + "="*60)
+    print("TESTING REPRODUCIBLE RUNS")
+    print("="*60)
+    
+    import random
+    from reproducibility import (
+        set_run_seed, clear_run_seed, environment_fingerprint, pin_to_cpus
+    )
+    from timer import run_algorithm_experiment
+    from reports import run_cache_comparison
+    
+    try:
+        print("1. Same seed, same inputs - whatever ran before...")
+        set_run_seed(2025)
+        first = run_algorithm_experiment("Linear Search", [300, 600], keep_samples=True)
+        run_algorithm_experiment("Binary Search", [100])  # Uses up random numbers
+        set_run_seed(2025)
+        again = run_algorithm_experiment("Linear Search", [300, 600], keep_samples=True)
+        assert list(first.sample_operations) == list(again.sample_operations), \
+            "Seeded runs should search identical data"
+        assert first['seed'] == 2025
+        print(f"   ✓ Identical comparisons: {list(first.sample_operations)}")
+        
+        set_run_seed(2025)
+        report = run_cache_comparison([200], query_count=300, capacity=16)
+        random.random()  # Reports must not depend on random numbers used before them
+        report_again = run_cache_comparison([200], query_count=300, capacity=16)
+        assert report[0]['cache_stats'] == report_again[0]['cache_stats'], \
+            "Seeded reports should use identical inputs"
+        print("   ✓ Reports seed their own inputs too")
+        
+        print("2. Different seed, different inputs...")
+        set_run_seed(2026)
+        other = run_algorithm_experiment("Linear Search", [300, 600], keep_samples=True)
+        assert list(other.sample_operations) != list(first.sample_operations)
+        print("   ✓ Inputs changed with the seed")
+    finally:
+        clear_run_seed()
+    
+    print("3. Environment fingerprint...")
+    fingerprint = environment_fingerprint()
+    for key in ['python_version', 'python_implementation', 'cpu_count', 'packages']:
+        assert key in fingerprint, f"Fingerprint is missing {key}"
+    assert 'environment' in first
+    print(f"   ✓ {fingerprint['python_implementation']} {fingerprint['python_version']}, "
+          f"{fingerprint['cpu_count']} CPU(s)")
+    
+    if hasattr(os, 'sched_setaffinity'):
+        print("4. CPU pinning...")
+        original = os.sched_getaffinity(0)
+        core = min(original)
+        try:
+            assert pin_to_cpus([core]) == [core]
+            assert environment_fingerprint()['pinned_cpus'] == [core]
+        finally:
+            os.sched_setaffinity(0, original)
+        print(f"   ✓ Pinned to core {core} and recorded in the fingerprint")
+    
+    return True
+
+
+def test_streaming_pairs():
+    """Test the streaming pair detector against the list-based functions."""
+    print("\n" + "="*60)
+    print("TESTING STREAMING PAIR DETECTOR")
+    print("="*60)
+    
+    from algorithms import count_pairs_with_sum, generate_test_data
+    from streaming import StreamingPairDetector
+    from reports import run_stream_throughput
+    
+    data = generate_test_data(400, 1, 30)
+    target_sum = 31
+    
+    print("1. Whole stream vs count_pairs_with_sum...")
+    detector = StreamingPairDetector(target_sum)
+    detector.add_many(data[:150])  # Batches and single elements mix freely
+    for value in data[150:]:
+        detector.add(value)
+    expected = count_pairs_with_sum(data, target_sum)[0]
+    assert detector.total_pairs == expected, f"Expected {expected}, got {detector.total_pairs}"
+    print(f"   ✓ {detector.total_pairs} pairs, same as the list version")
+    
+    print("2. Sliding window...")
+    window = 25
+    emitted = []
+    windowed = StreamingPairDetector(target_sum, window,
+                                     on_pair=lambda a, b, count: emitted.append(count))
+    windowed.add_many(data)
+    brute = sum(1 for i in range(len(data)) for j in range(i + 1, min(i + window, len(data)))
+                if data[i] + data[j] == target_sum)
+    assert windowed.total_pairs == brute == sum(emitted)
+    assert windowed.active_pairs == count_pairs_with_sum(data[-window:], target_sum)[0]
+    assert len(windowed) == window
+    print(f"   ✓ {brute} pairs within {window} positions; "
+          f"{windowed.active_pairs} still inside the window")
+    
+    print("3. Throughput...")
+    rows = run_stream_throughput(20000, windows=(None, 100), chunk_size=5000)
+    assert all(row['elements_per_sec'] > 0 for row in rows)
+    print("   ✓ Elements/sec measured")
+    
+    return True
+
+
+def test_sorting_algorithms():
+    """Test the sorting family and the sort + search pipeline."""
+    print("\n" + "="*60)
+    print("TESTING SORTING ALGORITHMS")
+    print("="*60)
+    
+    from distributions import DISTRIBUTIONS, generate_distribution
+    from sorting import SORTING_ALGORITHMS, insertion_sort, count_builtin_comparisons
+    from reports import run_sort_comparison, run_sort_search_pipeline
+    
+    print("1. Every sort on every distribution...")
+    for distribution in DISTRIBUTIONS:
+        data = generate_distribution(distribution, 300)
+        original = list(data)
+        for name, sort_function in SORTING_ALGORITHMS.items():
+            result, comparisons, moves = sort_function(data)
+            assert result == sorted(original), f"{name} failed on {distribution}"
+            assert data == original, f"{name} changed its input"
+    print(f"   ✓ {len(SORTING_ALGORITHMS)} sorts agree with sorted() on "
+          f"{len(DISTRIBUTIONS)} distributions")
+    
+    print("2. Comparison counts...")
+    data = list(range(100))
+    assert insertion_sort(data)[1:] == (99, 0)  # Already sorted: one check each, no moves
+    assert insertion_sort(data[::-1])[1] == 100 * 99 // 2
+    assert count_builtin_comparisons(data) == 99  # Timsort sees one long run
+    print("   ✓ Best and worst cases counted exactly")
+    
+    print("3. Harness reports...")
+    rows = run_sort_comparison([200], distributions=['uniform', 'sorted'])
+    assert len(rows) == 2 * len(SORTING_ALGORITHMS)
+    assert all(row['comparisons'] is not None for row in rows)
+    pipeline = run_sort_search_pipeline(2000, query_counts=(1, 10000), sample_queries=50)
+    for row in pipeline:
+        # Counted work, not wall-clock time: sorting touches every element at least once
+        one_query = row['sort_operations'] + row['search_comparisons']
+        assert one_query > row['scan_comparisons'], "Sorting for one query should never pay off"
+    print("   ✓ Sort table and break-even pipeline produced")
+    
+    return True
+
+
+def test_search_planner():
+    """Test the scan / sort + bisect / hash index planner."""
+    print("\n" + "="*60)
+    print("TESTING SEARCH PLANNER")
+    print("="*60)
+    
+    from algorithms import generate_test_data, linear_search_with_counter
+    from planner import STRATEGIES, plan_search, run_strategy, search, break_even
+    from reports import run_planner_report
+    
+    data = generate_test_data(500, 1, 100)
+    targets = list(range(0, 110))  # Includes absent values
+    expected = [linear_search_with_counter(data, target)[0] for target in targets]
+    
+    print("1. Every strategy gives linear search's answers...")
+    for strategy in STRATEGIES:
+        assert run_strategy(strategy, data, targets) == expected, f"{strategy} disagreed"
+    assert search(data, targets) == expected
+    print(f"   ✓ {len(STRATEGIES)} strategies and search() agree")
+    
+    print("2. Plans follow the cost model...")
+    # Made-up costs: scanning is 1 µs/element, sorting and indexing are cheap per element
+    costs = {'scan': (0.0, 1e-6), 'sort': (0.0, 1e-6), 'bisect': (0.0, 1e-6),
+             'index': (0.0, 2e-6), 'hash': 1e-6}
+    assert plan_search(1000, 1, costs)['strategy'] == 'scan'
+    plan = plan_search(1000, 100, costs)
+    assert plan['strategy'] == 'hash_index'
+    assert plan['break_even']['hash_index'] == break_even(2000e-6, 1e-6, 1000e-6) == 3
+    assert "beats scanning from 3 queries" in plan['explanation']
+    assert break_even(1.0, 2e-6, 1e-6) is None  # Slower per query: never pays off
+    print("   ✓ Scan for one query, hash index once the setup is repaid")
+    
+    print("3. Planner report (made-up costs, no calibration sweep)...")
+    rows = run_planner_report(input_sizes=(100,), query_counts=(1, 100), costs=costs)
+    assert all(row['planned'] in row['measured'] for row in rows)
+    rows = run_planner_report(input_sizes=(100,), query_counts=(1,), measure_limit=0,
+                              costs=costs)
+    assert rows[0]['measured'] == {} and rows[0]['fastest'] is None
+    print("   ✓ Predictions checked against measurements, nothing run over the limit")
+    
+    return True
+
+
+def test_bloom_prefilter():
+    """Test the Bloom filter and the prefiltered linear search."""
+    print("\n" + "="*60)
+    print("TESTING BLOOM FILTER PREFILTER")
+    print("="*60)
+    
+    from algorithms import generate_test_data, linear_search_with_counter
+    from bloom_filter import BloomFilter, PrefilteredSearch
+    from memo_cache import VersionedList
+    from reports import run_bloom_comparison
+    
+    print("1. No false negatives, false positives near the target rate...")
+    bloom = BloomFilter.from_values(range(5000), 0.01)
+    assert all(value in bloom for value in range(5000))
+    false_positives = sum(1 for value in range(10**6, 10**6 + 20000) if value in bloom)
+    assert false_positives / 20000 < 0.03, f"False-positive rate {false_positives / 20000:.2%}"
+    assert bloom.nbytes() < 5000 * 2  # About 1.2 bytes per value at 1%
+    print(f"   ✓ {false_positives / 20000:.2%} false positives in {bloom.nbytes()} bytes")
+    
+    print("2. Prefiltered search gives linear search's answers...")
+    data = VersionedList(generate_test_data(300, 1, 100))
+    search = PrefilteredSearch(linear_search_with_counter, data)
+    for target in range(0, 120):
+        index, comparisons = search(target)
+        assert index == linear_search_with_counter(data, target)[0]
+    stats = search.stats()
+    assert stats['filtered'] + stats['passed'] == 120 and stats['filtered'] > 0
+    data.append(500)  # New version - the filter must be rebuilt
+    assert search(500)[0] == len(data) - 1
+    print(f"   ✓ {stats['filtered']} misses skipped the scan; rebuilt after a change")
+    
+    print("3. Miss-heavy comparison...")
+    rows = run_bloom_comparison([100, 2000], query_count=300)
+    stats = rows[-1]['filter_stats']
+    assert stats['filtered'] + stats['passed'] == 300
+    assert stats['filtered'] + stats['false_positives'] == 270  # Every miss is accounted for
+    assert stats['filtered'] > 240, "Most misses should skip the scan"
+    print(f"   ✓ {stats['filtered']} of 270 misses answered by the filter alone")
+    
+    return True
+
+
+def test_access_patterns():
+    """Test the containers, index streams and the access benchmark."""
+    print("\n" + "="*60)
+    print("TESTING CONTAINERS AND ACCESS PATTERNS")
+    print("="*60)
+    
+    import tempfile
+    from algorithms import array_access
+    from access_patterns import (
+        CONTAINERS, ACCESS_PATTERNS, LinkedList, generate_index_stream,
+        cache_sizes, boundary_sizes, memory_level
+    )
+    from reports import run_access_benchmark
+    
+    print("1. Every container answers array_access like a list...")
+    values = list(range(500))
+    indices = generate_index_stream('random', 500, 200) + [499, 0, 500, -1]
+    for name, build in CONTAINERS.items():
+        container = build(values)
+        answers = [array_access(container, index) for index in indices]
+        assert answers == [array_access(values, index) for index in indices], name
+    linked = LinkedList(values)
+    assert [linked[i] for i in (10, 400, 5)] == [10, 400, 5]  # Backwards restarts at head
+    print(f"   ✓ {len(CONTAINERS)} containers agree")
+    
+    print("2. Index streams and cache sizes...")
+    assert generate_index_stream('sequential', 5, 7) == [0, 1, 2, 3, 4, 0, 1]
+    strided = generate_index_stream('strided', 64, 64)
+    assert sorted(strided) == list(range(64))  # Every element once per full sweep
+    with tempfile.TemporaryDirectory() as cache_dir:
+        for index, (level, cache_type, size) in enumerate(
+                [(1, 'Data', '48K'), (1, 'Instruction', '32K'), (2, 'Unified', '2048K'),
+                 (3, 'Unified', '32M')]):
+            os.makedirs(f"{cache_dir}/index{index}")
+            for field, value in (('level', level), ('type', cache_type), ('size', size)):
+                with open(f"{cache_dir}/index{index}/{field}", "w") as f:
+                    f.write(f"{value}\n")
+        caches = cache_sizes(cache_dir)
+    assert caches == {'L1': 48 * 1024, 'L2': 2048 * 1024, 'LLC': 32 * 1024 ** 2}
+    labels = [label for label, size in boundary_sizes(caches, max_elements=4 * 10 ** 6)]
+    assert labels == ['L1', 'L2', 'LLC', 'RAM (capped)']
+    l2_size = dict(boundary_sizes(caches))['L2']
+    assert memory_level('array', l2_size, caches) == 'L2'
+    assert memory_level('list', l2_size, caches) == 'LLC'  # Int objects do not fit in L2
+    print("   ✓ Streams stay in range; cache levels read from /sys layout")
+    
+    print("3. Access benchmark...")
+    rows = run_access_benchmark(sizes=[('small', 1000), ('large', 300000)],
+                                access_count=2000, time_budget=0.02)
+    assert len(rows) == 2 * len(CONTAINERS) * len(ACCESS_PATTERNS)
+    skipped = [row for row in rows if row['ns_per_access'] is None]
+    assert skipped and all(row['container'] == 'linked_list' for row in skipped)
+    assert all(row['skipped'] == 'not built' for row in skipped)
+    rows = run_access_benchmark(sizes=[('small', 1000)], containers=['list'],
+                                patterns=['random'], access_count=2000, time_budget=0)
+    assert rows[0]['skipped'] == 'over budget' and rows[0]['accesses'] == 0
+    print("   ✓ ns/access reported for every container, pattern and size; "
+          "budget enforced")
+    
+    return True
+
+
+def test_report_menu():
+    """Test that every report in main.py's menu exists and can be chosen."""
+    print("\n" + "="*60)
+    print("TESTING REPORT MENU")
+    print("="*60)
+    
+    import inspect
+    import reports
+    from main import REPORTS, parse_arguments
+    
+    print("1. Every menu entry matches a report function...")
+    for description, function_name, arguments in REPORTS:
+        report = getattr(reports, function_name)
+        inspect.signature(report).bind(*arguments)  # Raises TypeError on a mismatch
+    print(f"   ✓ {len(REPORTS)} reports reachable from main.py")
+    
+    print("2. Choosing a report on the command line...")
+    assert parse_arguments(["--report", "run_access_benchmark"]).report == "run_access_benchmark"
+    assert parse_arguments([]).report is None  # No arguments: interactive activity
+    print("   ✓ --report picks a report, no arguments keeps the menu")
+    
+    return True
+
+
 def test_file_outputs():
     """Verify all output files are created with correct content."""
     print("\n" + "="*60)
@@ -246,6 +1241,30 @@ def main():
         ("Timer and Experiment Functionality", test_timer_functionality), 
         ("Comparison Mode", test_comparison_mode),
         ("All Algorithms Scaling", test_all_algorithms_scaling),
+        ("Checkpoint and Resume", test_checkpoint_resume),
+        ("Dynamic Sorted Container", test_sorted_container),
+        ("Eytzinger Search Layout", test_eytzinger_layout),
+        ("Memoized Lookup Layer", test_memoized_search),
+        ("Count-Only Pairs", test_count_pairs),
+        ("k-Sum Search", test_k_sum_engines),
+        ("Memory-Mapped Datasets", test_mapped_datasets),
+        ("Multi-Threaded Scan", test_parallel_scan),
+        ("Parallel Pair Search", test_parallel_pairs),
+        ("Micro-Batching Query Service", test_query_service),
+        ("Input Distributions", test_input_distributions),
+        ("Profiling Hooks", test_profiling_hooks),
+        ("Timer-Overhead Calibration", test_timer_overhead),
+        ("Query Workloads", test_query_workloads),
+        ("Scalable Verification", test_scalable_verification),
+        ("Differential Backend Report", test_backend_report),
+        ("Compact Result Storage", test_results_store),
+        ("Reproducible Runs", test_reproducible_runs),
+        ("Streaming Pair Detector", test_streaming_pairs),
+        ("Sorting Algorithms", test_sorting_algorithms),
+        ("Search Planner", test_search_planner),
+        ("Bloom Filter Prefilter", test_bloom_prefilter),
+        ("Access Patterns", test_access_patterns),
+        ("Report Menu", test_report_menu),
         ("Output File Verification", test_file_outputs)
     ]
     
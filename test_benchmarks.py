@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark test tier for Activity_06
+Checks that each algorithm scales the way its Big-O class predicts and that
+its throughput stays above a floor measured against this machine's speed.
+
+These tests are slow, so they are marked 'benchmark' and skipped by default.
+Run them on their own with:
+
+    python -m pytest -m benchmark test_benchmarks.py
+
+Every run appends its measurements to 'benchmark_history.jsonl' so trends
+can be tracked over time.
+"""
+
+import sys
+
+import pytest
+
+# Add src to path
+sys.path.append('src')
+
+from timer import (
+    run_single_trial, fit_scaling_exponent, calibrate_machine_speed,
+    append_benchmark_record
+)
+
+pytestmark = pytest.mark.benchmark
+
+REPEATS = 15  # Keep the fastest of several trials to filter out noise
+HISTORY_FILE = 'benchmark_history.jsonl'
+
+# Algorithm -> (sizes, expected exponent, tolerance, fit against operations?)
+# Array access and binary search sizes stay small enough for the list to sit
+# in the CPU cache; past that, cache misses make their times creep upwards.
+# Linear search looks for data[-1], whose first copy can appear early because
+# values repeat, so its time is fitted against the comparisons each trial
+# really made instead of against the list size.
+SCALING_CASES = {
+    "Array Access": ([250, 500, 1000, 2000], 0.0, 0.5, False),
+    "Binary Search": ([500, 1000, 2000, 4000], 0.0, 0.5, False),
+    "Linear Search": ([250, 500, 1000, 2000], 1.0, 0.35, True),
+    "Find All Pairs": ([50, 100, 200], 2.0, 0.5, False),
+}
+
+# Trials that stop after only a handful of comparisons are mostly clock noise
+MIN_FIT_OPERATIONS = 100
+
+# Algorithm -> minimum operations/sec as a fraction of the reference loop speed
+THROUGHPUT_FLOORS = {
+    "Linear Search": (2000, 0.05),
+    "Find All Pairs": (200, 0.05),
+}
+
+
+def measure(algorithm_name, size):
+    """Return the fastest time out of several trials."""
+    return min(run_single_trial(algorithm_name, size)[0] for _ in range(REPEATS))
+
+
+def measure_all(algorithm_name, size):
+    """Return every (time, operations) trial out of several."""
+    return [run_single_trial(algorithm_name, size) for _ in range(REPEATS)]
+
+
+@pytest.fixture(scope="module")
+def reference_speed():
+    """Comparisons per second of the calibrated reference loop."""
+    return calibrate_machine_speed()
+
+
+@pytest.mark.parametrize("algorithm_name", sorted(SCALING_CASES))
+def test_scaling_exponent(algorithm_name, reference_speed):
+    """The fitted growth exponent should match the expected complexity."""
+    sizes, expected, tolerance, fit_on_operations = SCALING_CASES[algorithm_name]
+
+    record = {'test': 'scaling', 'algorithm': algorithm_name, 'sizes': sizes}
+    if fit_on_operations:
+        trials_by_size = [measure_all(algorithm_name, size) for size in sizes]
+        trials = [(t, ops) for size_trials in trials_by_size for t, ops in size_trials
+                  if ops >= MIN_FIT_OPERATIONS]
+        exponent = fit_scaling_exponent([ops for _, ops in trials], [t for t, _ in trials])
+        # 'times' stays one value per size; the points actually fitted go alongside
+        record['times'] = [min(t for t, _ in size_trials) for size_trials in trials_by_size]
+        record['fit_points'] = [[ops, t] for t, ops in trials]
+    else:
+        record['times'] = [measure(algorithm_name, size) for size in sizes]
+        exponent = fit_scaling_exponent(sizes, record['times'])
+
+    print(f"{algorithm_name}: exponent {exponent:.2f} (expected {expected} ± {tolerance})")
+    record['exponent'] = exponent
+    record['reference_speed'] = reference_speed
+    append_benchmark_record(record, HISTORY_FILE)
+
+    assert abs(exponent - expected) <= tolerance, (
+        f"{algorithm_name} grew like n^{exponent:.2f}, expected about n^{expected}"
+    )
+
+
+@pytest.mark.parametrize("algorithm_name", sorted(THROUGHPUT_FLOORS))
+def test_throughput_floor(algorithm_name, reference_speed):
+    """Operations per second should stay above a fraction of the reference loop."""
+    size, floor_fraction = THROUGHPUT_FLOORS[algorithm_name]
+
+    trials = [(t, ops) for t, ops in measure_all(algorithm_name, size)
+              if ops >= MIN_FIT_OPERATIONS]
+    throughput = max(ops / t for t, ops in trials)
+    relative = throughput / reference_speed
+
+    print(f"{algorithm_name}: {throughput:,.0f} ops/sec ({relative:.2f}× reference)")
+    append_benchmark_record({
+        'test': 'throughput',
+        'algorithm': algorithm_name,
+        'size': size,
+        'ops_per_sec': throughput,
+        'relative_to_reference': relative,
+        'reference_speed': reference_speed
+    }, HISTORY_FILE)
+
+    assert relative >= floor_fraction, (
+        f"{algorithm_name} ran at {relative:.2f}× the reference speed, "
+        f"below the floor of {floor_fraction}×"
+    )